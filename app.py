@@ -4,57 +4,24 @@ ArborMind AI - 공원 탄소흡수 분석 시스템
 """
 
 import streamlit as st
-import os
 from datetime import datetime
 import json
-import numpy as np
-from PIL import Image
-import cv2
 from pathlib import Path
 import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import platform
 
-# 한글 폰트 설정 (Ubuntu/Linux 지원)
-def setup_korean_font():
-    """한글 폰트 설정"""
-    if platform.system() == 'Linux':
-        # Linux (Ubuntu)
-        nanum_paths = [
-            '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-            '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
-        ]
-        
-        for font_path in nanum_paths:
-            if os.path.exists(font_path):
-                try:
-                    fm.fontManager.addfont(font_path)
-                    matplotlib.rcParams['font.family'] = 'NanumGothic'
-                    matplotlib.rcParams['axes.unicode_minus'] = False
-                    return True
-                except:
-                    continue
-    else:
-        # Windows/Mac
-        try:
-            matplotlib.rcParams['font.family'] = 'Malgun Gothic'
-            matplotlib.rcParams['axes.unicode_minus'] = False
-            return True
-        except:
-            pass
-    
-    return False
+# 유틸리티 임포트
+from utils.chart_generator import setup_korean_font
 
-# 앱 시작 시 한글 폰트 설정
+# 앱 시작 시 한글 폰트 등록 (프로세스당 한 번, 이후 ChartGenerator 는 결과만 재사용)
 setup_korean_font()
 
-# 유틸리티 임포트
 from utils.image_processor import ImageProcessor
 from utils.area_calculator import AreaCalculator
 from utils.carbon_calculator import CarbonCalculator
 from utils.report_generator import ReportGenerator
+from utils.analysis_cache import AnalysisCache
+from utils.image_io import encode_jpeg
+from utils.raster_source import RASTER_SUFFIXES, open_raster, raster_supported
 
 # 페이지 설정
 st.set_page_config(
@@ -71,6 +38,18 @@ if 'current_result' not in st.session_state:
     st.session_state.current_result = None
 
 
+@st.cache_resource
+def get_analysis_cache():
+    """프로세스 공용 분석 결과 캐시"""
+    return AnalysisCache()
+
+
+@st.cache_resource
+def get_image_processor():
+    """프로세스 공용 ImageProcessor (요청마다 새로 만들지 않음)"""
+    return ImageProcessor()
+
+
 def main():
     """메인 애플리케이션"""
     
@@ -115,13 +94,20 @@ def page_new_analysis():
     
     # 1. 이미지 업로드
     st.subheader("1. 항공 사진 업로드")
+    # GeoTIFF 는 rasterio 가 설치된 경우에만 받음 (분석 도중 ImportError 방지)
+    upload_types = ['jpg', 'jpeg', 'png']
+    if raster_supported():
+        upload_types += [suffix.lstrip('.') for suffix in RASTER_SUFFIXES]
     uploaded_file = st.file_uploader(
-        "공원 이미지를 업로드하세요 (JPG, PNG)",
-        type=['jpg', 'jpeg', 'png'],
+        "공원 이미지를 업로드하세요 (JPG, PNG" + (", GeoTIFF)" if raster_supported() else ")"),
+        type=upload_types,
         help="드론 촬영 또는 항공 사진을 업로드하세요"
     )
+    if not raster_supported():
+        st.caption("ℹ️ GeoTIFF 정사영상을 분석하려면 rasterio 를 설치하세요: pip install rasterio")
     
-    if uploaded_file:
+    is_raster = uploaded_file is not None and Path(uploaded_file.name).suffix.lower() in RASTER_SUFFIXES
+    if uploaded_file and not is_raster:
         col1, col2 = st.columns([1, 1])
         with col1:
             st.image(uploaded_file, caption="업로드된 이미지", use_column_width=True)
@@ -141,7 +127,7 @@ def page_new_analysis():
             min_value=0.0,
             value=0.0,
             step=100.0,
-            help="공원 전체 면적을 입력하세요 (선택사항)"
+            help="공원 전체 면적을 입력하세요 (선택사항, GeoTIFF 는 0 이면 지리 참조에서 계산)"
         )
     
     with col2:
@@ -155,6 +141,11 @@ def page_new_analysis():
             placeholder="분석 관련 메모 (선택)",
             height=100
         )
+        areas_only = st.checkbox(
+            "면적/탄소만 계산",
+            value=False,
+            help="오버레이 이미지를 만들지 않고 면적 비율과 탄소흡수량만 빠르게 계산합니다"
+        )
     
     # 3. 분석 실행
     st.markdown("---")
@@ -170,15 +161,15 @@ def page_new_analysis():
         analyze_btn = st.button("🚀 분석 실행", disabled=not can_analyze, type="primary")
     
     if analyze_btn:
-        analyze_park(uploaded_file, park_name, location, total_area, note)
+        analyze_park(uploaded_file, park_name, location, total_area, note, areas_only)
     
     # 현재 분석 결과가 있으면 항상 표시
     if st.session_state.current_result:
         display_results(st.session_state.current_result)
 
 
-def analyze_park(uploaded_file, park_name, location, total_area, note):
-    """공원 분석 실행"""
+def analyze_park(uploaded_file, park_name, location, total_area, note, areas_only=False):
+    """공원 분석 실행 (areas_only 면 오버레이 없이 면적/탄소만 계산)"""
     
     with st.spinner("🔄 분석 중... 잠시만 기다려주세요."):
         try:
@@ -189,46 +180,119 @@ def analyze_park(uploaded_file, park_name, location, total_area, note):
             uploads_dir = Path("uploads")
             uploads_dir.mkdir(exist_ok=True)
             
-            image_path = uploads_dir / f"{analysis_id}.jpg"
+            # GeoTIFF 는 원본 그대로 저장해 창 단위로 읽음 (전체를 디코딩하지 않음)
+            suffix = Path(uploaded_file.name).suffix.lower()
+            is_raster = suffix in RASTER_SUFFIXES
+            image_data = uploaded_file.getvalue()
+            image_path = uploads_dir / f"{analysis_id}{suffix if is_raster else '.jpg'}"
             with open(image_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # 2. 이미지 로드 및 전처리
-            pil_image = Image.open(uploaded_file)
-            image_array = np.array(pil_image.convert('RGB'))
-            
-            processor = ImageProcessor()
-            preprocessed = processor.preprocess(image_array)
+                f.write(image_data)
             
-            # 3. 세그멘테이션 실행
-            st.write("🔍 이미지 분석 중...")
-            masks = processor.segment_vegetation(preprocessed)
+            processor = get_image_processor()
+            area_calc = AreaCalculator()
+            cache = get_analysis_cache()
             
-            # 4. 오버레이 이미지 생성
-            st.write("🎨 오버레이 이미지 생성 중...")
-            overlay = processor.create_overlay(preprocessed, masks)
-            overlay_with_legend = processor.add_legend(overlay, masks)
+            # 같은 이미지 + 같은 처리 설정/방식이면 캐시된 세그멘테이션 사용
+            # (면적 전용 GeoTIFF 는 원본 해상도로 세므로 1024² 결과와 키를 나눔)
+            if not areas_only:
+                mode = 'full'
+            else:
+                mode = 'areas:tiled' if is_raster else 'areas'
+            seg_key = cache.segmentation_key(image_data, processor, mode)
             
-            # 원본 이미지 저장 (세그멘테이션용)
-            overlays_dir = Path("results/overlays")
-            overlays_dir.mkdir(parents=True, exist_ok=True)
-            original_path = overlays_dir / f"{analysis_id}_original.jpg"
-            cv2.imwrite(str(original_path), cv2.cvtColor(preprocessed, cv2.COLOR_RGB2BGR))
+            # 총 면적 (입력값, 없으면 GeoTIFF 지리 참조에서 계산)
+            area_value = total_area if total_area > 0 else None
+            if area_value is None and is_raster:
+                with open_raster(image_path) as raster:
+                    area_value = raster.area_m2
+                if area_value:
+                    st.write(f"📍 지리 참조에서 계산한 면적: {area_value:,.0f} ㎡")
             
-            # 오버레이 이미지 저장
-            overlay_path = overlays_dir / f"{analysis_id}_overlay.jpg"
-            cv2.imwrite(str(overlay_path), cv2.cvtColor(overlay_with_legend, cv2.COLOR_RGB2BGR))
+            # 면적/탄소 캐시를 먼저 확인 (면적 전용은 적중하면 세그멘테이션을 건너뜀)
+            carbon_calc = CarbonCalculator()
+            carbon_key = cache.carbon_key(seg_key, carbon_calc.coefficients_path, area_value)
+            cached_carbon = cache.get_carbon(carbon_key)
             
-            # 5. 면적 계산
-            st.write("📐 면적 계산 중...")
-            area_calc = AreaCalculator()
-            ratios = area_calc.calculate_pixel_ratios(masks)
-            areas = area_calc.calculate_areas(ratios, total_area if total_area > 0 else None)
+            image_paths = {}
+            ratios = None
+            if areas_only:
+                if cached_carbon is None:
+                    ratios = cache.get_ratios(seg_key)
+                if cached_carbon is not None or ratios is not None:
+                    st.write("⚡ 이전 분석 결과를 재사용합니다.")
+                elif is_raster:
+                    # 2~3. 면적 전용: 마스크/오버레이 없이 타입별 픽셀 수만 계산
+                    st.write("🔍 이미지 분석 중 (면적 전용, 원본 해상도)...")
+                    with open_raster(image_path) as raster:
+                        # 원본 해상도 분석은 수 초 이상 걸리므로 원본 해상도 표본 타일 추정치를 먼저 표시
+                        # (축소 영상은 색 평균으로 잔무늬가 사라져 비율이 크게 달라질 수 있음)
+                        estimate = processor.estimate_ratios(raster, target_half_width=0.02)
+                        preview = estimate.ratios
+                        top_types = sorted(preview, key=preview.get, reverse=True)[:3]
+                        st.write("👀 미리보기 추정 (표본 타일): " + ", ".join(
+                            f"{processor.registry.labels[t]} {preview[t] * 100:.0f}%" for t in top_types
+                        ) + f" (±{estimate.max_half_width * 100:.0f}%p)")
+                        # 타일 단위 개수 (상주 메모리는 타일 크기로 제한)
+                        ratios = processor.segment_tiled(raster).ratios()
+                    cache.set_ratios(seg_key, ratios)
+                else:
+                    st.write("🔍 이미지 분석 중 (면적 전용)...")
+                    ratios = processor.segment_ratios(processor.load_bytes(image_data))
+                    cache.set_ratios(seg_key, ratios)
+            else:
+                cached = cache.get_segmentation(seg_key, processor.registry)
+                if cached is None:
+                    # 2. 이미지 로드 및 전처리 (1회 디코딩, 큰 JPEG 는 축소 디코딩)
+                    if is_raster:
+                        preprocessed = processor.load_raster(image_path)
+                    else:
+                        preprocessed = processor.load_bytes(image_data)
+                    
+                    # 3. 세그멘테이션 실행
+                    st.write("🔍 이미지 분석 중...")
+                    label_map = processor.segment_vegetation(preprocessed)
+                    
+                    # 4. 오버레이 이미지 생성
+                    st.write("🎨 오버레이 이미지 생성 중...")
+                    overlay = processor.create_overlay(preprocessed, label_map)
+                    overlay_with_legend = processor.add_legend(overlay, label_map)
+                    
+                    original_jpg = encode_jpeg(preprocessed)
+                    overlay_jpg = encode_jpeg(overlay_with_legend)
+                    ratios = area_calc.calculate_pixel_ratios(label_map)
+                    
+                    cache.set_segmentation(seg_key, label_map, ratios, original_jpg, overlay_jpg)
+                else:
+                    st.write("⚡ 이전 분석 결과를 재사용합니다.")
+                    ratios = cached['ratios']
+                    original_jpg = cached['original_jpg']
+                    overlay_jpg = cached['overlay_jpg']
+                
+                # 원본 이미지 저장 (세그멘테이션용)
+                overlays_dir = Path("results/overlays")
+                overlays_dir.mkdir(parents=True, exist_ok=True)
+                original_path = overlays_dir / f"{analysis_id}_original.jpg"
+                original_path.write_bytes(original_jpg)
+                
+                # 오버레이 이미지 저장
+                overlay_path = overlays_dir / f"{analysis_id}_overlay.jpg"
+                overlay_path.write_bytes(overlay_jpg)
+                
+                image_paths = {
+                    "original_path": str(original_path),
+                    "overlay_path": str(overlay_path),
+                }
             
-            # 6. 탄소 계산
-            st.write("🌍 탄소흡수량 계산 중...")
-            carbon_calc = CarbonCalculator()
-            carbon = carbon_calc.calculate_carbon(areas)
+            # 5. 면적 계산 + 6. 탄소 계산 (계수 파일/총 면적이 같으면 캐시 사용)
+            if cached_carbon is None:
+                st.write("📐 면적 계산 중...")
+                areas = area_calc.calculate_areas(ratios, area_value)
+                
+                st.write("🌍 탄소흡수량 계산 중...")
+                carbon = carbon_calc.calculate_carbon(areas)
+                cache.set_carbon(carbon_key, areas, carbon)
+            else:
+                areas, carbon = cached_carbon
             
             # 7. 결과 데이터 구성
             result = {
@@ -237,12 +301,11 @@ def analyze_park(uploaded_file, park_name, location, total_area, note):
                 "park_info": {
                     "name": park_name,
                     "location": location,
-                    "total_area_m2": total_area if total_area > 0 else None,
+                    "total_area_m2": area_value,
                     "note": note
                 },
                 "image_path": str(image_path),
-                "original_path": str(original_path),
-                "overlay_path": str(overlay_path),
+                **image_paths,
                 "segmentation": areas,
                 "carbon": carbon
             }
@@ -0,0 +1,63 @@
+"""
+면적 전용 경로 벤치마크: 전체 분석(라벨 맵 + 오버레이 + 범례 + JPEG) vs count_classes
+
+실행: python -m benchmarks.bench_areas [--size 1024x1024] [--repeat 10]
+
+면적 전용 결과가 전체 분석의 타입별 비율과 같은지 확인한 뒤
+처리 시간과 최대 numpy 할당량(tracemalloc)을 비교한다.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.bench_segmentation import synthetic_image
+from utils.area_calculator import AreaCalculator
+from utils.image_io import encode_jpeg
+from utils.image_processor import ImageProcessor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='1024x1024', help='합성 이미지 크기 (WxH)')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    image = synthetic_image(width, height)
+    processor = ImageProcessor()
+
+    def full_analysis():
+        label_map = processor.segment_vegetation(image)
+        overlay = processor.add_legend(processor.create_overlay(image, label_map), label_map)
+        encode_jpeg(image)
+        encode_jpeg(overlay)
+        return AreaCalculator.calculate_pixel_ratios(label_map)
+
+    def areas_only():
+        return processor.segment_ratios(image)
+
+    if full_analysis() != areas_only():
+        raise SystemExit("❌ 면적 전용 결과가 전체 분석 결과와 다릅니다")
+
+    print(f"이미지: {width}x{height} ({image.nbytes / 2**20:.1f} MiB)")
+    baseline = None
+    for name, func in (('전체 분석', full_analysis), ('면적 전용', areas_only)):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        best = min(times)
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        baseline = baseline or best
+        print(f"{name:<8} {best * 1000:8.1f} ms  {baseline / best:5.2f}x   최대 할당 {peak / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
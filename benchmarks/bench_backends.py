@@ -0,0 +1,110 @@
+"""
+세그멘테이션 백엔드 처리량 벤치마크 (CPU)
+
+실행: python -m benchmarks.bench_backends [--model model.onnx --classes FOREST,TREE,...]
+                                          [--full 4000x3000] [--threads 1,4]
+
+--model 을 주지 않으면 onnx 패키지로 작은 합성 CNN (3x3 conv 16ch x2 + 1x1 conv)을
+임시로 만들어 파이프라인(타일 분할/정규화/배치 추론/병합) 처리량을 잰다.
+1024x1024 와 원본 해상도(--full)에서 백엔드별 MP/s 를 출력한다.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_segmentation import synthetic_image
+from models import ONNXBackend, get_backend, quantize_int8
+from utils.color_classifier import CLASS_ORDER
+from utils.label_map import DEFAULT_REGISTRY
+
+
+def synthetic_model(path: str, n_classes: int, width: int = 16, seed: int = 0):
+    """무작위 가중치 합성 세그멘테이션 모델 (입력 N x 3 x H x W, 출력 N x C x H x W)"""
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(seed)
+    shapes = [(width, 3, 3, 3), (width, width, 3, 3), (n_classes, width, 1, 1)]
+    weights = [numpy_helper.from_array(rng.normal(0, 0.3, s).astype(np.float32), f"w{i}")
+               for i, s in enumerate(shapes)]
+    nodes = [
+        helper.make_node('Conv', ['input', 'w0'], ['c0'], pads=[1, 1, 1, 1]),
+        helper.make_node('Relu', ['c0'], ['r0']),
+        helper.make_node('Conv', ['r0', 'w1'], ['c1'], pads=[1, 1, 1, 1]),
+        helper.make_node('Relu', ['c1'], ['r1']),
+        helper.make_node('Conv', ['r1', 'w2'], ['logits']),
+    ]
+    graph = helper.make_graph(
+        nodes, 'synthetic_segmentation',
+        [helper.make_tensor_value_info('input', TensorProto.FLOAT, ['N', 3, 'H', 'W'])],
+        [helper.make_tensor_value_info('logits', TensorProto.FLOAT, ['N', n_classes, 'H', 'W'])],
+        weights
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 17)])
+    model.ir_version = 8
+    onnx.save(model, path)
+
+
+def throughput(backend, image: np.ndarray, repeat: int) -> float:
+    """최고 처리량 (MP/s)"""
+    backend.predict_labels(image[:256, :256], DEFAULT_REGISTRY)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        backend.predict_labels(image, DEFAULT_REGISTRY)
+        best = min(best, time.perf_counter() - start)
+    return image.shape[0] * image.shape[1] / 1e6 / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', help='ONNX 모델 경로 (없으면 합성 모델)')
+    parser.add_argument('--classes', default=','.join(CLASS_ORDER), help='모델 출력 채널 순서의 타입 이름')
+    parser.add_argument('--full', default='4000x3000', help='원본 해상도 (WxH)')
+    parser.add_argument('--tile', type=int, default=512)
+    parser.add_argument('--batch', type=int, default=4)
+    parser.add_argument('--threads', default='1', help='intra-op 스레드 수 목록')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    class_names = [name or None for name in args.classes.split(',')]
+    width, height = (int(v) for v in args.full.lower().split('x'))
+    images = {
+        '1024x1024': synthetic_image(1024, 1024),
+        f'{width}x{height}': synthetic_image(width, height),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = args.model
+        if model_path is None:
+            model_path = os.path.join(tmp, 'synthetic.onnx')
+            synthetic_model(model_path, len(class_names))
+
+        # int8: 합성 이미지 타일로 보정한 정적 양자화 모델을 미리 만들어 둠
+        calibration = [synthetic_image(args.tile, args.tile, seed) for seed in range(8)]
+        quantize_int8(model_path, os.path.join(tmp, 'model.int8.onnx'), calibration, args.tile)
+        os.symlink(os.path.abspath(model_path), os.path.join(tmp, 'model.onnx'))
+
+        backends = [('hsv', get_backend('hsv'))]
+        for threads in (int(t) for t in args.threads.split(',')):
+            for int8 in (False, True):
+                backend = ONNXBackend(
+                    os.path.join(tmp, 'model.onnx'), class_names, tile_size=args.tile,
+                    batch_size=args.batch, intra_op_threads=threads, int8=int8
+                )
+                backends.append((f"onnx {'int8' if int8 else 'fp32'} x{threads}", backend))
+
+        print(f"CPU {os.cpu_count()}개, 타일 {args.tile}px, 배치 {args.batch}"
+              + ("" if args.model else " (합성 모델)"))
+        print(f"{'백엔드':<18}" + "".join(f"{name:>16}" for name in images))
+        for name, backend in backends:
+            row = "".join(f"{throughput(backend, image, args.repeat):11.2f} MP/s" for image in images.values())
+            print(f"{name:<18}{row}")
+
+
+if __name__ == "__main__":
+    main()
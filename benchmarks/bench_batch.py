@@ -0,0 +1,69 @@
+"""
+배치 분석 벤치마크: 이미지별 처리 vs analyze_batch (라벨 맵 유지 / 면적 전용)
+
+실행: python -m benchmarks.bench_batch [--count 64]
+
+크기가 섞인 합성 이미지 목록을 이미지마다 전처리 → segment_vegetation → 비율 계산한
+결과와 analyze_batch 결과가 같은지 확인한 뒤 처리 시간을 비교한다.
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_segmentation import synthetic_image
+from utils.area_calculator import AreaCalculator
+from utils.image_processor import ImageProcessor
+
+
+SIZES = [(1024, 1024), (1600, 1200), (800, 600), (2048, 1536)]
+
+
+def per_image(images):
+    """기존 analyze_park 방식: 요청마다 ImageProcessor 생성 후 한 장씩 처리"""
+    results = []
+    for image in images:
+        processor = ImageProcessor()
+        label_map = processor.segment_vegetation(processor.preprocess(image))
+        results.append(AreaCalculator.calculate_pixel_ratios(label_map))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=64)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    images = [synthetic_image(*SIZES[i % len(SIZES)], seed=i) for i in range(args.count)]
+    processor = ImageProcessor()
+
+    expected = per_image(images)
+    for keep_labels in (True, False):
+        batched = [r['ratios'] for r in processor.analyze_batch(images, keep_labels=keep_labels)]
+        if batched != expected:
+            raise SystemExit("❌ 배치 결과가 이미지별 처리 결과와 다릅니다")
+
+    def best(func):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    t_single = best(lambda: per_image(images))
+    t_labels = best(lambda: processor.analyze_batch(images, keep_labels=True))
+    t_counts = best(lambda: processor.analyze_batch(images))
+
+    print(f"이미지 {args.count}장 (크기 혼합)")
+    for name, elapsed in (
+        ('이미지별 처리', t_single),
+        ('analyze_batch (라벨 맵)', t_labels),
+        ('analyze_batch (면적 전용)', t_counts),
+    ):
+        print(f"{name:<24} {elapsed * 1000:9.1f} ms  ({elapsed / args.count * 1000:6.1f} ms/장)  "
+              f"{t_single / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+업로드 입력 경로 벤치마크: 기존 PIL 전체 디코딩 vs 1회 축소 디코딩
+
+실행: python -m benchmarks.bench_ingest [--size 7300x5500] [--repeat 3]
+
+경로별로 새 프로세스를 띄워 처리 시간과 최대 RSS 증가량을 측정한다.
+"""
+
+import argparse
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from benchmarks.bench_segmentation import synthetic_image
+
+
+def legacy_ingest(data: bytes) -> np.ndarray:
+    """기존 analyze_park 경로: PIL 전체 디코딩 → RGB 변환 → 배열 복사 → 리사이즈"""
+    pil_image = Image.open(io.BytesIO(data))
+    image_array = np.array(pil_image.convert('RGB'))
+    return cv2.resize(image_array, (1024, 1024), interpolation=cv2.INTER_LINEAR)
+
+
+def new_ingest(data: bytes) -> np.ndarray:
+    """ImageProcessor.load_bytes 경로"""
+    from utils.image_io import decode_image
+    return decode_image(data, (1024, 1024))
+
+
+def peak_rss_kib() -> int:
+    """프로세스 최대 RSS (KiB). Linux 는 exec 이후 값인 VmHWM 을 사용"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_child(path: str, mode: str, repeat: int):
+    """자식 프로세스: 한 경로만 실행하고 결과를 JSON 으로 출력"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    func = legacy_ingest if mode == 'legacy' else new_ingest
+
+    # 모듈 임포트 비용 제외
+    import utils.image_io  # noqa: F401
+    base_rss = peak_rss_kib()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        image = func(data)
+        times.append(time.perf_counter() - start)
+
+    peak_rss = peak_rss_kib()
+    print(json.dumps({
+        'ms': min(times) * 1000,
+        'rss_mib': (peak_rss - base_rss) / 1024,
+        'shape': list(image.shape)
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='7300x5500', help='합성 JPEG 크기 (WxH)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child', nargs=2, metavar=('PATH', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], args.child[1], args.repeat)
+        return
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    with tempfile.NamedTemporaryFile(suffix='.jpg') as tmp:
+        Image.fromarray(synthetic_image(width, height)).save(tmp.name, quality=90)
+        print(f"JPEG: {width}x{height} ({width * height / 1e6:.1f} MP)")
+
+        for mode, name in (('legacy', '기존 (PIL 전체 디코딩)'), ('new', '1회 축소 디코딩')):
+            out = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_ingest',
+                 '--child', tmp.name, mode, '--repeat', str(args.repeat)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(out)
+            print(f"{name:<20} {result['ms']:8.1f} ms   최대 RSS +{result['rss_mib']:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+병렬 타일 세그멘테이션 확장성 벤치마크
+
+실행: python -m benchmarks.bench_parallel [--size 10000x8000] [--tile 1024]
+                                         [--workers 1,2,4,8,16] [--kind thread,process]
+
+워커 수별 처리 시간과 1워커 대비 속도 향상을 출력하고,
+모든 설정의 타입별 픽셀 수가 순차 처리 결과와 같은지 확인한다.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from benchmarks.bench_segmentation import synthetic_image
+from utils.image_processor import ImageProcessor
+from utils.parallel import ParallelExecutor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='10000x8000', help='합성 이미지 크기 (WxH)')
+    parser.add_argument('--tile', type=int, default=1024)
+    parser.add_argument('--workers', default='1,2,4,8,16')
+    parser.add_argument('--kind', default='thread,process')
+    parser.add_argument('--repeat', type=int, default=2)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    image = synthetic_image(width, height)
+    processor = ImageProcessor()
+    expected = processor.segment_tiled(image, tile_size=args.tile).counts
+
+    print(f"이미지: {width}x{height} ({width * height / 1e6:.1f} MP), 타일 {args.tile}px, CPU {os.cpu_count()}개")
+
+    for kind in args.kind.split(','):
+        baseline = None
+        for workers in (int(w) for w in args.workers.split(',')):
+            with ParallelExecutor(workers, kind) as executor:
+                # 워커 기동 비용 제외
+                processor.segment_tiled(image[:args.tile, :args.tile], executor=executor)
+
+                best = float('inf')
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    result = processor.segment_tiled(image, tile_size=args.tile, executor=executor)
+                    best = min(best, time.perf_counter() - start)
+
+            if not np.array_equal(result.counts, expected):
+                raise SystemExit(f"❌ {kind} x{workers}: 순차 처리 결과와 다릅니다")
+
+            baseline = baseline or best
+            print(f"{kind:>7} x{workers:<3} {best * 1000:9.1f} ms  {baseline / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
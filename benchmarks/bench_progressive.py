@@ -0,0 +1,91 @@
+"""
+점진적 세그멘테이션 벤치마크: 미리보기 지연 / 경계 보정량 / 원본 해상도 대비 오차
+
+실행: python -m benchmarks.bench_progressive [--size 4000x3000] [--tile 64]
+
+넓은 균일 영역(잔디/숲/물/도로 구획)으로 된 합성 공원 이미지와 테스트 이미지 타일링 이미지에서
+미리보기 시간, 보정한 타일 비율, 경계 보정 후 비율 오차, 전체 원본 해상도 처리 시간을 비교한다.
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.bench_segmentation import synthetic_image
+from utils.area_calculator import AreaCalculator
+from utils.image_processor import ImageProcessor
+
+
+# 구획 색 (RGB) - 각 타입 HSV 범위 안쪽
+PARK_COLORS = [
+    (90, 160, 70),    # GRASS/TREE 계열 녹색
+    (30, 80, 30),     # 진한 숲
+    (30, 70, 150),    # 물
+    (50, 50, 50),     # 도로
+    (170, 140, 100),  # 토양
+]
+
+
+def synthetic_park(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """큰 다각형 구획 + 약한 잡음으로 만든 공원 이미지"""
+    rng = np.random.default_rng(seed)
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = PARK_COLORS[0]
+    for _ in range(12):
+        center = rng.integers(0, (width, height))
+        axes = rng.integers(min(width, height) // 12, min(width, height) // 4, size=2)
+        color = PARK_COLORS[rng.integers(1, len(PARK_COLORS))]
+        cv2.ellipse(image, tuple(int(v) for v in center), tuple(int(v) for v in axes),
+                    float(rng.integers(0, 180)), 0, 360, color, -1)
+    cv2.line(image, (0, height // 2), (width, height // 3), PARK_COLORS[3], max(4, width // 200))
+    noise = rng.integers(-4, 5, image.shape, dtype=np.int16)
+    return np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def max_error(ratios, expected) -> float:
+    return max(abs(ratios[k] - expected[k]) for k in expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='4000x3000', help='이미지 크기 (WxH)')
+    parser.add_argument('--tile', type=int, default=128)
+    parser.add_argument('--preview', type=int, default=256)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    processor = ImageProcessor()
+
+    for name, image in (('합성 공원', synthetic_park(width, height)), ('테스트 이미지', synthetic_image(width, height))):
+        start = time.perf_counter()
+        full = processor.segment_vegetation(image)
+        t_full = time.perf_counter() - start
+        expected = AreaCalculator.calculate_pixel_ratios(full)
+
+        start = time.perf_counter()
+        progressive = processor.segment_progressive(image, args.preview, args.tile)
+        t_preview = time.perf_counter() - start
+        preview_error = max_error(progressive.preview_ratios(), expected)
+        boundary = progressive.pending_boundary_tiles
+
+        start = time.perf_counter()
+        progressive.refine_all()
+        t_refine = time.perf_counter() - start
+        refined_error = max_error(progressive.ratios(), expected)
+
+        progressive.refine_all(include_uniform=True)
+        if not np.array_equal(progressive.labels, full.labels):
+            raise SystemExit(f"❌ {name}: 전체 보정 결과가 원본 해상도 결과와 다릅니다")
+
+        print(f"[{name}] {width}x{height}, 미리보기 배율 1/{progressive.factor}, 타일 {args.tile}px")
+        print(f"  원본 해상도 전체    {t_full * 1000:8.1f} ms")
+        print(f"  미리보기            {t_preview * 1000:8.1f} ms   비율 최대 오차 {preview_error:.4f}")
+        print(f"  경계 타일 보정      {t_refine * 1000:8.1f} ms   "
+              f"타일 {boundary}/{progressive.total_tiles} ({boundary / progressive.total_tiles:.1%}), "
+              f"비율 최대 오차 {refined_error:.4f}")
+
+
+if __name__ == "__main__":
+    main()
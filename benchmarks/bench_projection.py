@@ -0,0 +1,93 @@
+"""
+다년 전망 벤치마크: 공원 수 x 시나리오 수 x 연도 수 전망 시간 (첫 계산 / 캐시)
+
+실행: python -m benchmarks.bench_projection [--parks 10000] [--scenarios 50] [--years 30]
+
+무작위 공원 면적과 계수 성장률/전환율이 다른 시나리오들을 만들어
+ProjectionEngine.project_many 를 두 번 부르고, 공원 하나를 연도별 반복문으로 계산한 값과 비교한다.
+"""
+
+import argparse
+import resource
+import time
+
+import numpy as np
+
+from utils.area_calculator import AreaCalculator
+from utils.carbon_calculator import CarbonCalculator
+from utils.label_map import DEFAULT_REGISTRY
+from utils.projection import ProjectionEngine, Scenario
+
+
+def scenarios(count: int, years: int):
+    """성장률/전환율을 조금씩 바꾼 시나리오 목록"""
+    return [
+        Scenario(
+            f"S{i:02d}", years,
+            coef_growth={'FOREST': 0.002 * i, 'TREE': np.linspace(0.0, 0.02, years)},
+            conversion={'GRASS': {'BUILDING': 0.001 * i, 'TREE': 0.005}, 'SOIL': {'GRASS': 0.01}},
+        )
+        for i in range(count)
+    ]
+
+
+def reference_total(areas: np.ndarray, coef: np.ndarray, scenario: Scenario) -> np.ndarray:
+    """공원 하나의 연도별 총 흡수량 (연도 반복문)"""
+    names = list(DEFAULT_REGISTRY.names)
+    growth = scenario.growth_curve(names)
+    areas = areas.copy()
+    totals = []
+    for year in range(scenario.years):
+        totals.append((areas * coef * growth[year]).sum() / 1000)
+        moved = np.zeros_like(areas)
+        for source, targets in scenario.conversion.items():
+            for target, rate in targets.items():
+                amount = areas[names.index(source)] * rate[year]
+                moved[names.index(source)] -= amount
+                moved[names.index(target)] += amount
+        areas += moved
+    return np.array(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--parks', type=int, default=10000)
+    parser.add_argument('--scenarios', type=int, default=50)
+    parser.add_argument('--years', type=int, default=30)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    counts = rng.integers(0, 10**6, (args.parks, DEFAULT_REGISTRY.n_ids))
+    areas = AreaCalculator.area_array(
+        AreaCalculator.ratio_array(counts), rng.uniform(1e3, 1e5, args.parks)
+    )
+    calculator = CarbonCalculator()
+    engine = ProjectionEngine(calculator)
+    scenario_list = scenarios(args.scenarios, args.years)
+
+    start = time.perf_counter()
+    results = engine.project_many(areas, scenario_list)
+    t_cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.project_many(areas, scenario_list)
+    t_warm = time.perf_counter() - start
+
+    coef = np.nan_to_num(calculator.table.for_registry(DEFAULT_REGISTRY)[1:])
+    last = scenario_list[-1]
+    expected = reference_total(np.nan_to_num(areas['area_m2'][0]), coef, last)
+    if not np.allclose(expected, results[last.name].total_tco2_yr[0]):
+        raise SystemExit("❌ 전망 결과가 연도 반복문 계산과 다릅니다")
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"공원 {args.parks}곳 x 시나리오 {args.scenarios}개 x {args.years}년")
+    print(f"  첫 계산  {t_cold:7.3f} s   ({t_cold / args.scenarios * 1000:.1f} ms/시나리오)")
+    print(f"  캐시     {t_warm:7.3f} s")
+    print(f"  {engine!r}, 최대 RSS {peak:.0f} MiB")
+    for scenario in (scenario_list[0], last):
+        portfolio = results[scenario.name].portfolio_tco2_yr
+        print(f"  {scenario.name}: 0년차 {portfolio[0]:,.0f} → {args.years - 1}년차 {portfolio[-1]:,.0f} tCO2/yr")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+세그멘테이션 벤치마크: 룩업 테이블 분류기 vs 기존 inRange/bitwise 구현
+
+실행: python -m benchmarks.bench_segmentation [--size 5000x4000] [--repeat 5]
+
+기존 구현(legacy_segment_vegetation)과 타입별 마스크(segment_masks)가 비트 단위로
+같은지(1x1 같은 아주 작은 입력 포함), 라벨 맵(segment_vegetation)이 기존 마스크를 우선순위로 합친 결과와 같은지
+검증한 뒤 처리 시간을 비교한다. 테스트 이미지에서 라벨 맵 비율(한 픽셀 = 한 타입)이
+기존 겹침 마스크 비율과 얼마나 다른지도 출력한다.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from utils.area_calculator import AreaCalculator
+from utils.image_processor import ImageProcessor
+from utils.label_map import LabelMap
+
+
+def legacy_segment_vegetation(image: np.ndarray) -> dict:
+    """기존 ImageProcessor.segment_vegetation 구현 (비교 기준)"""
+    # RGB 이미지 준비
+    if len(image.shape) == 2:
+        image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+    
+    # HSV 변환
+    hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
+    
+    # LAB 변환 (색상 구분에 더 좋음)
+    lab = cv2.cvtColor(image, cv2.COLOR_RGB2LAB)
+    
+    # 그레이스케일
+    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    
+    # 1. BUILDING (건물): 밝은 회색/흰색/청록색 지붕
+    # 채도가 낮고 밝기가 높은 영역
+    mask_building_1 = cv2.inRange(hsv, np.array([0, 0, 180]), np.array([180, 50, 255]))
+    # 청록색 지붕
+    mask_building_2 = cv2.inRange(hsv, np.array([80, 100, 100]), np.array([100, 255, 255]))
+    mask_building = cv2.bitwise_or(mask_building_1, mask_building_2)
+    
+    # 2. ROAD (도로): 어두운 회색/검은색
+    mask_road = cv2.inRange(hsv, np.array([0, 0, 0]), np.array([180, 50, 100]))
+    
+    # 3. WATER (물): 진한 파란색
+    mask_water = cv2.inRange(hsv, np.array([90, 80, 50]), np.array([130, 255, 200]))
+    
+    # 4. FOREST (숲): 진한 녹색
+    mask_forest = cv2.inRange(hsv, np.array([35, 70, 30]), np.array([85, 255, 150]))
+    
+    # 5. TREE (나무): 중간 녹색
+    mask_tree = cv2.inRange(hsv, np.array([30, 40, 40]), np.array([85, 180, 200]))
+    mask_tree = cv2.bitwise_and(mask_tree, cv2.bitwise_not(mask_forest))
+    
+    # 6. GRASS (초지): 밝은 녹색/연두색
+    mask_grass = cv2.inRange(hsv, np.array([25, 30, 100]), np.array([85, 200, 255]))
+    mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_forest))
+    mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_tree))
+    
+    # 7. WETLAND (습지): 어두운 청록색
+    mask_wetland = cv2.inRange(hsv, np.array([80, 30, 20]), np.array([100, 150, 100]))
+    
+    # 8. SOIL (토양): 갈색/베이지
+    mask_soil = cv2.inRange(hsv, np.array([10, 20, 80]), np.array([30, 150, 200]))
+    
+    # 우선순위 적용 (겹치는 부분 제거)
+    # 건물과 도로가 다른 것들보다 우선
+    mask_tree = cv2.bitwise_and(mask_tree, cv2.bitwise_not(mask_building))
+    mask_tree = cv2.bitwise_and(mask_tree, cv2.bitwise_not(mask_road))
+    
+    mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_building))
+    mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_road))
+    
+    mask_forest = cv2.bitwise_and(mask_forest, cv2.bitwise_not(mask_building))
+    mask_forest = cv2.bitwise_and(mask_forest, cv2.bitwise_not(mask_road))
+    
+    mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_building))
+    mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_road))
+    mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_grass))
+    mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_tree))
+    mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_forest))
+    
+    mask_water = cv2.bitwise_and(mask_water, cv2.bitwise_not(mask_building))
+    
+    # 노이즈 제거 (작은 점들 제거)
+    kernel = np.ones((3, 3), np.uint8)
+    mask_building = cv2.morphologyEx(mask_building, cv2.MORPH_OPEN, kernel)
+    mask_road = cv2.morphologyEx(mask_road, cv2.MORPH_OPEN, kernel)
+    mask_forest = cv2.morphologyEx(mask_forest, cv2.MORPH_OPEN, kernel)
+    mask_tree = cv2.morphologyEx(mask_tree, cv2.MORPH_OPEN, kernel)
+    mask_grass = cv2.morphologyEx(mask_grass, cv2.MORPH_OPEN, kernel)
+    
+    return {
+        'BUILDING': mask_building,
+        'ROAD': mask_road,
+        'WATER': mask_water,
+        'FOREST': mask_forest,
+        'TREE': mask_tree,
+        'GRASS': mask_grass,
+        'WETLAND': mask_wetland,
+        'SOIL': mask_soil
+    }
+
+
+def synthetic_image(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """테스트 이미지 타일링 + 잡음으로 만든 대형 합성 이미지"""
+    rng = np.random.default_rng(seed)
+    sources = sorted(Path("test_data").glob("*.*"))
+    if sources:
+        tile = np.array(Image.open(sources[0]).convert('RGB'))
+        reps = (height // tile.shape[0] + 1, width // tile.shape[1] + 1, 1)
+        image = np.tile(tile, reps)[:height, :width]
+    else:
+        image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    noise = rng.integers(-12, 13, image.shape, dtype=np.int16)
+    return np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def check_identical(processor: ImageProcessor, image: np.ndarray) -> bool:
+    """기존 구현과 마스크/라벨 맵 비트 일치 여부"""
+    expected = legacy_segment_vegetation(image)
+    actual = processor.segment_masks(image)
+    same = list(expected.keys()) == list(actual.keys())
+    for veg_type, mask in expected.items():
+        same = same and np.array_equal(mask, actual[veg_type])
+
+    label_map = processor.segment_vegetation(image)
+    expected_labels = LabelMap.from_masks(expected, processor.registry).labels
+    return same and np.array_equal(label_map.labels, expected_labels)
+
+
+def best_time(func, image: np.ndarray, repeat: int) -> float:
+    """repeat 회 중 최소 실행 시간 (초)"""
+    func(image)  # 워밍업
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(image)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='5000x4000', help='합성 이미지 크기 (WxH)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    processor = ImageProcessor()
+
+    # 1. 정확도 검증: HSV 전 범위 + 테스트 이미지 + 합성 이미지
+    hsv_all = np.stack(np.meshgrid(
+        np.arange(180, dtype=np.uint8),
+        np.arange(256, dtype=np.uint8),
+        np.arange(256, dtype=np.uint8),
+        indexing='ij'
+    ), axis=-1).reshape(180 * 256, 256, 3)
+    samples = [cv2.cvtColor(hsv_all, cv2.COLOR_HSV2RGB)]
+    samples += [np.array(Image.open(p).convert('RGB')) for p in sorted(Path("test_data").glob("*.*"))]
+    samples.append(synthetic_image(1024, 1024))
+    # OpenCV 가 상수로 해석할 수 있는 아주 작은 입력 (원소 4개 이하)
+    rng = np.random.default_rng(0)
+    samples += [rng.integers(0, 256, shape + (3,), dtype=np.uint8) for shape in [(1, 1), (2, 2), (4, 1), (1, 3)]]
+    for sample in samples:
+        if not check_identical(processor, sample):
+            raise SystemExit(f"❌ 마스크 불일치: shape={sample.shape}")
+    print(f"✅ 기존 구현과 비트 일치 ({len(samples)}개 이미지)")
+
+    # 면적 방법 차이: 겹침 마스크 비율 → 라벨 맵 비율 (%p)
+    for path in sorted(Path("test_data").glob("*.*")):
+        sample = processor.preprocess(np.array(Image.open(path).convert('RGB')))
+        old = AreaCalculator.calculate_pixel_ratios(processor.segment_masks(sample))
+        new = AreaCalculator.calculate_pixel_ratios(processor.segment_vegetation(sample))
+        changed = {k: round(float(new[k] - old[k]) * 100, 1) for k in old if abs(new[k] - old[k]) >= 5e-4}
+        print(f"  {path.name}: 합계 {sum(old.values()):.3f} → {sum(new.values()):.3f}, 변화 {changed}")
+
+    # 2. 속도 비교
+    image = synthetic_image(width, height)
+    legacy = best_time(legacy_segment_vegetation, image, args.repeat)
+    masks = best_time(processor.segment_masks, image, args.repeat)
+    labels = best_time(processor.segment_vegetation, image, args.repeat)
+    megapixels = width * height / 1e6
+    print(f"이미지: {width}x{height} ({megapixels:.1f} MP)")
+    print(f"기존 구현:   {legacy * 1000:8.1f} ms")
+    print(f"LUT 마스크:  {masks * 1000:8.1f} ms  ({legacy / masks:.1f}x)")
+    print(f"LUT 라벨 맵: {labels * 1000:8.1f} ms  ({legacy / labels:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
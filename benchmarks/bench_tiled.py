@@ -0,0 +1,61 @@
+"""
+타일 세그멘테이션 벤치마크: 전체 프레임 분류와 비율 일치 + 최대 메모리 비교
+
+실행: python -m benchmarks.bench_tiled [--size 8000x6000] [--tile 1024] [--tolerance 1e-6]
+
+numpy 할당은 tracemalloc 으로 추적되므로 입력 이미지를 제외한
+세그멘테이션 작업 메모리의 최댓값을 비교할 수 있다.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.bench_segmentation import synthetic_image
+from utils.area_calculator import AreaCalculator
+from utils.image_processor import ImageProcessor
+
+
+def measure(func):
+    """(결과, 실행 시간 초, 최대 추가 메모리 바이트)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='8000x6000', help='합성 이미지 크기 (WxH)')
+    parser.add_argument('--tile', type=int, default=1024)
+    parser.add_argument('--tolerance', type=float, default=1e-6, help='타입별 비율 허용 오차')
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    image = synthetic_image(width, height)
+    processor = ImageProcessor()
+
+    full, full_time, full_peak = measure(
+        lambda: AreaCalculator.calculate_pixel_ratios(processor.segment_vegetation(image))
+    )
+    tiled, tiled_time, tiled_peak = measure(
+        lambda: processor.segment_tiled(image, tile_size=args.tile, preview_max_size=1024)
+    )
+
+    diff = max(abs(full[k] - v) for k, v in tiled.ratios().items())
+    print(f"이미지: {width}x{height} ({width * height / 1e6:.1f} MP), 타일 {args.tile}px")
+    print(f"전체 프레임: {full_time * 1000:8.1f} ms, 최대 메모리 {full_peak / 2**20:7.1f} MiB")
+    print(f"타일:        {tiled_time * 1000:8.1f} ms, 최대 메모리 {tiled_peak / 2**20:7.1f} MiB")
+    print(f"축소 라벨 맵: {tiled.preview.shape} (1/{tiled.preview_factor})")
+    print(f"비율 최대 차이: {diff:.2e}")
+
+    if diff > args.tolerance:
+        raise SystemExit(f"❌ 비율 차이가 허용 오차({args.tolerance})를 넘습니다")
+    print("✅ 전체 프레임 결과와 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+탄소흡수량 몬테카를로 불확실성 벤치마크: 공원 수 x 표본 수별 시간과 최대 메모리
+
+실행: python -m benchmarks.bench_uncertainty [--parks 1000] [--samples 100000]
+
+무작위 공원 면적으로 계수만 불확실한 경우와 비율 오차(ratio_sd)까지 넣은 경우를 재고,
+공원 몇 곳의 분위수가 np.percentile 로 직접 계산한 값과 같은지 확인한다.
+"""
+
+import argparse
+import resource
+import time
+
+import numpy as np
+
+from utils.area_calculator import AreaCalculator
+from utils.carbon_calculator import CarbonCalculator
+from utils.label_map import DEFAULT_REGISTRY
+from utils.uncertainty import sample_multipliers
+
+SPEC = {
+    'FOREST': ('lognormal', 0.3),
+    'TREE': ('normal', 0.2),
+    'GRASS': ('uniform', 0.5, 1.5),
+    'WETLAND': ('triangular', 0.6, 1.0, 1.6),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--parks', type=int, default=1000)
+    parser.add_argument('--samples', type=int, default=100000)
+    parser.add_argument('--ratio-sd', type=float, default=0.1, help='비율 오차 경우의 상대 표준편차')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    counts = rng.integers(0, 10**6, (args.parks, DEFAULT_REGISTRY.n_ids))
+    areas = AreaCalculator.area_array(
+        AreaCalculator.ratio_array(counts), rng.uniform(1e3, 1e5, args.parks)
+    )
+    calculator = CarbonCalculator()
+    spec = {name: SPEC.get(name, ('normal', 0.2)) for name in DEFAULT_REGISTRY.names}
+
+    start = time.perf_counter()
+    result = calculator.calculate_carbon_uncertainty(areas, spec, n_samples=args.samples)
+    t_coef = time.perf_counter() - start
+
+    by_type = np.nan_to_num(next(iter(calculator.calculate_carbon_batch(areas).values()))['by_type'])
+    multipliers = sample_multipliers(spec, DEFAULT_REGISTRY.names, args.samples, np.random.default_rng(0))
+    for park in (0, args.parks // 2, args.parks - 1):
+        expected = np.percentile(multipliers @ by_type[park], result['percentiles'])
+        if not np.allclose(expected, result['total_tco2_yr'][park]):
+            raise SystemExit(f"❌ 공원 {park} 분위수가 직접 계산한 값과 다릅니다")
+
+    start = time.perf_counter()
+    calculator.calculate_carbon_uncertainty(areas, spec, n_samples=args.samples, ratio_sd=args.ratio_sd)
+    t_ratio = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"공원 {args.parks}곳 x 표본 {args.samples}개")
+    print(f"  계수 불확실       {t_coef:7.2f} s")
+    print(f"  계수 + 비율 오차  {t_ratio:7.2f} s   (최대 RSS {peak:.0f} MiB)")
+    low, mid, high = result['portfolio_total']
+    print(f"  전체 합계 {mid:,.0f} tCO2/yr (95% 구간 {low:,.0f} ~ {high:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+구역별 통계 벤치마크: 구역마다 잘라서 세기 vs 결합 bincount 한 번
+
+실행: python -m benchmarks.bench_zones [--size 2000x1500] [--zones 16] [--repeat 10]
+
+격자 구역 래스터에 라벨 맵에 없는 빈 구역 하나를 더해,
+ZonalStatistics 결과가 구역별 마스크로 직접 센 픽셀 수와 같은지와
+빈 구역의 비율이 모두 0 인지 확인한 뒤 처리 시간을 비교한다.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.bench_segmentation import synthetic_image
+from utils.image_processor import ImageProcessor
+from utils.label_map import count_ids
+from utils.zones import ZoneMap
+
+
+def grid_zones(height: int, width: int, count: int) -> ZoneMap:
+    """count 개 격자 구역 + 픽셀이 없는 빈 구역 (마지막)"""
+    side = int(np.ceil(np.sqrt(count)))
+    rows = np.minimum(np.arange(height) * side // height, side - 1)
+    cols = np.minimum(np.arange(width) * side // width, side - 1)
+    zone_ids = (rows[:, None] * side + cols[None, :]) % count + 1
+    names = [f"Z{i:02d}" for i in range(count)] + ['EMPTY']
+    return ZoneMap(zone_ids.astype(np.uint8), names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', default='2000x1500', help='합성 원본 이미지 크기 (WxH, 1024x1024 로 전처리)')
+    parser.add_argument('--zones', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    processor = ImageProcessor()
+    label_map = processor.segment_vegetation(processor.preprocess(synthetic_image(width, height)))
+    zones = grid_zones(*label_map.shape, args.zones)
+    n_ids = processor.registry.n_ids
+
+    def per_zone():
+        return np.array([
+            count_ids(np.where(zones.zone_ids == zone_id, label_map.labels, 0).astype(np.uint8), n_ids)
+            * (np.arange(n_ids) > 0) for zone_id in range(1, zones.n_zones)
+        ])
+
+    def combined():
+        return processor.zonal_statistics(label_map, zones)
+
+    stats = combined()
+    if not np.array_equal(stats.counts[1:, 1:], per_zone()[:, 1:]):
+        raise SystemExit("❌ 구역별 픽셀 수가 구역 마스크로 직접 센 값과 다릅니다")
+    empty = stats.ratios()['EMPTY']
+    if any(empty.values()) or stats.ratio_array()[-1].any():
+        raise SystemExit("❌ 빈 구역의 비율이 0 이 아닙니다")
+
+    print(f"라벨 맵 {label_map.shape[1]}x{label_map.shape[0]}, 구역 {args.zones}개 + 빈 구역 1개")
+    baseline = None
+    for name, func in (('구역별 마스크', per_zone), ('결합 bincount', combined)):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        best = min(times)
+        baseline = baseline or best
+        print(f"{name:<12} {best * 1000:8.1f} ms  {baseline / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
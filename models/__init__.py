@@ -1,4 +1,17 @@
-"""ArborMind AI 모델 모듈"""
+"""ArborMind AI 모델 모듈 (세그멘테이션 백엔드)"""
 
-# TODO: AI 모델 추가 시 여기에 임포트
+from .base import SegmentationBackend
+from .registry import DEFAULT_BACKEND, available_backends, get_backend, register_backend
+from .hsv_backend import HSVBackend
+from .onnx_backend import ONNXBackend, quantize_int8
 
+__all__ = [
+    'SegmentationBackend',
+    'DEFAULT_BACKEND',
+    'available_backends',
+    'get_backend',
+    'register_backend',
+    'HSVBackend',
+    'ONNXBackend',
+    'quantize_int8',
+]
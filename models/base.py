@@ -0,0 +1,44 @@
+"""세그멘테이션 백엔드 인터페이스"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+
+import numpy as np
+
+from utils.label_map import ClassRegistry
+
+
+class SegmentationBackend(ABC):
+    """
+    RGB 이미지 → 타입 ID 라벨 배열을 만드는 분류 백엔드
+
+    결과 ID 는 registry.ids 를 따르고 0 은 미분류이다.
+    ImageProcessor 는 백엔드를 이름이나 인스턴스로 받아 segment_vegetation 에 사용한다.
+    """
+
+    # register_backend 로 등록한 이름
+    name = ''
+
+    @abstractmethod
+    def predict_labels(self, image: np.ndarray, registry: ClassRegistry) -> np.ndarray:
+        """
+        이미지 1장 분류
+
+        Args:
+            image: RGB 이미지 (uint8, H x W x 3)
+            registry: 타입 레지스트리
+
+        Returns:
+            타입 ID 배열 (uint8, H x W)
+        """
+
+    def predict_batch(self, images: Iterable[np.ndarray], registry: ClassRegistry) -> List[np.ndarray]:
+        """여러 이미지 분류 (기본 구현: 한 장씩)"""
+        return [self.predict_labels(image, registry) for image in images]
+
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """결과에 영향을 주는 설정 해시 (분석 캐시 키용)"""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name='{self.name}')"
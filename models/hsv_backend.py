@@ -0,0 +1,37 @@
+"""HSV 컬러 규칙 백엔드 (기본값)"""
+
+from typing import Optional
+
+import numpy as np
+
+from utils.color_classifier import ColorLUTClassifier, get_default_classifier
+from utils.features import ImageFeatures
+from utils.label_map import ClassRegistry
+
+from .base import SegmentationBackend
+from .registry import register_backend
+
+
+@register_backend('hsv')
+class HSVBackend(SegmentationBackend):
+    """룩업 테이블로 컴파일한 HSV 규칙 분류기 (노이즈 제거 + 우선순위 적용)"""
+
+    def __init__(self, classifier: Optional[ColorLUTClassifier] = None):
+        """
+        초기화
+
+        Args:
+            classifier: 분류 규칙 (None 이면 기본 규칙)
+        """
+        self.classifier = classifier or get_default_classifier()
+
+    def predict_labels(self, image, registry: ClassRegistry) -> np.ndarray:
+        """RGB 이미지 또는 ImageFeatures → 타입 ID 배열"""
+        if isinstance(image, ImageFeatures):
+            codes = self.classifier.classify_hsv(image.hsv)
+        else:
+            codes = self.classifier.classify(image)
+        return self.classifier.labels_from_codes(codes, registry.ids, list(registry.priority))
+
+    def fingerprint(self) -> str:
+        return f"hsv:{self.classifier.fingerprint()}"
@@ -0,0 +1,246 @@
+"""ONNX Runtime CPU 세그멘테이션 백엔드"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from utils.label_map import ClassRegistry
+from utils.tiling import iter_tiles
+
+from .base import SegmentationBackend
+from .registry import register_backend
+
+try:
+    import onnxruntime as ort
+except ImportError:  # 선택 의존성
+    ort = None
+
+
+# ImageNet 정규화 (대부분의 사전학습 세그멘테이션 모델 입력 형식)
+IMAGENET_MEAN = (0.485, 0.456, 0.406)
+IMAGENET_STD = (0.229, 0.224, 0.225)
+
+
+def _require_onnxruntime():
+    if ort is None:
+        raise ImportError("ONNX 백엔드를 사용하려면 onnxruntime 을 설치하세요: pip install onnxruntime")
+
+
+def normalize_table(
+    mean: Tuple[float, float, float] = IMAGENET_MEAN,
+    std: Tuple[float, float, float] = IMAGENET_STD
+) -> np.ndarray:
+    """uint8 → 정규화 float32 변환 테이블 (3 x 256, 채널별)"""
+    values = np.arange(256, dtype=np.float32)[:, None] / 255.0
+    return ((values - np.array(mean, np.float32)) / np.array(std, np.float32)).T.copy()
+
+
+def quantize_int8(
+    model_path,
+    output_path=None,
+    calibration_images: Optional[Sequence[np.ndarray]] = None,
+    tile_size: int = 512,
+    mean: Tuple[float, float, float] = IMAGENET_MEAN,
+    std: Tuple[float, float, float] = IMAGENET_STD
+) -> Path:
+    """
+    모델을 int8 로 양자화 (ONNX Runtime 양자화 도구)
+
+    calibration_images 를 주면 활성값 범위를 측정해 정적 양자화(QDQ)하고,
+    없으면 가중치만 동적 양자화한다. 합성곱 모델은 CPU 에서 정적 양자화가 훨씬 빠르다
+    (동적 양자화 합성곱은 ConvInteger 로 실행되어 fp32 보다 느릴 수 있음).
+
+    Args:
+        model_path: float32 ONNX 모델 경로
+        output_path: 저장 경로 (None 이면 '<이름>.int8.onnx')
+        calibration_images: 보정용 RGB 이미지 (tile_size 로 리사이즈해 사용)
+        tile_size: 보정 입력 한 변 길이
+        mean: 채널별 정규화 평균 (0~1 기준)
+        std: 채널별 정규화 표준편차 (0~1 기준)
+
+    Returns:
+        양자화된 모델 경로 (원본보다 새 파일이 이미 있으면 다시 만들지 않음)
+    """
+    _require_onnxruntime()
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_dynamic, quantize_static
+    )
+
+    model_path = Path(model_path)
+    output_path = Path(output_path) if output_path else model_path.with_suffix('.int8.onnx')
+    if output_path.exists() and output_path.stat().st_mtime >= model_path.stat().st_mtime:
+        return output_path
+
+    if not calibration_images:
+        quantize_dynamic(str(model_path), str(output_path), weight_type=QuantType.QInt8)
+        return output_path
+
+    table = normalize_table(mean, std)
+    input_name = ort.InferenceSession(
+        str(model_path), providers=['CPUExecutionProvider']
+    ).get_inputs()[0].name
+
+    class _Reader(CalibrationDataReader):
+        def __init__(self):
+            self.images = iter(calibration_images)
+
+        def get_next(self):
+            image = next(self.images, None)
+            if image is None:
+                return None
+            tile = cv2.resize(image, (tile_size, tile_size), interpolation=cv2.INTER_AREA)
+            batch = np.stack([table[c][tile[:, :, c]] for c in range(3)])[None]
+            return {input_name: batch}
+
+    quantize_static(
+        str(model_path), str(output_path), _Reader(),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8
+    )
+    return output_path
+
+
+@register_backend('onnx')
+class ONNXBackend(SegmentationBackend):
+    """
+    ONNX 세그멘테이션 모델 (CPU 전용, 타일 단위 배치 추론)
+
+    이미지를 tile_size 타일로 나누고 타일마다 overlap 만큼 주변을 더 읽어
+    batch_size 장씩 한 번에 추론한 뒤, 가장자리를 뺀 core 영역만 결과에 쓴다.
+    모델의 수용 영역(receptive field) 반경이 overlap 이하이면 타일 이음매에서도
+    이미지 전체를 한 번에 추론한 결과와 같다. 단, 이미지 아래/오른쪽 끝에서 수용 영역
+    반경 안의 픽셀은 채움 방식 차이로 달라질 수 있다.
+    모델 입력은 NCHW float32 (정규화된 RGB), 출력은 클래스별 점수 (N x C x H x W)
+    또는 클래스 번호 (N x H x W) 를 가정한다.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        class_names: Sequence[Optional[str]],
+        tile_size: int = 512,
+        overlap: int = 32,
+        batch_size: int = 4,
+        intra_op_threads: int = 0,
+        int8: bool = False,
+        mean: Tuple[float, float, float] = IMAGENET_MEAN,
+        std: Tuple[float, float, float] = IMAGENET_STD
+    ):
+        """
+        초기화
+
+        Args:
+            model_path: ONNX 모델 경로
+            class_names: 모델 출력 채널 순서의 타입 이름 (None 은 미분류)
+            tile_size: 모델 입력 한 변 길이 (모델 입력 크기가 고정이면 그 값을 사용)
+            overlap: 타일 경계 보정용으로 더 읽는 폭
+            batch_size: 한 번에 추론할 타일 수
+            intra_op_threads: 연산자 내부 스레드 수 (0 이면 ONNX Runtime 기본값 = 물리 코어 수)
+            int8: '<이름>.int8.onnx' 양자화 모델 사용 (quantize_int8 로 미리 만들어 두는 것을 권장,
+                없으면 가중치 동적 양자화로 만들어 옆에 저장)
+            mean: 채널별 정규화 평균 (0~1 기준)
+            std: 채널별 정규화 표준편차 (0~1 기준)
+        """
+        _require_onnxruntime()
+
+        self.model_path = Path(model_path)
+        if int8:
+            self.model_path = quantize_int8(self.model_path)
+        self.class_names = tuple(class_names)
+        self.batch_size = batch_size
+        self.intra_op_threads = intra_op_threads
+        self.int8 = int8
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=options, providers=['CPUExecutionProvider']
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+        # 입력 크기가 고정된 모델이면 그 크기를 타일 크기로 사용
+        fixed = self.session.get_inputs()[0].shape[2:]
+        if all(isinstance(dim, int) for dim in fixed) and fixed[0] == fixed[1]:
+            tile_size = fixed[0]
+        if tile_size <= 2 * overlap:
+            raise ValueError(f"tile_size({tile_size}) 는 overlap 의 2배보다 커야 합니다")
+        self.tile_size = tile_size
+        self.overlap = overlap
+
+        self._normalize = normalize_table(mean, std)
+        self._batch = np.empty((batch_size, 3, tile_size, tile_size), dtype=np.float32)
+        self._batch_lock = threading.Lock()
+
+        with open(self.model_path, 'rb') as f:
+            self._model_digest = hashlib.sha256(f.read()).hexdigest()
+
+    def __repr__(self) -> str:
+        return (f"ONNXBackend(model='{self.model_path.name}', tile_size={self.tile_size}, "
+                f"batch_size={self.batch_size}, intra_op_threads={self.intra_op_threads})")
+
+    def fingerprint(self) -> str:
+        return f"onnx:{self._model_digest}:{self.tile_size}:{self.overlap}:{list(self.class_names)}"
+
+    def _class_lut(self, registry: ClassRegistry) -> np.ndarray:
+        """모델 클래스 번호 → 타입 ID"""
+        lut = np.zeros(256, dtype=np.uint8)
+        for index, name in enumerate(self.class_names):
+            if name is not None and name in registry:
+                lut[index] = registry.id_of(name)
+        return lut
+
+    def _run(self, count: int) -> np.ndarray:
+        """배치 버퍼 앞 count 장 추론 → 클래스 번호 (uint8, count x T x T)"""
+        output = self.session.run(None, {self.input_name: self._batch[:count]})[0]
+        if output.ndim == 4:
+            output = output.argmax(axis=1)
+        return output.astype(np.uint8)
+
+    def predict_labels(self, image: np.ndarray, registry: ClassRegistry) -> np.ndarray:
+        """RGB 이미지 → 타입 ID 배열 (타일 배치 추론, 배치 버퍼를 쓰는 동안 잠금)"""
+        with self._batch_lock:
+            return self._predict_labels(image, registry)
+
+    def _predict_labels(self, image: np.ndarray, registry: ClassRegistry) -> np.ndarray:
+        height, width = image.shape[:2]
+        lut = self._class_lut(registry)
+        labels = np.zeros((height, width), dtype=np.uint8)
+        core = self.tile_size - 2 * self.overlap
+
+        pending = []
+        windows = iter_tiles(height, width, core, self.overlap)
+        for window in windows:
+            y0, y1, x0, x1 = window.padded
+            tile = image[y0:y1, x0:x1]
+
+            # 가장자리 타일의 남는 부분은 0 으로 채움
+            slot = len(pending)
+            th, tw = tile.shape[:2]
+            for c in range(3):
+                self._batch[slot, c, :th, :tw] = self._normalize[c][tile[:, :, c]]
+            self._batch[slot, :, th:, :] = 0
+            self._batch[slot, :, :th, tw:] = 0
+            pending.append(window)
+
+            if len(pending) == self.batch_size:
+                self._write(labels, pending, self._run(len(pending)), lut)
+                pending = []
+
+        if pending:
+            self._write(labels, pending, self._run(len(pending)), lut)
+        return labels
+
+    @staticmethod
+    def _write(labels: np.ndarray, windows, classes: np.ndarray, lut: np.ndarray):
+        """배치 결과의 core 영역을 라벨 배열에 기록"""
+        for window, tile_classes in zip(windows, classes):
+            y0, y1, x0, x1 = window.core
+            labels[y0:y1, x0:x1] = lut[window.crop_core(tile_classes)]
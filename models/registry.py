@@ -0,0 +1,64 @@
+"""세그멘테이션 백엔드 등록/선택 모듈"""
+
+import json
+import threading
+from typing import Callable, Dict, List, Type
+
+from .base import SegmentationBackend
+
+
+DEFAULT_BACKEND = 'hsv'
+
+_backend_classes: Dict[str, Type[SegmentationBackend]] = {}
+_backend_instances: Dict[str, SegmentationBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def register_backend(name: str) -> Callable[[Type[SegmentationBackend]], Type[SegmentationBackend]]:
+    """
+    백엔드 클래스 등록 데코레이터
+
+    예:
+        @register_backend('onnx')
+        class ONNXBackend(SegmentationBackend): ...
+    """
+    def decorator(cls: Type[SegmentationBackend]) -> Type[SegmentationBackend]:
+        with _backends_lock:
+            if name in _backend_classes and _backend_classes[name] is not cls:
+                raise ValueError(f"이미 등록된 백엔드 이름입니다: {name}")
+            _backend_classes[name] = cls
+        cls.name = name
+        return cls
+    return decorator
+
+
+def available_backends() -> List[str]:
+    """등록된 백엔드 이름 목록"""
+    with _backends_lock:
+        return sorted(_backend_classes)
+
+
+def get_backend(name: str = DEFAULT_BACKEND, **options) -> SegmentationBackend:
+    """
+    이름 + 옵션에 해당하는 백엔드 (프로세스 내 캐시)
+
+    모델 로딩/세션 생성은 비용이 크므로 같은 이름과 옵션이면 같은 인스턴스를 돌려준다.
+
+    Args:
+        name: 등록된 백엔드 이름
+        **options: 백엔드 생성자 인자 (JSON 으로 표현 가능해야 함)
+    """
+    key = json.dumps([name, options], sort_keys=True, default=str)
+
+    with _backends_lock:
+        backend = _backend_instances.get(key)
+        if backend is not None:
+            return backend
+        cls = _backend_classes.get(name)
+
+    if cls is None:
+        raise KeyError(f"알 수 없는 백엔드입니다: {name} (사용 가능: {available_backends()})")
+
+    backend = cls(**options)
+    with _backends_lock:
+        return _backend_instances.setdefault(key, backend)
@@ -4,11 +4,17 @@ from .image_processor import ImageProcessor
 from .area_calculator import AreaCalculator
 from .carbon_calculator import CarbonCalculator
 from .report_generator import ReportGenerator
+from .label_map import LabelMap, ClassRegistry, DEFAULT_REGISTRY
+from .hsv_histogram import HSVHistogram
 
 __all__ = [
     'ImageProcessor',
     'AreaCalculator',
     'CarbonCalculator',
     'ReportGenerator',
+    'LabelMap',
+    'ClassRegistry',
+    'DEFAULT_REGISTRY',
+    'HSVHistogram',
 ]
 
@@ -0,0 +1,153 @@
+"""분석 결과 캐시 모듈 (업로드 바이트 + 처리 설정 기반 내용 주소 캐시)"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import cv2
+import diskcache
+import numpy as np
+
+from .label_map import LabelMap, ClassRegistry
+
+
+# 캐시 항목 형식이 바뀌면 올려서 기존 항목을 무효화
+CACHE_VERSION = 2
+
+DEFAULT_SIZE_LIMIT = 512 * 2**20
+
+
+def file_digest(path) -> str:
+    """파일 내용 SHA-256 (계수 CSV 버전 식별용)"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class AnalysisCache:
+    """
+    분석 결과 캐시 (.cache/cache.db, diskcache 형식)
+
+    두 단계로 저장한다.
+    - 세그멘테이션: (이미지 바이트 해시, ImageProcessor 설정, 처리 방식) →
+      라벨 맵(PNG 압축), 타입별 비율, 원본/오버레이 JPEG 바이트
+      (면적 전용 방식은 타입별 비율만)
+    - 탄소: (세그멘테이션 키, 계수 CSV 해시, 총 면적) → 면적, 탄소흡수량
+
+    공원명/위치/메모처럼 결과에 영향이 없는 정보는 키에 넣지 않으므로
+    같은 사진을 다른 메타데이터로 다시 분석해도 캐시를 그대로 쓴다.
+    용량이 size_limit 를 넘으면 가장 오래 쓰지 않은 항목부터 지운다.
+    """
+
+    def __init__(self, directory: str = ".cache", size_limit: int = DEFAULT_SIZE_LIMIT):
+        """
+        초기화
+
+        Args:
+            directory: 캐시 디렉토리
+            size_limit: 최대 용량 (바이트)
+        """
+        self.cache = diskcache.Cache(
+            directory,
+            size_limit=size_limit,
+            eviction_policy='least-recently-used',
+            statistics=True
+        )
+
+    def __repr__(self) -> str:
+        return f"AnalysisCache(directory='{self.cache.directory}')"
+
+    # 키
+    @staticmethod
+    def segmentation_key(data, processor, mode: str = 'full') -> str:
+        """
+        업로드 바이트 + 처리 설정 + 처리 방식 → 세그멘테이션 키
+
+        Args:
+            data: 업로드 바이트
+            processor: ImageProcessor
+            mode: 처리 방식/해상도. 'full' = target_size 분석 + 오버레이,
+                'areas' = target_size 면적 전용, 'areas:tiled' = 원본 해상도 타일 면적 전용
+                (해상도가 다르면 비율도 다르므로 키를 나눔)
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        return f"seg:v{CACHE_VERSION}:{mode}:{digest}:{processor.fingerprint()}"
+
+    @staticmethod
+    def carbon_key(segmentation_key: str, coefficients_path, total_area_m2: Optional[float]) -> str:
+        """세그멘테이션 키 + 계수 CSV + 총 면적 → 탄소 키"""
+        return f"carbon:{segmentation_key}:{file_digest(coefficients_path)}:{total_area_m2!r}"
+
+    # 세그멘테이션
+    def get_segmentation(self, key: str, registry: ClassRegistry) -> Optional[Dict]:
+        """
+        세그멘테이션 캐시 조회
+
+        Returns:
+            {'label_map', 'ratios', 'original_jpg', 'overlay_jpg'} 또는 None
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+
+        labels = cv2.imdecode(np.frombuffer(entry['labels_png'], np.uint8), cv2.IMREAD_UNCHANGED)
+        return {
+            'label_map': LabelMap(labels, registry),
+            'ratios': entry['ratios'],
+            'original_jpg': entry['original_jpg'],
+            'overlay_jpg': entry['overlay_jpg'],
+        }
+
+    def set_segmentation(
+        self,
+        key: str,
+        label_map: LabelMap,
+        ratios: Dict[str, float],
+        original_jpg: bytes,
+        overlay_jpg: bytes
+    ):
+        """세그멘테이션 결과 저장"""
+        ok, labels_png = cv2.imencode('.png', label_map.labels)
+        if not ok:
+            raise ValueError("라벨 맵을 인코딩할 수 없습니다")
+
+        self.cache.set(key, {
+            'labels_png': labels_png.tobytes(),
+            'ratios': ratios,
+            'original_jpg': original_jpg,
+            'overlay_jpg': overlay_jpg,
+        })
+
+    def get_ratios(self, key: str) -> Optional[Dict[str, float]]:
+        """면적 전용 세그멘테이션 캐시 조회 → 타입별 비율 또는 None"""
+        entry = self.cache.get(key)
+        return None if entry is None else entry['ratios']
+
+    def set_ratios(self, key: str, ratios: Dict[str, float]):
+        """면적 전용 세그멘테이션 결과(타입별 비율) 저장"""
+        self.cache.set(key, {'ratios': ratios})
+
+    # 탄소
+    def get_carbon(self, key: str) -> Optional[Tuple[Dict, Dict]]:
+        """탄소 캐시 조회 → (areas, carbon) 또는 None"""
+        return self.cache.get(key)
+
+    def set_carbon(self, key: str, areas: Dict, carbon: Dict):
+        """면적/탄소 결과 저장"""
+        self.cache.set(key, (areas, carbon))
+
+    # 관리
+    def stats(self) -> Dict[str, int]:
+        """적중/실패 횟수, 항목 수, 용량"""
+        hits, misses = self.cache.stats()
+        return {
+            'hits': hits,
+            'misses': misses,
+            'count': len(self.cache),
+            'size_bytes': self.cache.volume(),
+        }
+
+    def clear(self):
+        """모든 항목 삭제"""
+        self.cache.clear()
+
+    def close(self):
+        self.cache.close()
@@ -1,23 +1,40 @@
 """면적 계산 모듈"""
 
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
+
+from .label_map import LabelMap, ClassRegistry, count_ids
+
+
+# 타입별 면적 구조 배열 (마지막 축 = registry.names 순서, 면적을 모르면 area_m2 = NaN)
+AREA_DTYPE = np.dtype([
+    ('ratio', np.float64),
+    ('ratio_percent', np.float64),
+    ('area_m2', np.float64),
+])
 
 
 class AreaCalculator:
     """면적 계산 클래스"""
     
     @staticmethod
-    def calculate_pixel_ratios(masks: Dict[str, np.ndarray]) -> Dict[str, float]:
+    def calculate_pixel_ratios(masks: Union[LabelMap, Dict[str, np.ndarray]]) -> Dict[str, float]:
         """
         픽셀 비율 계산
         
+        라벨 맵은 픽셀마다 타입이 하나이므로 비율 합계가 1 을 넘지 않는다.
+        겹침을 허용하는 마스크 딕셔너리(segment_masks)는 겹친 픽셀을 타입마다 센다.
+        
         Args:
-            masks: 타입별 마스크 딕셔너리
+            masks: 라벨 맵 또는 타입별 마스크 딕셔너리
         
         Returns:
             타입별 비율 딕셔너리 (0~1)
         """
+        if isinstance(masks, LabelMap):
+            # 라벨 맵은 히스토그램 한 번으로 모든 타입 픽셀 수 계산
+            return AreaCalculator.ratios_from_counts(masks.counts(), masks.registry)
+        
         total_pixels = masks[list(masks.keys())[0]].size
         ratios = {}
         
@@ -27,6 +44,107 @@ class AreaCalculator:
         
         return ratios
     
+    @staticmethod
+    def ratios_from_counts(counts: np.ndarray, registry: ClassRegistry) -> Dict[str, float]:
+        """
+        ID별 픽셀 수 → 타입별 비율 (calculate_pixel_ratios 와 같은 형식)
+        
+        Args:
+            counts: ID별 픽셀 수 (인덱스 0 = 미분류, 합계 = 전체 픽셀 수)
+            registry: 타입 레지스트리
+        
+        픽셀이 하나도 없으면 (예: 라벨 맵에 없는 구역) 모든 비율 0 (ratio_array 와 같음)
+        """
+        total_pixels = max(int(counts.sum()), 1)
+        return {
+            veg_type: int(counts[registry.id_of(veg_type)]) / total_pixels
+            for veg_type in registry.names
+        }
+    
+    @staticmethod
+    def count_batch(labels: np.ndarray, n_ids: int) -> np.ndarray:
+        """
+        라벨 맵 또는 라벨 맵 스택의 ID별 픽셀 수
+        
+        Args:
+            labels: uint8 타입 ID 배열 (H x W) 또는 스택 (N x H x W)
+            n_ids: 미분류 포함 ID 개수
+        
+        Returns:
+            ID별 픽셀 수 (int64, n_ids 또는 N x n_ids, 인덱스 0 = 미분류)
+        """
+        if labels.ndim == 2:
+            return count_ids(labels, n_ids)
+        # 이미지마다 히스토그램 한 번 (오프셋을 더한 np.bincount 보다 빠르고 int64 임시 배열이 없음)
+        counts = np.empty((labels.shape[0], n_ids), dtype=np.int64)
+        for i, image_labels in enumerate(labels):
+            counts[i] = count_ids(image_labels, n_ids)
+        return counts
+    
+    @staticmethod
+    def ratio_array(counts: np.ndarray) -> np.ndarray:
+        """
+        ID별 픽셀 수 → 타입별 비율 배열 (ratios_from_counts 의 배열 버전)
+        
+        Args:
+            counts: ID별 픽셀 수 (n_ids 또는 N x n_ids, 인덱스 0 = 미분류)
+        
+        Returns:
+            타입별 비율 (float64, 마지막 축 = registry.names 순서, 미분류 제외)
+        """
+        totals = counts.sum(axis=-1, keepdims=True)
+        return counts[..., 1:] / np.maximum(totals, 1)
+    
+    @staticmethod
+    def area_array(
+        ratios: np.ndarray,
+        total_area_m2: Union[None, float, np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        타입별 비율 배열 → 면적 구조 배열 (calculate_areas 의 배열 버전)
+        
+        Args:
+            ratios: 타입별 비율 (K 또는 N x K)
+            total_area_m2: 총 면적 (㎡). 스칼라 또는 공원별 배열 (N,), 없거나 0 이면 area_m2 = NaN
+        
+        Returns:
+            AREA_DTYPE 구조 배열 (ratios 와 같은 모양)
+        """
+        areas = np.empty(ratios.shape, dtype=AREA_DTYPE)
+        areas['ratio'] = ratios
+        areas['ratio_percent'] = ratios * 100
+        
+        if total_area_m2 is None:
+            areas['area_m2'] = np.nan
+        else:
+            total = np.asarray(total_area_m2, dtype=np.float64)
+            total = np.where(total > 0, total, np.nan)
+            areas['area_m2'] = ratios * (total[..., None] if total.ndim else total)
+        return areas
+    
+    @staticmethod
+    def areas_to_dict(
+        areas: np.ndarray,
+        registry: ClassRegistry
+    ) -> Union[Dict[str, Dict[str, float]], List[Dict[str, Dict[str, float]]]]:
+        """
+        면적 구조 배열 → calculate_areas 형식 딕셔너리 (JSON 저장/보고서용)
+        
+        N x K 배열이면 공원별 딕셔너리 목록을 돌려준다. NaN 면적은 None 으로 바꾼다.
+        """
+        if areas.ndim > 1:
+            return [AreaCalculator.areas_to_dict(row, registry) for row in areas]
+        
+        rows = areas.tolist()
+        return {
+            veg_type: {
+                'ratio': ratio,
+                'ratio_percent': ratio_percent,
+                'area_m2': None if area_m2 != area_m2 else area_m2
+            }
+            for veg_type, (ratio, ratio_percent, area_m2) in zip(registry.names, rows)
+        }
+    
     @staticmethod
     def calculate_areas(
         ratios: Dict[str, float],
@@ -54,17 +172,26 @@ class AreaCalculator:
         return results
     
     @staticmethod
-    def validate_ratios(ratios: Dict[str, float], tolerance: float = 0.01) -> bool:
+    def validate_ratios(
+        ratios: Union[Dict[str, float], np.ndarray],
+        tolerance: float = 0.01
+    ) -> Union[bool, np.ndarray]:
         """
         비율 합계 검증
         
         Args:
-            ratios: 타입별 비율
+            ratios: 타입별 비율 딕셔너리 또는 비율 배열 (K 또는 N x K, 마지막 축 합계를 검증)
             tolerance: 허용 오차
         
         Returns:
-            검증 통과 여부
+            검증 통과 여부 (N x K 배열이면 공원별 bool 배열)
         """
+        if isinstance(ratios, np.ndarray):
+            if ratios.dtype == AREA_DTYPE:
+                ratios = ratios['ratio']
+            valid = np.abs(ratios.sum(axis=-1) - 1.0) <= tolerance
+            return bool(valid) if valid.ndim == 0 else valid
+        
         total = sum(ratios.values())
         return abs(total - 1.0) <= tolerance
     
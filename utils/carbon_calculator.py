@@ -1,53 +1,63 @@
 """탄소흡수량 계산 모듈"""
 
-import pandas as pd
-from typing import Dict, Optional
+import numpy as np
+from typing import Dict, Mapping, Optional, Sequence, Union
 from pathlib import Path
 
+from .area_calculator import AREA_DTYPE, AreaCalculator
+from .coefficients import CoefficientIndex, CoefficientTable, get_coefficient_registry
+from .label_map import LabelMap, ClassRegistry, DEFAULT_REGISTRY
+from .ratio_sampling import RatioEstimate
+from .uncertainty import DEFAULT_PERCENTILES, monte_carlo_carbon
+from .zones import ZonalStatistics
+
 
 class CarbonCalculator:
     """탄소흡수량 계산 클래스"""
     
-    def __init__(self, coefficients_path: str = "data/carbon_coefficients.csv"):
+    def __init__(self, coefficients_path: str = "data/carbon_coefficients.csv", version: Optional[str] = None):
         """
         초기화
         
+        계수는 프로세스 공용 레지스트리에서 가져오므로 파일이 바뀌지 않았으면 다시 읽지 않는다.
+        
         Args:
             coefficients_path: 탄소 계수 CSV 파일 경로
+            version: 계수 버전 (source_name 또는 version 열 값, None 이면 파일 전체)
         """
         self.coefficients_path = Path(coefficients_path)
+        self.version = version
         self.coefficients = self._load_coefficients()
     
     def _load_coefficients(self) -> Dict[str, Dict]:
-        """탄소 계수 로드"""
-        if not self.coefficients_path.exists():
-            raise FileNotFoundError(f"계수 파일을 찾을 수 없습니다: {self.coefficients_path}")
-        
-        df = pd.read_csv(self.coefficients_path)
-        
-        coefficients = {}
-        for _, row in df.iterrows():
-            coefficients[row['vegetation_type']] = {
-                'coef_kgco2_m2_yr': row['coef_kgco2_m2_yr'],
-                'source_name': row['source_name'],
-                'version': row['version']
-            }
-        
-        return coefficients
+        """탄소 계수 로드 (배열 테이블 + 타입별 딕셔너리)"""
+        coefficient_set = get_coefficient_registry().load(self.coefficients_path)
+        self.coefficients_digest = coefficient_set.digest
+        self.table = coefficient_set.get(self.version)
+        self.index = coefficient_set.index(self.version)
+        return self.table.to_dict()
     
     def calculate_carbon(
         self,
-        areas: Dict[str, Dict[str, float]]
+        areas: Dict[str, Dict[str, float]],
+        keys: Optional[Mapping[str, str]] = None
     ) -> Dict[str, any]:
         """
         탄소흡수량 계산
         
         Args:
             areas: 타입별 면적 정보 (AreaCalculator.calculate_areas 결과)
+            keys: 다중 키 계수 파일의 조회 키 (예: {'climate_region': '중부', 'stand_age': 'III'}).
+                없는 조합은 상위 키로 대체하며, coefficients_used 에 일치한 키를 남긴다.
         
         Returns:
             탄소흡수량 결과
         """
+        coefficients = self.coefficients
+        if keys is not None and self.index is not None:
+            rows, _ = self.index.lookup(list(areas), {column: [value] for column, value in keys.items()})
+            coefficients = self.index.coefficients_used(list(areas), rows[0])
+        
         # 면적이 없으면 계산 불가
         if not any(data.get('area_m2') for data in areas.values()):
             return {
@@ -68,7 +78,7 @@ class CarbonCalculator:
                 continue
             
             # 계수가 없으면 스킵
-            if veg_type not in self.coefficients:
+            if veg_type not in coefficients:
                 continue
             
             area_m2 = area_data.get('area_m2')
@@ -76,7 +86,7 @@ class CarbonCalculator:
                 continue
             
             # 계수 가져오기
-            coef_data = self.coefficients[veg_type]
+            coef_data = coefficients[veg_type]
             coef = coef_data['coef_kgco2_m2_yr']
             
             # 탄소흡수량 계산 (kgCO2/yr)
@@ -96,6 +106,198 @@ class CarbonCalculator:
             'method': 'sum(area_m2 * coef_kgco2_m2_yr) / 1000'
         }
     
+    def calculate_carbon_batch(
+        self,
+        areas_m2: np.ndarray,
+        registry: ClassRegistry = DEFAULT_REGISTRY,
+        tables: Optional[Mapping[str, Union[CoefficientTable, CoefficientIndex]]] = None,
+        keys: Optional[Mapping[str, Sequence]] = None
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        여러 공원 x 여러 계수 버전 탄소흡수량 일괄 계산
+        
+        계수 버전마다 (공원 x 타입) 면적 행렬에 타입 ID 순서의 계수 벡터를 곱한다.
+        다중 키 인덱스(CoefficientIndex)는 keys 로 공원 x 타입 계수 행렬을 한 번에 조인해 곱한다.
+        합계는 타입 순서대로 더해 공원별 calculate_carbon 과 비트 단위로 같은 값을 낸다
+        (BLAS 행렬곱은 덧셈 순서가 달라 마지막 자리가 달라질 수 있음).
+        
+        Args:
+            areas_m2: 공원 x 타입 면적 (㎡, registry.names 순서, NaN = 면적 없음).
+                AreaCalculator.area_array 결과(AREA_DTYPE)를 그대로 넘겨도 된다.
+            registry: 타입 레지스트리
+            tables: {버전 이름: 계수 테이블 또는 다중 키 인덱스}
+                (None 이면 현재 계수 파일, keys 가 있고 키 열이 있는 파일이면 그 인덱스)
+            keys: {키 열: 공원별 값} 또는 DataFrame (다중 키 인덱스 조회용)
+        
+        Returns:
+            {버전: {'total_tco2_yr': 공원별 총 흡수량 (소수 둘째 자리 반올림, 면적이 없으면 NaN),
+                    'by_type': 공원 x 타입 흡수량 (계수나 면적이 없으면 NaN),
+                    'rows': 공원 x 타입 계수 행 번호 (다중 키 인덱스일 때,
+                            index.coefficients_used(registry.names, rows[i]) 로 출처 확인)}}
+        """
+        if areas_m2.dtype == AREA_DTYPE:
+            areas_m2 = areas_m2['area_m2']
+        areas_m2 = np.atleast_2d(np.asarray(areas_m2, dtype=np.float64))
+        if tables is None:
+            use_index = keys is not None and self.index is not None
+            tables = {self.table.version: self.index if use_index else self.table}
+        
+        # 면적이 하나도 없는 공원은 calculate_carbon 과 같이 계산 불가
+        has_area = (np.nan_to_num(areas_m2) != 0).any(axis=1)
+        
+        results = {}
+        for version, table in tables.items():
+            rows = None
+            if isinstance(table, CoefficientIndex):
+                coef, rows = table.coefficient_matrix(registry, keys if keys is not None else {})
+            else:
+                coef = table.for_registry(registry)[1:]
+            by_type_kg = areas_m2 * coef
+            
+            # 계수/면적이 없는 칸(NaN)은 0 을 더하므로 합계에 영향 없음
+            total_kg = np.zeros(len(areas_m2))
+            for column in range(by_type_kg.shape[1]):
+                total_kg += np.nan_to_num(by_type_kg[:, column])
+            
+            results[version] = {
+                'total_tco2_yr': np.where(has_area, np.round(total_kg / 1000, 2), np.nan),
+                'by_type': by_type_kg / 1000,
+            }
+            if rows is not None:
+                results[version]['rows'] = rows
+        return results
+    
+    def calculate_carbon_uncertainty(
+        self,
+        areas: Union[Dict[str, Dict[str, float]], np.ndarray],
+        spec: Union[float, Mapping[str, tuple]] = 0.2,
+        n_samples: int = 10000,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        ratio_sd: Union[None, float, np.ndarray] = None,
+        registry: ClassRegistry = DEFAULT_REGISTRY,
+        keys: Optional[Mapping[str, Sequence]] = None,
+        seed: Optional[int] = 0
+    ) -> Dict[str, np.ndarray]:
+        """
+        탄소흡수량 불확실성 (몬테카를로 분위수)
+        
+        점추정은 calculate_carbon_batch 와 같고, 계수(및 비율) 분포를 표본 x 타입 x 공원 배열 연산으로
+        전파해 공원별/타입별/전체 합계 분위수를 돌려준다. 자세한 방법은 uncertainty.monte_carlo_carbon 참고.
+        
+        Args:
+            areas: calculate_areas 결과 (공원 1곳) 또는 공원 x 타입 면적 배열 (AREA_DTYPE 가능)
+            spec: 타입별 계수 배율 분포 {타입: ('normal', 0.2) 등}, 숫자면 모든 타입에 그 상대 표준편차의 정규분포
+            n_samples: 표본 수
+            percentiles: 계산할 백분위 (0~100)
+            ratio_sd: 비율 상대 표준편차 (None 이면 계수만 불확실)
+            registry: 타입 레지스트리
+            keys: 다중 키 계수 조회 키 (calculate_carbon_batch 참고)
+            seed: 난수 시드
+        
+        Returns:
+            monte_carlo_carbon 결과 + 'point_total_tco2_yr' (공원별 점추정)
+        """
+        if isinstance(areas, dict):
+            areas = np.array([[
+                np.nan if areas.get(name, {}).get('area_m2') is None else areas[name]['area_m2']
+                for name in registry.names
+            ]])
+        if not isinstance(spec, Mapping):
+            spec = {name: ('normal', float(spec)) for name in registry.names}
+        
+        point = self.calculate_carbon_batch(areas, registry, keys=keys)
+        point = next(iter(point.values()))
+        result = monte_carlo_carbon(
+            point['by_type'], registry, spec, n_samples, percentiles, ratio_sd, seed
+        )
+        result['point_total_tco2_yr'] = point['total_tco2_yr']
+        return result
+    
+    def calculate_carbon_from_label_map(
+        self,
+        label_map: LabelMap,
+        total_area_m2: Optional[float] = None
+    ) -> Dict[str, any]:
+        """
+        라벨 맵에서 바로 탄소흡수량 계산
+        
+        면적은 우선순위로 한 타입에 정한 픽셀 기준이다 (calculate_pixel_ratios 참고).
+        
+        Args:
+            label_map: ImageProcessor.segment_vegetation 결과
+            total_area_m2: 총 면적 (㎡)
+        
+        Returns:
+            탄소흡수량 결과
+        """
+        ratios = AreaCalculator.calculate_pixel_ratios(label_map)
+        areas = AreaCalculator.calculate_areas(ratios, total_area_m2)
+        return self.calculate_carbon(areas)
+    
+    def calculate_carbon_by_zone(
+        self,
+        zonal: ZonalStatistics,
+        total_area_m2: Optional[float] = None
+    ) -> Dict[str, Dict[str, any]]:
+        """
+        구역별 탄소흡수량 계산
+        
+        Args:
+            zonal: ImageProcessor.zonal_statistics 결과
+            total_area_m2: 이미지 전체의 총 면적 (㎡)
+        
+        Returns:
+            {구역: calculate_carbon 결과}
+        """
+        return {
+            zone: self.calculate_carbon(areas)
+            for zone, areas in zonal.areas(total_area_m2).items()
+        }
+    
+    def calculate_carbon_with_ci(
+        self,
+        estimate: RatioEstimate,
+        total_area_m2: Optional[float] = None
+    ) -> Dict[str, any]:
+        """
+        표본 비율 추정치에서 탄소흡수량 + 신뢰구간 계산
+        
+        calculate_carbon 결과에 다음을 더한다 (면적이 없으면 None).
+        - total_tco2_yr_ci: 총 흡수량 (하한, 상한). 타입 간 공분산까지 반영
+        - by_type_ci: 타입별 흡수량 (하한, 상한)
+        - confidence: 신뢰수준
+        
+        Args:
+            estimate: ImageProcessor.estimate_ratios 결과
+            total_area_m2: 총 면적 (㎡)
+        
+        Returns:
+            탄소흡수량 결과
+        """
+        areas = estimate.areas(total_area_m2)
+        result = self.calculate_carbon(areas)
+        result['confidence'] = estimate.confidence
+        result['total_tco2_yr_ci'] = None
+        result['by_type_ci'] = {}
+        
+        if result['total_tco2_yr'] is None:
+            return result
+        
+        # tCO2/yr = 비율 x 총 면적 x 계수 / 1000 (비율의 선형 결합)
+        scale = {
+            veg_type: total_area_m2 * self.coefficients[veg_type]['coef_kgco2_m2_yr'] / 1000
+            for veg_type in result['by_type']
+            if veg_type in self.coefficients
+        }
+        _, low, high = estimate.linear_interval(scale)
+        result['total_tco2_yr_ci'] = (round(max(low, 0.0), 2), round(high, 2))
+        
+        for veg_type, factor in scale.items():
+            ratio_low, ratio_high = areas[veg_type]['ratio_ci']
+            result['by_type_ci'][veg_type] = (ratio_low * factor, ratio_high * factor)
+        
+        return result
+    
     def get_coefficient_info(self, veg_type: str) -> Optional[Dict]:
         """특정 식생 타입의 계수 정보 조회"""
         return self.coefficients.get(veg_type)
@@ -1,71 +1,104 @@
 """전문적인 차트 생성 모듈"""
 
+import functools
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from matplotlib import font_manager
 import numpy as np
-from typing import Dict, List
-from pathlib import Path
+
+
+# 한글 폰트 파일 (Linux 나눔 폰트, 폰트 캐시를 만든 뒤 설치돼도 쓸 수 있게 직접 등록)
+NANUM_FONT_PATHS = (
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',
+)
+
+# 한글 폰트 이름 후보 (앞에서부터 설치된 첫 폰트 사용)
+FONT_CANDIDATES = ('NanumGothic', 'NanumBarunGothic', 'Malgun Gothic', 'AppleGothic')
+
+_font_lock = threading.Lock()
+_font_ready = False
+_font_family: Optional[str] = None
+
+
+def setup_korean_font() -> Optional[str]:
+    """
+    한글 폰트 등록 (프로세스당 한 번, 스레드 안전)
+
+    matplotlib 이 디스크에 캐시한 폰트 목록(font_manager.fontManager)을 그대로 쓰고,
+    캐시에 없는 나눔 폰트 파일만 addfont 로 추가한다. 두 번째 호출부터는 결과만 돌려준다.
+
+    Returns:
+        사용할 한글 폰트 이름 (없으면 None)
+    """
+    global _font_ready, _font_family
+    if _font_ready:
+        return _font_family
+
+    with _font_lock:
+        if _font_ready:
+            return _font_family
+
+        manager = font_manager.fontManager
+        registered = {font.fname for font in manager.ttflist}
+        for font_path in NANUM_FONT_PATHS:
+            if os.path.exists(font_path) and font_path not in registered:
+                try:
+                    manager.addfont(font_path)
+                except Exception as e:
+                    print(f"⚠️ 폰트 로드 실패 ({font_path}): {e}")
+
+        available = {font.name for font in manager.ttflist}
+        _font_family = next((name for name in FONT_CANDIDATES if name in available), None)
+        if _font_family is None:
+            print("⚠️ 한글 폰트를 찾을 수 없습니다. 영문만 표시됩니다.")
+        _font_ready = True
+        return _font_family
+
+
+def chart_rc() -> Dict:
+    """차트 공통 rcParams (한글 폰트, 마이너스 기호 깨짐 방지, 기본 글자 크기)"""
+    rc = {'axes.unicode_minus': False, 'font.size': 10}
+    family = setup_korean_font()
+    if family is not None:
+        rc['font.family'] = family
+    return rc
+
+
+@contextmanager
+def chart_style():
+    """
+    차트 스타일 컨텍스트 (with 블록 안에서만 chart_rc() 적용, 전역 rcParams 는 바꾸지 않음)
+
+    여러 번 재사용할 수 있고, 블록 안에서 만든 그림은 저장할 때까지 같은 스타일을 쓴다.
+    """
+    with plt.rc_context(chart_rc()):
+        yield
+
+
+def _styled(method):
+    """차트 메서드를 chart_style() 안에서 실행"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with chart_style():
+            return method(*args, **kwargs)
+    return wrapper
 
 
 class ChartGenerator:
-    """전문적인 분석 차트 생성 클래스"""
+    """
+    전문적인 분석 차트 생성 클래스
+
+    폰트 설정은 setup_korean_font() 로 프로세스당 한 번만 하므로 인스턴스를 여러 번 만들어도 비용이 없다.
+    """
     
     def __init__(self):
-        # 한글 폰트 설정 (Linux/Windows 크로스 플랫폼)
-        import matplotlib.font_manager as fm
-        import os
-        import platform
-        
-        # matplotlib 캐시 재빌드
-        fm._load_fontmanager(try_read_cache=False)
-        
-        font_set = False
-        
-        # Linux (Ubuntu)
-        if platform.system() == 'Linux':
-            nanum_paths = [
-                '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-                '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
-                '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf'
-            ]
-            
-            for font_path in nanum_paths:
-                if os.path.exists(font_path):
-                    try:
-                        fm.fontManager.addfont(font_path)
-                        plt.rcParams['font.family'] = 'NanumGothic'
-                        font_set = True
-                        print(f"✅ 한글 폰트 로드 성공: {font_path}")
-                        break
-                    except Exception as e:
-                        print(f"⚠️ 폰트 로드 실패 ({font_path}): {e}")
-                        continue
-        
-        # Windows/Mac
-        if not font_set:
-            font_candidates = [
-                'Malgun Gothic',
-                'NanumGothic',
-                'NanumBarunGothic',
-                'AppleGothic'
-            ]
-            
-            for font_name in font_candidates:
-                try:
-                    plt.rcParams['font.family'] = font_name
-                    font_set = True
-                    print(f"✅ 한글 폰트 설정: {font_name}")
-                    break
-                except:
-                    continue
-        
-        if not font_set:
-            print("⚠️ 한글 폰트를 찾을 수 없습니다. 영문만 표시됩니다.")
-        
-        # 마이너스 기호 깨짐 방지
-        plt.rcParams['axes.unicode_minus'] = False
-        plt.rcParams['font.size'] = 10
+        setup_korean_font()
         
         # 전문적인 컬러 팔레트 (Seaborn 스타일)
         self.colors = {
@@ -90,6 +123,7 @@ class ChartGenerator:
             'SOIL': '토양'
         }
     
+    @_styled
     def create_professional_pie_chart(
         self,
         areas: Dict,
@@ -147,6 +181,7 @@ class ChartGenerator:
         
         return save_path
     
+    @_styled
     def create_professional_bar_chart(
         self,
         areas: Dict,
@@ -210,6 +245,7 @@ class ChartGenerator:
         
         return save_path
     
+    @_styled
     def create_carbon_chart(
         self,
         carbon_data: Dict,
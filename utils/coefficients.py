@@ -0,0 +1,395 @@
+"""탄소 계수 테이블 모듈 (타입 ID 로 인덱싱하는 NumPy 배열 + 프로세스 공용 계수 레지스트리)"""
+
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .label_map import ClassRegistry
+
+
+class CoefficientTable:
+    """
+    타입별 탄소 계수 테이블
+
+    CSV 한 파일(또는 한 버전)의 계수를 열 단위 배열로 보관하고,
+    for_registry() 로 타입 ID 순서의 계수 벡터를 만들어 면적 행렬과 바로 곱할 수 있게 한다.
+    """
+
+    def __init__(
+        self,
+        vegetation_types: Sequence[str],
+        coef_kgco2_m2_yr: np.ndarray,
+        source_names: Sequence[str],
+        versions: Sequence[str]
+    ):
+        """
+        초기화
+
+        Args:
+            vegetation_types: 타입 이름
+            coef_kgco2_m2_yr: 타입별 계수 (kgCO2/㎡/yr)
+            source_names: 타입별 출처
+            versions: 타입별 계수 버전
+        """
+        self.vegetation_types = tuple(vegetation_types)
+        self.coef = np.asarray(coef_kgco2_m2_yr, dtype=np.float64)
+        self.source_names = tuple(source_names)
+        self.versions = tuple(versions)
+        self._index = {name: i for i, name in enumerate(self.vegetation_types)}
+
+    def __repr__(self) -> str:
+        return f"CoefficientTable({dict(zip(self.vegetation_types, self.coef.tolist()))})"
+
+    def __len__(self) -> int:
+        return len(self.vegetation_types)
+
+    def __contains__(self, veg_type: str) -> bool:
+        return veg_type in self._index
+
+    @property
+    def version(self) -> str:
+        """테이블 버전 이름 (행마다 다르면 '+' 로 이어 붙임)"""
+        return '+'.join(sorted(set(self.versions))) or 'default'
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'CoefficientTable':
+        """계수 DataFrame (vegetation_type, coef_kgco2_m2_yr, source_name, version 열) → 테이블"""
+        return cls(
+            df['vegetation_type'].tolist(),
+            df['coef_kgco2_m2_yr'].to_numpy(dtype=np.float64),
+            df['source_name'].tolist(),
+            df['version'].tolist()
+        )
+
+    @classmethod
+    def from_csv(cls, path) -> 'CoefficientTable':
+        """계수 CSV → 테이블"""
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"계수 파일을 찾을 수 없습니다: {path}")
+        return cls.from_frame(pd.read_csv(path))
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """CarbonCalculator.coefficients 형식 딕셔너리 (같은 타입이 여러 번 있으면 마지막 행)"""
+        return {
+            veg_type: {
+                'coef_kgco2_m2_yr': coef,
+                'source_name': source_name,
+                'version': version
+            }
+            for veg_type, coef, source_name, version in zip(
+                self.vegetation_types, self.coef.tolist(), self.source_names, self.versions
+            )
+        }
+
+    def for_registry(self, registry: ClassRegistry) -> np.ndarray:
+        """
+        타입 ID 순서의 계수 벡터 (n_ids, 인덱스 0 = 미분류, 계수가 없는 타입은 NaN)
+
+        같은 타입이 여러 번 있으면 to_dict 와 같이 마지막 행을 쓴다.
+        """
+        values = np.full(registry.n_ids, np.nan)
+        for veg_type, coef in zip(self.vegetation_types, self.coef):
+            if veg_type in registry:
+                values[registry.id_of(veg_type)] = coef
+        return values
+
+
+# 계수 CSV 의 기본 열 (이 밖의 열은 조회 키로 보고, 앞 열일수록 상위 키)
+COEFFICIENT_COLUMNS = ('vegetation_type', 'coef_kgco2_m2_yr', 'source_name', 'version', 'updated_at')
+
+# 키 열의 와일드카드 (빈 칸도 같음) - 해당 키와 무관하게 적용되는 행
+WILDCARD = '*'
+
+
+def key_columns_of(df: pd.DataFrame) -> Tuple[str, ...]:
+    """계수 DataFrame 의 조회 키 열 (파일 열 순서)"""
+    return tuple(column for column in df.columns if column not in COEFFICIENT_COLUMNS)
+
+
+def _wildcard_mask(df: pd.DataFrame, key_columns: Sequence[str]) -> np.ndarray:
+    """행별 키 열이 모두 와일드카드인지 여부"""
+    mask = np.ones(len(df), dtype=bool)
+    for column in key_columns:
+        values = df[column]
+        mask &= (values.isna() | (values.astype(str).str.strip() == WILDCARD)).to_numpy()
+    return mask
+
+
+class CoefficientIndex:
+    """
+    다중 키 계수 인덱스 (타입 x 기후대 x 임령 x 수종군 등)
+
+    키 열 값을 열마다 정수 코드로 바꿔(와일드카드 = 0) 하나의 int64 복합 키로 합친 뒤
+    정렬 배열로 보관한다. 조회는 공원 x 타입 복합 키를 한 번에 만들어 searchsorted 로 찾는
+    벡터화 조인이며, 못 찾으면 뒤쪽 키부터 와일드카드로 바꿔 상위 키로 내려간다
+    (예: 타입+기후대+임령+수종군 → 타입+기후대+임령 → … → 타입).
+    같은 키가 여러 행이면 마지막 행을 쓴다.
+    """
+
+    def __init__(self, df: pd.DataFrame, key_columns: Optional[Sequence[str]] = None):
+        """
+        초기화
+
+        Args:
+            df: 계수 DataFrame (기본 열 + 키 열)
+            key_columns: 상위 → 하위 순서의 키 열 (None 이면 기본 열이 아닌 열 모두)
+        """
+        self.frame = df.reset_index(drop=True)
+        self.key_columns = tuple(key_columns) if key_columns is not None else key_columns_of(df)
+        self.coef = self.frame['coef_kgco2_m2_yr'].to_numpy(dtype=np.float64)
+
+        # 열마다 값 → 코드 (1 부터, 0 = 와일드카드)
+        columns = ('vegetation_type',) + self.key_columns
+        self._vocab: List[Dict[str, int]] = []
+        codes = np.zeros((len(self.frame), len(columns)), dtype=np.int64)
+        for j, column in enumerate(columns):
+            values = self.frame[column]
+            wildcard = values.isna() | (values.astype(str).str.strip() == WILDCARD)
+            labels = values.astype(str).str.strip().where(~wildcard)
+            uniques = sorted(set(labels.dropna()))
+            vocab = {value: i + 1 for i, value in enumerate(uniques)}
+            self._vocab.append(vocab)
+            codes[:, j] = labels.map(vocab).fillna(0).to_numpy(dtype=np.int64)
+
+        self._lookup_index = [pd.Index(list(vocab)) for vocab in self._vocab]
+        self._radix = np.array([len(vocab) + 1 for vocab in self._vocab], dtype=np.int64)
+        if np.prod(self._radix.astype(np.float64)) >= 2 ** 62:
+            raise ValueError("키 조합 수가 너무 많습니다 (int64 복합 키 범위 초과)")
+
+        # 같은 키는 마지막 행이 남도록 뒤집어서 첫 등장 위치를 고름
+        composite = self._compose(codes)
+        keys, first = np.unique(composite[::-1], return_index=True)
+        self._keys = keys
+        self._rows = (len(composite) - 1 - first).astype(np.int64)
+
+    def __repr__(self) -> str:
+        return f"CoefficientIndex(rows={len(self.frame)}, keys={list(self.key_columns)})"
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def _compose(self, codes: np.ndarray) -> np.ndarray:
+        """열별 코드 (..., 열 수) → 복합 키"""
+        composite = np.zeros(codes.shape[:-1], dtype=np.int64)
+        for j, radix in enumerate(self._radix):
+            composite = composite * radix + codes[..., j]
+        return composite
+
+    def _encode(self, column: int, values) -> np.ndarray:
+        """조회 값 → 코드 (표에 없는 값/결측은 -1)"""
+        # 서로 다른 값만 정리/조회한 뒤 펼침 (공원 수가 많아도 문자열 처리는 고유값 수만큼)
+        inverse, uniques = pd.factorize(pd.Series(values, dtype=object))
+        positions = self._lookup_index[column].get_indexer([str(value).strip() for value in uniques])
+        # 결측(inverse = -1)은 끝에 붙인 -1 로 향함
+        unique_codes = np.append(np.where(positions >= 0, positions + 1, -1), -1).astype(np.int64)
+        return unique_codes[inverse]
+
+    def lookup(self, veg_types: Sequence[str], keys: Mapping[str, Sequence]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        공원 x 타입 계수 행 조회 (상위 키 대체 포함)
+
+        Args:
+            veg_types: 타입 이름 (K)
+            keys: {키 열: 공원별 값 (P)} 또는 DataFrame. 상위 키 열부터 연속으로 준 만큼 쓰고
+                나머지 키 열은 와일드카드로 본다.
+
+        Returns:
+            (행 번호 P x K (없으면 -1), 일치한 키 수 P x K (0 = 타입만 일치))
+        """
+        if isinstance(keys, pd.DataFrame):
+            n_parks = len(keys)
+        else:
+            n_parks = len(next(iter(keys.values()))) if keys else 1
+        type_codes = self._encode(0, veg_types)
+
+        # 공원 x 키 열 코드 (주지 않은 키 열은 처음부터 와일드카드)
+        park_codes = np.zeros((n_parks, len(self.key_columns)), dtype=np.int64)
+        given = 0
+        for j, column in enumerate(self.key_columns):
+            if column not in keys:
+                break
+            park_codes[:, j] = self._encode(j + 1, keys[column])
+            given = j + 1
+
+        rows = np.full((n_parks, len(veg_types)), -1, dtype=np.int64)
+        levels = np.full((n_parks, len(veg_types)), -1, dtype=np.int64)
+        codes = np.empty((n_parks, len(veg_types), len(self._radix)), dtype=np.int64)
+        codes[:, :, 0] = type_codes
+
+        for level in range(given, -1, -1):
+            codes[:, :, 1:] = 0
+            codes[:, :, 1:level + 1] = park_codes[:, None, :level]
+            pending = (rows < 0) & (codes >= 0).all(axis=2)
+            if not pending.any():
+                continue
+            composite = self._compose(codes[pending])
+            position = np.minimum(np.searchsorted(self._keys, composite), len(self._keys) - 1)
+            found = self._keys[position] == composite
+            hit = np.flatnonzero(pending)[found]
+            rows.flat[hit] = self._rows[position[found]]
+            levels.flat[hit] = level
+        return rows, levels
+
+    def coefficient_matrix(self, registry: ClassRegistry, keys: Mapping[str, Sequence]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        공원 x 타입 계수 행렬 (registry.names 순서, 없으면 NaN) 과 행 번호
+
+        CarbonCalculator.calculate_carbon_batch 가 면적 행렬과 바로 곱하는 형식이다.
+        """
+        rows, _ = self.lookup(registry.names, keys)
+        coef = np.where(rows >= 0, self.coef[np.maximum(rows, 0)], np.nan)
+        return coef, rows
+
+    def coefficients_used(self, veg_types: Sequence[str], rows: np.ndarray) -> Dict[str, Dict]:
+        """
+        한 공원의 행 번호 (K) → CarbonCalculator.coefficients 형식 딕셔너리 + 일치한 키
+
+        각 항목에 'keys' ({키 열: 일치한 값 또는 '*'}) 를 더해 어떤 행이 쓰였는지 남긴다.
+        """
+        used = {}
+        for veg_type, row in zip(veg_types, rows):
+            if row < 0:
+                continue
+            record = self.frame.iloc[int(row)]
+            used[veg_type] = {
+                'coef_kgco2_m2_yr': float(self.coef[row]),
+                'source_name': record['source_name'],
+                'version': record['version'],
+                'keys': {
+                    column: WILDCARD if pd.isna(record[column]) else str(record[column]).strip()
+                    for column in self.key_columns
+                },
+            }
+        return used
+
+
+class CoefficientSet:
+    """
+    계수 파일 하나를 읽은 결과 (읽기 전용으로 공유)
+
+    파일 전체 테이블과 source_name 별 이름 있는 버전 테이블(MVP_ASSUMPTION_V1 등)을 함께 보관한다.
+    키 열(기후대/임령/수종군 등)이 있는 파일이면 테이블은 키가 모두 와일드카드인 타입 기본값 행으로
+    만들고, 키 조회용 CoefficientIndex 는 버전별로 처음 쓸 때 만든다.
+    """
+
+    def __init__(self, path: Path, digest: str, df: pd.DataFrame, mtime_ns: int, size: int):
+        self.path = path
+        self.digest = digest
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.key_columns = key_columns_of(df)
+        self.frame = df
+        self.frames = {str(name): rows for name, rows in df.groupby('source_name', sort=False)}
+        self.table = self._base_table(df)
+        self.versions = {name: self._base_table(rows) for name, rows in self.frames.items()}
+        self._indexes: Dict[Optional[str], CoefficientIndex] = {}
+
+    def __repr__(self) -> str:
+        return f"CoefficientSet(path='{self.path}', versions={list(self.versions)}, digest={self.digest[:12]})"
+
+    def _base_table(self, df: pd.DataFrame) -> CoefficientTable:
+        if self.key_columns:
+            df = df[_wildcard_mask(df, self.key_columns)]
+        return CoefficientTable.from_frame(df)
+
+    def _version_name(self, version: Optional[str]) -> Optional[str]:
+        """source_name 또는 version 열 값 → source_name (None 은 파일 전체)"""
+        if version is None or version in self.versions:
+            return version
+        matches = [name for name, rows in self.frames.items() if set(rows['version'].astype(str)) == {version}]
+        if len(matches) == 1:
+            return matches[0]
+        raise KeyError(f"알 수 없는 계수 버전입니다: {version} (사용 가능: {list(self.versions)})")
+
+    def get(self, version: Optional[str] = None) -> CoefficientTable:
+        """
+        버전 테이블 (None 이면 파일 전체)
+
+        Args:
+            version: source_name (예: 'MVP_ASSUMPTION_V1') 또는 version 열 값 (예: 'v1')
+        """
+        name = self._version_name(version)
+        return self.table if name is None else self.versions[name]
+
+    def index(self, version: Optional[str] = None) -> Optional[CoefficientIndex]:
+        """버전의 다중 키 인덱스 (키 열이 없는 파일이면 None)"""
+        if not self.key_columns:
+            return None
+        name = self._version_name(version)
+        index = self._indexes.get(name)
+        if index is None:
+            frame = self.frame if name is None else self.frames[name]
+            index = self._indexes.setdefault(name, CoefficientIndex(frame, self.key_columns))
+        return index
+
+
+class CoefficientRegistry:
+    """
+    프로세스 공용 계수 레지스트리 (스레드 안전)
+
+    파일마다 한 번만 읽어 파싱하고, 이후에는 stat 만 확인한다.
+    mtime/크기가 바뀌면 내용 해시를 다시 계산해 실제로 바뀐 경우에만 다시 파싱한다.
+    여러 파일(버전)을 동시에 올려 둘 수 있다.
+    """
+
+    def __init__(self):
+        self._sets: Dict[Path, CoefficientSet] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def __repr__(self) -> str:
+        return f"CoefficientRegistry(files={[str(path) for path in self._sets]})"
+
+    def load(self, path) -> CoefficientSet:
+        """경로의 계수 세트 (바뀌지 않았으면 캐시된 세트)"""
+        path = Path(path).resolve()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"계수 파일을 찾을 수 없습니다: {path}") from None
+
+        with self._lock:
+            cached = self._sets.get(path)
+            if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                return cached
+
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if cached is not None and cached.digest == digest:
+                # 내용은 같고 mtime 만 바뀜 (touch, 복사 등) → 파싱 없이 stat 만 갱신
+                cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+                return cached
+
+            coefficient_set = CoefficientSet(
+                path, digest, pd.read_csv(io.BytesIO(data)), stat.st_mtime_ns, stat.st_size
+            )
+            self._sets[path] = coefficient_set
+            self.loads += 1
+            return coefficient_set
+
+    def get(self, path, version: Optional[str] = None) -> CoefficientTable:
+        """경로 + 버전 이름 → 계수 테이블"""
+        return self.load(path).get(version)
+
+    def versions(self, path) -> List[str]:
+        """경로에 있는 버전 이름 목록"""
+        return list(self.load(path).versions)
+
+    def clear(self):
+        with self._lock:
+            self._sets.clear()
+
+
+_coefficient_registry = CoefficientRegistry()
+
+
+def get_coefficient_registry() -> CoefficientRegistry:
+    """프로세스 공용 계수 레지스트리"""
+    return _coefficient_registry
@@ -0,0 +1,387 @@
+"""HSV 컬러 규칙 기반 룩업 테이블 분류기"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+# 분류 순서 (비트 코드의 비트 위치 = 인덱스)
+CLASS_ORDER = ['BUILDING', 'ROAD', 'WATER', 'FOREST', 'TREE', 'GRASS', 'WETLAND', 'SOIL']
+
+# 타입별 HSV 범위 (lower, upper) - 양 끝 포함, OpenCV HSV (H: 0~179, S/V: 0~255)
+HSV_RULES: Dict[str, List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = {
+    # 밝은 회색/흰색 지붕 + 청록색 지붕
+    'BUILDING': [((0, 0, 180), (180, 50, 255)), ((80, 100, 100), (100, 255, 255))],
+    # 어두운 회색/검은색
+    'ROAD': [((0, 0, 0), (180, 50, 100))],
+    # 진한 파란색
+    'WATER': [((90, 80, 50), (130, 255, 200))],
+    # 진한 녹색
+    'FOREST': [((35, 70, 30), (85, 255, 150))],
+    # 중간 녹색
+    'TREE': [((30, 40, 40), (85, 180, 200))],
+    # 밝은 녹색/연두색
+    'GRASS': [((25, 30, 100), (85, 200, 255))],
+    # 어두운 청록색
+    'WETLAND': [((80, 30, 20), (100, 150, 100))],
+    # 갈색/베이지
+    'SOIL': [((10, 20, 80), (30, 150, 200))],
+}
+
+# 우선순위 규칙: 타입별로 제외할 (원본 범위) 타입 목록
+# 건물과 도로가 다른 것들보다 우선
+EXCLUSION_RULES: Dict[str, List[str]] = {
+    'BUILDING': [],
+    'ROAD': [],
+    'WATER': ['BUILDING'],
+    'FOREST': ['BUILDING', 'ROAD'],
+    'TREE': ['FOREST', 'BUILDING', 'ROAD'],
+    'GRASS': ['FOREST', 'TREE', 'BUILDING', 'ROAD'],
+    'WETLAND': [],
+    'SOIL': ['BUILDING', 'ROAD', 'FOREST', 'TREE', 'GRASS'],
+}
+
+# 노이즈 제거(3x3 열림 연산) 대상 타입
+MORPH_CLASSES = ['BUILDING', 'ROAD', 'FOREST', 'TREE', 'GRASS']
+
+
+def cv_constant(array: np.ndarray, value: int):
+    """
+    cv2 산술/비교 연산의 상수 피연산자
+
+    원소가 4개 이하인 배열은 OpenCV 가 상수 쪽 피연산자(Scalar)로 해석해
+    1x1 입력이 4x1 결과가 되므로, 그런 경우에만 같은 모양의 배열로 넘긴다.
+    """
+    if array.size <= 4:
+        return np.full_like(array, value)
+    return value
+
+
+class ColorLUTClassifier:
+    """
+    HSV 규칙을 룩업 테이블로 컴파일한 분류기
+
+    채널별 임계값 경계로 H/S/V 를 구간(bin) 인덱스로 양자화하면
+    같은 구간 안의 값들은 모든 규칙에서 같은 판정을 받으므로,
+    (H구간, S구간, V구간) → 타입 코드 테이블은 원본 규칙과 정확히 일치한다.
+    분류는 cvtColor 1회 + 테이블 역투영(calcBackProject) 2회로 끝난다.
+
+    코드 배치:
+        노이즈 제거 대상 타입이 서로 배타적이면 하위 3비트에 해당 타입 번호(1~7),
+        나머지 타입은 그 위 비트에 하나씩 둔다. 이 경우 열림 연산을
+        타입별 마스크 대신 코드 한 장에 대해 한 번만 수행할 수 있다.
+        배타적이지 않으면 타입마다 비트 하나(비트 i = class_order[i])를 쓴다.
+    """
+
+    LABEL_BITS = 3
+
+    def __init__(
+        self,
+        rules: Dict[str, List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
+        exclusions: Dict[str, List[str]] = None,
+        class_order: List[str] = None,
+        morph_classes: List[str] = None
+    ):
+        """
+        초기화
+
+        Args:
+            rules: 타입별 HSV 범위 목록 (기본값: HSV_RULES)
+            exclusions: 타입별 제외 타입 목록 (기본값: EXCLUSION_RULES)
+            class_order: 타입 순서 (최대 8개, 기본값: CLASS_ORDER)
+            morph_classes: 노이즈 제거 대상 타입 (기본값: MORPH_CLASSES)
+        """
+        self.rules = rules if rules is not None else HSV_RULES
+        self.exclusions = exclusions if exclusions is not None else EXCLUSION_RULES
+        self.class_order = list(class_order if class_order is not None else CLASS_ORDER)
+        self.morph_classes = [
+            c for c in self.class_order
+            if c in (morph_classes if morph_classes is not None else MORPH_CLASSES)
+        ]
+
+        if len(self.class_order) > 8:
+            raise ValueError("타입 코드는 최대 8개 타입까지 지원합니다")
+
+        self._resolve_luts = {}
+        self._compile()
+
+    def __reduce__(self):
+        # 프로세스 풀로 보낼 때는 규칙만 보내고 받는 쪽 캐시에서 컴파일
+        return (get_classifier, (self.rules, self.exclusions, self.class_order, self.morph_classes))
+
+    def fingerprint(self) -> str:
+        """규칙 구성 해시 (분류 결과가 같으면 같은 값)"""
+        config = {
+            'rules': {k: [[list(lo), list(hi)] for lo, hi in v] for k, v in self.rules.items()},
+            'exclusions': self.exclusions,
+            'class_order': self.class_order,
+            'morph_classes': self.morph_classes,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    def _compile(self):
+        """규칙을 구간 테이블 + 타입 코드 테이블로 컴파일"""
+        # 채널별 구간 경계 (lower, upper + 1)
+        edges = []
+        for c in range(3):
+            points = set()
+            for boxes in self.rules.values():
+                for lower, upper in boxes:
+                    points.add(int(lower[c]))
+                    points.add(int(upper[c]) + 1)
+            edges.append(np.array(sorted(p for p in points if 0 < p < 256), dtype=np.int64))
+
+        values = np.arange(256)
+        bins = [np.searchsorted(e, values, side='right') for e in edges]
+        n_bins = [len(e) + 1 for e in edges]
+
+        if n_bins[1] * n_bins[2] > 256:
+            raise ValueError("S x V 구간 수가 256 을 넘습니다")
+
+        # 구간 대표값 (구간 시작값)
+        reps = [np.concatenate([[0], e]) for e in edges]
+        h, s, v = np.meshgrid(reps[0], reps[1], reps[2], indexing='ij')
+
+        # 원본 범위 판정
+        raw = {}
+        for veg_type, boxes in self.rules.items():
+            hit = np.zeros(h.shape, dtype=bool)
+            for lower, upper in boxes:
+                hit |= (
+                    (h >= lower[0]) & (h <= upper[0]) &
+                    (s >= lower[1]) & (s <= upper[1]) &
+                    (v >= lower[2]) & (v <= upper[2])
+                )
+            raw[veg_type] = hit
+
+        # 우선순위 적용
+        final = {}
+        for veg_type in self.class_order:
+            hit = raw[veg_type].copy()
+            for other in self.exclusions.get(veg_type, []):
+                hit &= ~raw[other]
+            final[veg_type] = hit
+
+        # 코드 배치 결정
+        overlap = sum(final[c].astype(np.int64) for c in self.morph_classes) if self.morph_classes else 0
+        others = [c for c in self.class_order if c not in self.morph_classes]
+        self.packed = (
+            bool(self.morph_classes)
+            and np.all(overlap <= 1)
+            and len(self.morph_classes) < (1 << self.LABEL_BITS)
+            and len(others) <= 8 - self.LABEL_BITS
+        )
+
+        codes = np.zeros(h.shape, dtype=np.uint8)
+        if self.packed:
+            self.label_ids = {c: i + 1 for i, c in enumerate(self.morph_classes)}
+            self.bits = {c: 1 << (self.LABEL_BITS + i) for i, c in enumerate(others)}
+            for veg_type, label_id in self.label_ids.items():
+                codes[final[veg_type]] = label_id
+        else:
+            self.label_ids = {}
+            self.bits = {c: 1 << i for i, c in enumerate(self.class_order)}
+        for veg_type, bit in self.bits.items():
+            codes |= final[veg_type].astype(np.uint8) * np.uint8(bit)
+
+        # 1단계: (S, V) → SV 구간 번호, 2단계: (H, SV 구간) → 타입 코드
+        sv_table = bins[1][:, None] * n_bins[2] + bins[2][None, :]
+        code_table = codes.reshape(n_bins[0], n_bins[1] * n_bins[2])[bins[0][:180]]
+
+        self.edges = edges
+        self.channel_bins = bins
+        self.code_grid = codes
+        self.n_bins = tuple(n_bins)
+        self.sv_table = cv2.Mat(sv_table.astype(np.float32), wrap_channels=False)
+        self.code_table = cv2.Mat(code_table.astype(np.float32), wrap_channels=False)
+        self._sv_ranges = [0, 256, 0, 256]
+        self._code_ranges = [0, 180, 0, n_bins[1] * n_bins[2]]
+
+    def classify_hsv(self, hsv: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        HSV 이미지 → 타입 코드 (형태학 연산 전)
+
+        Args:
+            hsv: OpenCV HSV 이미지 (uint8, H x W x 3)
+            out: 결과를 쓸 배열 (uint8, H x W). None 이면 새로 할당
+
+        Returns:
+            타입 코드 배열 (uint8, H x W)
+        """
+        sv = cv2.calcBackProject([hsv], [1, 2], self.sv_table, self._sv_ranges, 1)
+        return cv2.calcBackProject([hsv, sv], [0, 3], self.code_table, self._code_ranges, 1, out)
+
+    def classify_values(self, h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
+        """HSV 값 배열(정수) → 타입 코드 (형태학 연산 전, 히스토그램 구간 평가용)"""
+        return self.code_grid[self.channel_bins[0][h], self.channel_bins[1][s], self.channel_bins[2][v]]
+
+    def classify(self, image: np.ndarray) -> np.ndarray:
+        """RGB 이미지 → 타입 코드 (형태학 연산 전)"""
+        return self.classify_hsv(cv2.cvtColor(image, cv2.COLOR_RGB2HSV))
+
+    def _open_labels(self, codes: np.ndarray) -> np.ndarray:
+        """
+        배타적 라벨(하위 비트)의 3x3 열림 연산
+
+        3x3 이웃이 모두 같은 라벨인 곳만 남긴 뒤 최댓값 팽창한다.
+        서로 다른 라벨의 침식 영역은 3x3 창 안에 함께 나타날 수 없으므로
+        타입별 마스크에 각각 열림 연산을 한 결과와 같다.
+        """
+        kernel = np.ones((3, 3), np.uint8)
+        labels = cv2.bitwise_and(codes, cv_constant(codes, (1 << self.LABEL_BITS) - 1))
+        uniform = cv2.compare(cv2.erode(labels, kernel), cv2.dilate(labels, kernel), cv2.CMP_EQ)
+        return cv2.dilate(cv2.bitwise_and(labels, uniform), kernel)
+
+    def masks_from_codes(self, codes: np.ndarray) -> Dict[str, np.ndarray]:
+        """타입 코드 → 타입별 0/255 마스크 (노이즈 제거 포함, 타입 간 겹침 허용)"""
+        kernel = np.ones((3, 3), np.uint8)
+        masks = {}
+
+        if self.packed:
+            opened = self._open_labels(codes)
+
+        for veg_type in self.class_order:
+            if veg_type in self.label_ids:
+                masks[veg_type] = cv2.compare(opened, cv_constant(opened, self.label_ids[veg_type]), cv2.CMP_EQ)
+                continue
+            bits = cv2.bitwise_and(codes, cv_constant(codes, self.bits[veg_type]))
+            mask = cv2.compare(bits, cv_constant(bits, 0), cv2.CMP_NE)
+            if veg_type in self.morph_classes:
+                mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+            masks[veg_type] = mask
+
+        return masks
+
+    def _resolve_lut(self, class_ids: Dict[str, int], priority: List[str]) -> np.ndarray:
+        """(열림 연산 후) 타입 코드 → 우선순위가 가장 높은 타입 ID LUT"""
+        key = (tuple(sorted(class_ids.items())), tuple(priority))
+        lut = self._resolve_luts.get(key)
+        if lut is not None:
+            return lut
+
+        label_names = {label_id: name for name, label_id in self.label_ids.items()}
+        lut = np.zeros(256, dtype=np.uint8)
+        for code in range(256):
+            present = {name for name, bit in self.bits.items() if code & bit}
+            if self.packed:
+                name = label_names.get(code & ((1 << self.LABEL_BITS) - 1))
+                if name is not None:
+                    present.add(name)
+            for name in priority:
+                if name in present and name in class_ids:
+                    lut[code] = class_ids[name]
+                    break
+
+        self._resolve_luts[key] = lut
+        return lut
+
+    def resolve_codes(
+        self,
+        codes: np.ndarray,
+        class_ids: Dict[str, int],
+        priority: List[str]
+    ) -> np.ndarray:
+        """타입 코드 → 타입 ID (형태학 연산 없이 우선순위만 적용)"""
+        return self._resolve_lut(class_ids, priority)[codes]
+
+    def labels_from_codes(
+        self,
+        codes: np.ndarray,
+        class_ids: Dict[str, int],
+        priority: List[str]
+    ) -> np.ndarray:
+        """
+        타입 코드 → 타입 ID 배열 (노이즈 제거 포함)
+
+        여러 타입에 걸친 픽셀은 priority 에서 앞선 타입으로 정하고,
+        어느 타입에도 속하지 않으면 0 이 된다. 타입별 마스크를 만들지 않는다.
+
+        Args:
+            codes: classify 결과
+            class_ids: 타입 이름 → ID (1~255)
+            priority: 우선순위 (앞이 우선)
+
+        Returns:
+            타입 ID 배열 (uint8, H x W)
+        """
+        lut = self._resolve_lut(class_ids, priority)
+
+        if self.packed:
+            # 열린 라벨 + 나머지 타입 비트를 합친 코드 한 장을 LUT 로 변환
+            other_bits = cv2.bitwise_and(codes, cv_constant(codes, 0xFF & ~((1 << self.LABEL_BITS) - 1)))
+            return cv2.LUT(cv2.bitwise_or(self._open_labels(codes), other_bits), lut)
+
+        # 배타적이지 않은 규칙: 열린 마스크로 비트 코드를 다시 만든 뒤 변환
+        opened = np.zeros_like(codes)
+        for veg_type, mask in self.masks_from_codes(codes).items():
+            opened |= cv2.bitwise_and(mask, cv_constant(mask, self.bits[veg_type]))
+        return cv2.LUT(opened, lut)
+
+
+# 규칙 구성별 컴파일 결과 캐시 (임계값 보정 시 같은 규칙을 다시 컴파일하지 않음)
+_CLASSIFIER_CACHE_SIZE = 32
+_classifiers = OrderedDict()
+_classifiers_lock = threading.Lock()
+
+
+def merge_rules(
+    overrides: Optional[Dict[str, List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]]] = None,
+    base: Optional[Dict[str, List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]]] = None
+) -> Dict[str, List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]]:
+    """base 규칙(기본값: HSV_RULES)에 타입별 범위 교체분을 덮어쓴 규칙"""
+    rules = dict(base if base is not None else HSV_RULES)
+    if overrides:
+        unknown = set(overrides) - set(rules)
+        if unknown:
+            raise KeyError(f"알 수 없는 타입입니다: {sorted(unknown)}")
+        rules.update(overrides)
+    return rules
+
+
+def get_classifier(
+    rules: Dict[str, List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]] = None,
+    exclusions: Dict[str, List[str]] = None,
+    class_order: List[str] = None,
+    morph_classes: List[str] = None
+) -> ColorLUTClassifier:
+    """
+    규칙 구성에 해당하는 분류기 (프로세스 내 LRU 캐시)
+
+    인자는 ColorLUTClassifier 와 같고, 생략하면 기본 규칙을 쓴다.
+    """
+    # 생성자와 같은 기준(None 만 기본값)으로 풀어야 {} / [] 같은 빈 설정이 기본 규칙과 섞이지 않음
+    rules = rules if rules is not None else HSV_RULES
+    exclusions = exclusions if exclusions is not None else EXCLUSION_RULES
+    class_order = class_order if class_order is not None else CLASS_ORDER
+    morph_classes = morph_classes if morph_classes is not None else MORPH_CLASSES
+
+    key = json.dumps([
+        {k: [[list(lo), list(hi)] for lo, hi in v] for k, v in rules.items()},
+        exclusions,
+        list(class_order),
+        list(morph_classes),
+    ], sort_keys=True)
+
+    with _classifiers_lock:
+        classifier = _classifiers.get(key)
+        if classifier is not None:
+            _classifiers.move_to_end(key)
+            return classifier
+
+    classifier = ColorLUTClassifier(rules, exclusions, class_order, morph_classes)
+
+    with _classifiers_lock:
+        _classifiers[key] = classifier
+        while len(_classifiers) > _CLASSIFIER_CACHE_SIZE:
+            _classifiers.popitem(last=False)
+    return classifier
+
+
+def get_default_classifier() -> ColorLUTClassifier:
+    """기본 규칙 분류기 (프로세스당 1회 컴파일)"""
+    return get_classifier()
@@ -0,0 +1,51 @@
+"""이미지별 색공간 특징 캐시 모듈"""
+
+from functools import cached_property
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+
+class ImageFeatures:
+    """
+    전처리된 RGB 이미지 + 지연 계산 색공간
+
+    HSV/LAB/그레이스케일은 처음 사용할 때 한 번만 변환해 보관하므로,
+    임계값만 바꿔 다시 분류할 때(ImageProcessor.reclassify) 색 변환을 반복하지 않는다.
+    """
+
+    def __init__(self, image: np.ndarray):
+        """
+        초기화
+
+        Args:
+            image: 전처리된 RGB 이미지 (그레이스케일이면 RGB 로 변환)
+        """
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        self.image = np.ascontiguousarray(image)
+
+    def __repr__(self) -> str:
+        cached = [name for name in ('hsv', 'lab', 'gray') if name in self.__dict__]
+        return f"ImageFeatures(shape={self.shape}, cached={cached})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(높이, 너비)"""
+        return self.image.shape[:2]
+
+    @cached_property
+    def hsv(self) -> np.ndarray:
+        """OpenCV HSV (H: 0~179)"""
+        return cv2.cvtColor(self.image, cv2.COLOR_RGB2HSV)
+
+    @cached_property
+    def lab(self) -> np.ndarray:
+        """CIE LAB"""
+        return cv2.cvtColor(self.image, cv2.COLOR_RGB2LAB)
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        """그레이스케일"""
+        return cv2.cvtColor(self.image, cv2.COLOR_RGB2GRAY)
@@ -0,0 +1,164 @@
+"""HSV 히스토그램 기반 면적 비율 추정 모듈 (픽셀 마스크 없이 임계값 재평가)"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from .color_classifier import ColorLUTClassifier, get_default_classifier
+from .features import ImageFeatures
+from .label_map import ClassRegistry, DEFAULT_REGISTRY
+
+
+# OpenCV 8비트 HSV 채널 범위
+HSV_CHANNEL_SIZES = (180, 256, 256)
+
+
+class HSVHistogram:
+    """
+    이미지 1장의 양자화 3D HSV 히스토그램 (0 이 아닌 구간만 저장)
+
+    분류 규칙이 바뀌어도 픽셀을 다시 읽지 않고, 저장된 구간마다 규칙을 한 번씩
+    평가해 타입별 비율을 O(구간 수)로 계산한다.
+
+    형태학 연산 기반 결과(segment_vegetation → calculate_pixel_ratios)와의 관계:
+        - 히스토그램은 노이즈 제거(3x3 열림 연산) 전의 우선순위 적용 결과를 센다.
+        - 열림 연산은 대상 타입(BUILDING/ROAD/FOREST/TREE/GRASS)의 픽셀을 지우기만 하므로
+          그 타입들의 라벨 맵 비율은 히스토그램 비율 이하이다.
+        - 지워진 픽셀은 겹치는 다음 우선순위 타입(기본 규칙에서는 WETLAND) 또는
+          미분류로 넘어가므로, 그 밖의 타입 비율은 히스토그램 비율 이상이다.
+          기본 규칙에서 WATER/SOIL 은 대상 타입과 겹치지 않아 정확히 같다.
+        - bin_size 가 (1, 1, 1) 이면 위 관계 외의 오차는 없다. 더 거친 구간을 쓰면
+          규칙 경계에 걸친 구간의 픽셀 수가 uncertain_pixels 로 함께 보고되며,
+          타입별 비율 오차는 uncertain_pixels / total_pixels 를 넘지 않는다.
+    """
+
+    def __init__(
+        self,
+        bin_index: np.ndarray,
+        counts: np.ndarray,
+        bin_size: Tuple[int, int, int],
+        total_pixels: int
+    ):
+        """
+        초기화
+
+        Args:
+            bin_index: 0 이 아닌 구간의 평탄화 인덱스 (uint32)
+            counts: 구간별 픽셀 수 (uint32)
+            bin_size: 채널별 구간 폭 (H, S, V)
+            total_pixels: 전체 픽셀 수
+        """
+        self.bin_index = bin_index
+        self.counts = counts
+        self.bin_size = tuple(int(b) for b in bin_size)
+        self.total_pixels = int(total_pixels)
+
+    def __repr__(self) -> str:
+        return f"HSVHistogram(bins={len(self.bin_index)}, bin_size={self.bin_size}, pixels={self.total_pixels})"
+
+    @property
+    def grid_shape(self) -> Tuple[int, int, int]:
+        """채널별 구간 수"""
+        return tuple(-(-n // b) for n, b in zip(HSV_CHANNEL_SIZES, self.bin_size))
+
+    @classmethod
+    def from_image(
+        cls,
+        image: Union[np.ndarray, ImageFeatures],
+        bin_size: Tuple[int, int, int] = (1, 1, 1)
+    ) -> 'HSVHistogram':
+        """
+        RGB 이미지(또는 특징 캐시) → 히스토그램
+
+        calcHist 의 float32 결과가 정확하도록 2^24 픽셀 이하 단위로 나눠 센다.
+        """
+        if not isinstance(image, ImageFeatures):
+            image = ImageFeatures(image)
+        hsv = image.hsv
+
+        grid = tuple(-(-n // b) for n, b in zip(HSV_CHANNEL_SIZES, bin_size))
+        ranges = []
+        for n, b in zip(HSV_CHANNEL_SIZES, bin_size):
+            ranges += [0, -(-n // b) * b]
+
+        dense = np.zeros(grid, dtype=np.uint32)
+        rows = max(1, (1 << 24) // max(1, hsv.shape[1]))
+        for start in range(0, hsv.shape[0], rows):
+            hist = cv2.calcHist([hsv[start:start + rows]], [0, 1, 2], None, list(grid), ranges)
+            dense += hist.astype(np.uint32)
+
+        flat = dense.ravel()
+        bin_index = np.flatnonzero(flat).astype(np.uint32)
+        return cls(bin_index, flat[bin_index], bin_size, hsv.shape[0] * hsv.shape[1])
+
+    def _bin_starts(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """저장된 구간의 채널별 시작값"""
+        h, s, v = np.unravel_index(self.bin_index, self.grid_shape)
+        return h * self.bin_size[0], s * self.bin_size[1], v * self.bin_size[2]
+
+    def class_counts(
+        self,
+        classifier: Optional[ColorLUTClassifier] = None,
+        registry: ClassRegistry = DEFAULT_REGISTRY
+    ) -> Tuple[np.ndarray, int]:
+        """
+        규칙 평가 → (ID별 픽셀 수, 경계에 걸친 구간의 픽셀 수)
+
+        Args:
+            classifier: 평가할 분류 규칙 (기본값: 기본 규칙)
+            registry: 타입 레지스트리
+        """
+        classifier = classifier or get_default_classifier()
+        h, s, v = self._bin_starts()
+
+        # 구간 대표값(시작값)으로 판정
+        codes = classifier.classify_values(h, s, v)
+        ids = classifier.resolve_codes(codes, registry.ids, list(registry.priority))
+        counts = np.bincount(ids, weights=self.counts, minlength=registry.n_ids)
+        counts = counts[:registry.n_ids].astype(np.int64)
+
+        # 구간 안에 규칙 경계가 있으면 시작값 판정이 구간 전체를 대표하지 못함
+        uncertain = np.zeros(len(self.bin_index), dtype=bool)
+        for c, start in enumerate((h, s, v)):
+            end = np.minimum(start + self.bin_size[c], HSV_CHANNEL_SIZES[c]) - 1
+            bins = classifier.channel_bins[c]
+            uncertain |= bins[start] != bins[end]
+        uncertain_pixels = int(self.counts[uncertain].sum(dtype=np.int64))
+
+        return counts, uncertain_pixels
+
+    def ratios(
+        self,
+        classifier: Optional[ColorLUTClassifier] = None,
+        registry: ClassRegistry = DEFAULT_REGISTRY
+    ) -> Dict[str, float]:
+        """타입별 비율 (AreaCalculator.calculate_pixel_ratios 와 같은 형식, 노이즈 제거 전)"""
+        counts, _ = self.class_counts(classifier, registry)
+        return {
+            veg_type: int(counts[registry.id_of(veg_type)]) / self.total_pixels
+            for veg_type in registry.names
+        }
+
+    # 보관
+    def save(self, path: Union[str, Path]):
+        """npz 파일로 저장"""
+        np.savez_compressed(
+            path,
+            bin_index=self.bin_index,
+            counts=self.counts,
+            bin_size=np.array(self.bin_size),
+            total_pixels=np.array(self.total_pixels)
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'HSVHistogram':
+        """save 로 저장한 파일 읽기"""
+        with np.load(path) as data:
+            return cls(
+                data['bin_index'],
+                data['counts'],
+                tuple(data['bin_size']),
+                int(data['total_pixels'])
+            )
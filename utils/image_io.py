@@ -0,0 +1,86 @@
+"""이미지 입력 모듈 (업로드 바이트 → 분석용 RGB 배열, 1회 디코딩)"""
+
+import io
+
+import cv2
+import numpy as np
+from PIL import Image
+from typing import Optional, Tuple, Union
+
+
+# 축소 디코딩 배율 → OpenCV 플래그 (JPEG 는 DCT 스케일링으로 디코딩 단계에서 축소)
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def read_image_header(data: Union[bytes, memoryview]) -> Tuple[Tuple[int, int], Optional[str]]:
+    """
+    픽셀 디코딩 없이 이미지 크기/포맷 읽기
+
+    Returns:
+        ((너비, 높이), 포맷 이름)
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        return img.size, img.format
+
+
+def reduced_decode_factor(source_size: Tuple[int, int], target_size: Tuple[int, int]) -> int:
+    """
+    축소 디코딩 배율 (1/2/4/8)
+
+    축소 후에도 가로/세로가 모두 목표 크기 이상인 가장 큰 배율을 고른다.
+    이후 리사이즈는 항상 축소 방향이므로 화질 손실 없이 디코딩 비용만 줄어든다.
+    """
+    factor = 1
+    for candidate in (2, 4, 8):
+        if (source_size[0] // candidate >= target_size[0]
+                and source_size[1] // candidate >= target_size[1]):
+            factor = candidate
+    return factor
+
+
+def decode_image(
+    data: Union[bytes, memoryview],
+    target_size: Optional[Tuple[int, int]] = None
+) -> np.ndarray:
+    """
+    인코딩된 이미지 바이트를 한 번만 디코딩해 RGB 배열로 변환
+
+    target_size 가 주어지고 JPEG 원본이 그보다 충분히 크면 DCT 축소 디코딩을 사용한다.
+    입력 바이트는 복사하지 않고, 리사이즈를 색 변환보다 먼저 해서 작은 배열만 변환한다.
+    EXIF 방향 정보는 기존(PIL) 경로와 같이 적용하지 않는다.
+
+    Args:
+        data: 인코딩된 이미지 바이트 (JPG, PNG 등)
+        target_size: (너비, 높이). 지정하면 해당 크기로 리사이즈
+
+    Returns:
+        RGB 이미지 (uint8, H x W x 3)
+    """
+    factor = 1
+    if target_size is not None:
+        size, image_format = read_image_header(data)
+        if image_format == 'JPEG':
+            factor = reduced_decode_factor(size, target_size)
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    bgr = cv2.imdecode(buffer, _REDUCED_FLAGS[factor] | cv2.IMREAD_IGNORE_ORIENTATION)
+    if bgr is None:
+        raise ValueError("이미지를 디코딩할 수 없습니다")
+
+    if target_size is not None and (bgr.shape[1], bgr.shape[0]) != tuple(target_size):
+        bgr = cv2.resize(bgr, tuple(target_size), interpolation=cv2.INTER_LINEAR)
+
+    return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+
+def encode_jpeg(image: np.ndarray) -> bytes:
+    """RGB 배열 → JPEG 바이트 (cv2.imwrite 와 같은 기본 품질)"""
+    ok, encoded = cv2.imencode('.jpg', cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+    if not ok:
+        raise ValueError("JPEG 인코딩에 실패했습니다")
+    return encoded.tobytes()
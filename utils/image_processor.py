@@ -1,16 +1,76 @@
 """이미지 처리 모듈"""
 
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
 import cv2
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List, Union, Optional
+
+from .area_calculator import AreaCalculator
+from .color_classifier import ColorLUTClassifier, get_classifier, get_default_classifier, merge_rules
+from .features import ImageFeatures
+from .image_io import decode_image
+from .label_map import LabelMap, ClassRegistry, DEFAULT_REGISTRY, count_ids
+from .legend import legend_items, render_legend, resolve_legend_font
+from .parallel import ParallelExecutor
+from .progressive import ProgressiveSegmentation
+from .raster_source import open_raster
+from .ratio_sampling import RatioEstimate, estimate_ratios
+from .video import VideoAnalysis
+from .zones import ZonalStatistics, ZoneMap
+from .tiling import (
+    MORPH_HALO, ArrayTileSource, TileWindow, TiledSegmentation, iter_tiles,
+    preview_shape, preview_factor_for, write_preview
+)
 
 
 class ImageProcessor:
     """이미지 전처리 및 세그멘테이션 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        registry: ClassRegistry = DEFAULT_REGISTRY,
+        classifier: Optional[ColorLUTClassifier] = None,
+        backend=None
+    ):
+        """
+        초기화
+        
+        Args:
+            registry: 타입 레지스트리
+            classifier: HSV 분류 규칙 (None 이면 기본 규칙)
+            backend: segment_vegetation 에 쓸 백엔드 이름 또는 models.SegmentationBackend
+                (None 또는 'hsv' 면 HSV 규칙. 타일/배치/면적 전용 경로는 항상 HSV 규칙 사용)
+        """
         self.target_size = (1024, 1024)
+        self.classifier = classifier or get_default_classifier()
+        self.registry = registry
+        self.backend = None
+        
+        if backend is not None:
+            from models import HSVBackend, get_backend
+            if isinstance(backend, str):
+                backend = get_backend(backend)
+            if isinstance(backend, HSVBackend):
+                self.classifier = backend.classifier
+            else:
+                self.backend = backend
+    
+    def fingerprint(self) -> str:
+        """처리 설정 해시 (분류 규칙, 전처리 크기, 타입 레지스트리)"""
+        config = {
+            'classifier': self.classifier.fingerprint(),
+            'target_size': list(self.target_size),
+            'names': list(self.registry.names),
+            'priority': list(self.registry.priority),
+            'colors': {k: list(v) for k, v in self.registry.colors.items()},
+        }
+        if self.backend is not None:
+            config['backend'] = self.backend.fingerprint()
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
     
     def load_image(self, image_path: str) -> np.ndarray:
         """이미지 로드"""
@@ -18,253 +78,514 @@ class ImageProcessor:
         img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         return img
     
+    def load_bytes(self, data) -> np.ndarray:
+        """
+        업로드 바이트 → 전처리된 RGB 이미지 (1회 디코딩)
+        
+        큰 JPEG 는 디코딩 단계에서 target_size 근처까지 축소하므로
+        원본 해상도 전체를 메모리에 올리지 않는다.
+        """
+        return decode_image(data, self.target_size)
+    
+    def load_raster(self, source) -> np.ndarray:
+        """
+        대형 정사영상(경로 또는 타일 소스) → 전처리된 RGB 이미지
+        
+        target_size 로 축소해 읽으므로 원본 전체를 메모리에 올리지 않는다.
+        원본 해상도 분석은 같은 소스를 segment_tiled 등에 넘긴다.
+        """
+        if isinstance(source, (str, Path)):
+            with open_raster(source) as raster:
+                return raster.read_resized(self.target_size)
+        return source.read_resized(self.target_size)
+    
     def preprocess(self, image: np.ndarray) -> np.ndarray:
         """이미지 전처리"""
+        # 이미 목표 크기면 복사 없이 그대로 사용
+        if (image.shape[1], image.shape[0]) == tuple(self.target_size):
+            return image
+        
         # 리사이즈
         image = cv2.resize(image, self.target_size, interpolation=cv2.INTER_LINEAR)
         return image
     
-    def segment_vegetation(self, image: np.ndarray) -> Dict[str, np.ndarray]:
+    def extract_features(self, image: np.ndarray) -> ImageFeatures:
+        """전처리된 이미지 → 색공간 특징 캐시 (임계값 보정용)"""
+        return ImageFeatures(image)
+    
+    def segment_vegetation(self, image: Union[np.ndarray, ImageFeatures]) -> LabelMap:
         """
         식생 타입 세그멘테이션 (개선 버전)
         
         분류: FOREST(숲), TREE(나무), GRASS(초지), WETLAND(습지), 
               WATER(물), BUILDING(건물), ROAD(도로), SOIL(토양)
         
-        TODO: 실제 AI 모델로 교체 필요
-        현재는 개선된 컬러 기반 분류 사용
+        기본은 개선된 컬러 기반 분류이고, backend 를 지정하면
+        해당 모델(models 모듈의 ONNX 백엔드 등)로 분류한다.
+        
+        Args:
+            image: RGB 이미지 또는 extract_features 결과
+        
+        Returns:
+            라벨 맵 (픽셀당 타입 ID 1바이트). label_map['TREE'] 로 0/255 마스크를 얻을 수 있다.
+            여러 타입 범위에 걸친 픽셀은 오버레이 우선순위(건물 > 도로 > 물 > ...)로 정하므로
+            겹침을 허용하던 기존 마스크(segment_masks)와 달리 한 픽셀은 한 타입 면적에만 들어간다.
+            (기본 규칙에서는 제외 규칙이 없는 습지만 달라지며, 물/숲/도로 등과 겹치는 픽셀이 빠진다)
+        """
+        if self.backend is not None:
+            if isinstance(image, ImageFeatures):
+                image = image.image
+            elif image.ndim == 2:
+                image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+            return LabelMap(self.backend.predict_labels(image, self.registry), self.registry)
+        
+        # 노이즈 제거 후 우선순위로 타입 ID 결정 (타입별 마스크 미생성)
+        return self._segment_hsv(image)
+    
+    def reclassify(
+        self,
+        features: ImageFeatures,
+        rules: Optional[Dict] = None,
+        exclusions: Optional[Dict] = None
+    ) -> LabelMap:
+        """
+        임계값만 바꿔 다시 분류 (임계값 보정용 빠른 경로)
+        
+        이미 계산된 HSV 를 재사용하고, 규칙은 구성별로 한 번만 컴파일해 캐시하므로
+        1024x1024 기준 슬라이더 조작마다 수십 ms 안에 결과가 나온다.
+        
+        Args:
+            features: extract_features 결과
+            rules: 바꿀 타입별 HSV 범위 (예: {'GRASS': [((25, 30, 100), (85, 200, 255))]})
+            exclusions: 우선순위 규칙 전체 (None 이면 현재 분류기의 규칙)
+        
+        Returns:
+            라벨 맵
+        """
+        # 현재 분류기의 규칙/타입 순서/노이즈 제거 대상을 이어받고 바꾼 부분만 덮어씀
+        base = self.classifier
+        classifier = get_classifier(
+            merge_rules(rules, base.rules),
+            exclusions if exclusions is not None else base.exclusions,
+            base.class_order,
+            base.morph_classes
+        )
+        codes = classifier.classify_hsv(features.hsv)
+        labels = classifier.labels_from_codes(
+            codes, self.registry.ids, list(self.registry.priority)
+        )
+        return LabelMap(labels, self.registry)
+    
+    def count_classes(self, image: np.ndarray, band_rows: int = 256) -> np.ndarray:
+        """
+        면적 전용 분류 (타입별 픽셀 수만 계산)
+        
+        가로 띠 단위로 색 변환 → 분류 → 우선순위/노이즈 제거 → 개수 세기를 이어서 처리하고
+        띠 크기의 작업 버퍼만 재사용하므로, 마스크/라벨 맵/오버레이를 만들지 않는다.
+        띠마다 열림 연산 범위(2픽셀)만큼 위아래 행을 더 읽으므로 결과는
+        segment_vegetation(image).counts() 와 같다.
+        
+        Args:
+            image: 전처리된 RGB 이미지
+            band_rows: 한 번에 처리할 행 수
+        
+        Returns:
+            ID별 픽셀 수 (int64, 인덱스 0 = 미분류)
+        """
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        
+        height, width = image.shape[:2]
+        counts = np.zeros(self.registry.n_ids, dtype=np.int64)
+        hsv_buffer = np.empty((band_rows + 2 * MORPH_HALO, width, 3), dtype=np.uint8)
+        code_buffer = np.empty((band_rows + 2 * MORPH_HALO, width), dtype=np.uint8)
+        
+        for y0 in range(0, height, band_rows):
+            y1 = min(y0 + band_rows, height)
+            py0, py1 = max(0, y0 - MORPH_HALO), min(height, y1 + MORPH_HALO)
+            rows = py1 - py0
+            
+            hsv = cv2.cvtColor(np.ascontiguousarray(image[py0:py1]), cv2.COLOR_RGB2HSV, hsv_buffer[:rows])
+            codes = self.classifier.classify_hsv(hsv, code_buffer[:rows])
+            labels = self.classifier.labels_from_codes(
+                codes, self.registry.ids, list(self.registry.priority)
+            )
+            counts += count_ids(labels[y0 - py0:y1 - py0], self.registry.n_ids)
+        
+        return counts
+    
+    def segment_ratios(self, image: np.ndarray, band_rows: int = 256) -> Dict[str, float]:
+        """
+        면적 전용 타입별 비율 (AreaCalculator.calculate_areas 에 바로 전달 가능)
+        
+        결과는 calculate_pixel_ratios(segment_vegetation(image)) 와 같다.
+        """
+        return AreaCalculator.ratios_from_counts(self.count_classes(image, band_rows), self.registry)
+    
+    def estimate_ratios(
+        self,
+        source,
+        target_half_width: float = 0.01,
+        confidence: float = 0.95,
+        tile_size: int = 32,
+        max_tiles: Optional[int] = None,
+        seed: int = 0
+    ) -> RatioEstimate:
+        """
+        표본 타일 분류로 타입별 비율 추정 (신뢰구간 포함, 목표 정밀도 도달 시 중단)
+        
+        대량 아카이브 선별용. 분류량은 이미지 크기가 아니라 target_half_width 에 따라 정해진다.
+        자세한 방법은 ratio_sampling.estimate_ratios 참고.
+        
+        Args:
+            source: RGB 배열 또는 shape / read(y0, y1, x0, x1) 를 가진 타일 소스
+            target_half_width: 목표 신뢰구간 반폭 (0.01 = ±1%p)
+            confidence: 신뢰수준
+            tile_size: 표본 타일 한 변 길이
+            max_tiles: 분류할 최대 타일 수
+            seed: 난수 시드
+        """
+        return estimate_ratios(
+            self, source, target_half_width, confidence, tile_size,
+            max_tiles=max_tiles, seed=seed
+        )
+    
+    def zonal_statistics(self, image: Union[np.ndarray, LabelMap], zones: ZoneMap) -> ZonalStatistics:
+        """
+        구역 x 타입 픽셀 수 (세그멘테이션 한 번 + 결합 bincount 한 번)
+        
+        구역마다 잘라서 따로 분석하면 구역 수만큼 전체 처리를 반복하고 경계 픽셀을 중복해 센다.
+        
+        Args:
+            image: 전처리된 RGB 이미지 또는 segment_vegetation 결과
+            zones: 구역 래스터 (크기가 다르면 라벨 맵 크기로 최근접 보간)
+        """
+        label_map = image if isinstance(image, LabelMap) else self.segment_vegetation(image)
+        zones = zones.resized(label_map.shape)
+        counts = zones.class_counts(label_map.labels, self.registry.n_ids)
+        return ZonalStatistics(counts, zones.names, self.registry)
+    
+    def segment_masks(self, image: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        타입별 마스크 세그멘테이션 (기존 형식)
+        
+        타입 간 겹침을 허용하는 0/255 마스크 딕셔너리를 바로 만든다.
+        (예: 물과 습지 범위가 겹치는 픽셀은 두 마스크에 모두 포함)
+        """
+        codes = self._classify(image)
+        
+        # 타입별 마스크 추출 및 노이즈 제거 (작은 점들 제거)
+        return self.classifier.masks_from_codes(codes)
+    
+    def segment_tiled(
+        self,
+        source,
+        tile_size: int = 1024,
+        preview_max_size: Optional[int] = None,
+        keep_labels: bool = False,
+        overlay_alpha: Optional[float] = None,
+        executor: Optional[ParallelExecutor] = None
+    ) -> TiledSegmentation:
+        """
+        타일 단위 세그멘테이션 (원본 해상도, 메모리 사용량은 타일 크기에 비례)
+        
+        타일마다 열림 연산 범위(2픽셀)만큼 halo 를 더 읽어 분류하므로
+        타일 경계에서도 전체 이미지를 한 번에 분류한 결과와 같다.
+        executor 를 주면 타일을 워커에 나눠 처리하고, 결과는 타일 순서대로 병합한다.
+        
+        Args:
+            source: RGB 배열 또는 shape / read(y0, y1, x0, x1) 를 가진 타일 소스
+            tile_size: 타일 한 변 길이
+            preview_max_size: 축소 라벨 맵의 긴 변 최대 길이 (None 이면 생성 안 함)
+            keep_labels: 원본 크기 라벨 맵도 만들지 여부 (픽셀당 1바이트)
+            overlay_alpha: 지정하면 원본 크기 오버레이도 타일별로 합성
+            executor: 병렬 실행기 (None 이면 현재 스레드에서 순차 처리)
+        
+        Returns:
+            타입별 픽셀 수 + (선택) 축소/전체 라벨 맵, 오버레이
+        """
+        if isinstance(source, np.ndarray):
+            source = ArrayTileSource(source)
+        
+        height, width = source.shape
+        counts = np.zeros(self.registry.n_ids, dtype=np.int64)
+        
+        preview = None
+        factor = 1
+        if preview_max_size:
+            factor = preview_factor_for(height, width, preview_max_size)
+            preview = np.zeros(preview_shape(height, width, factor), dtype=np.uint8)
+        
+        labels = np.zeros((height, width), dtype=np.uint8) if keep_labels else None
+        overlay = np.zeros((height, width, 3), dtype=np.uint8) if overlay_alpha is not None else None
+        
+        tasks = (
+            (source.read(*window.padded), window, self.registry, self.classifier, overlay_alpha)
+            for window in iter_tiles(height, width, tile_size)
+        )
+        results = executor.map(_segment_tile_task, tasks) if executor else map(_segment_tile_task, tasks)
+        
+        # 타일 순서대로 병합 (core 영역은 서로 겹치지 않음)
+        for window, core_labels, core_overlay in results:
+            counts += count_ids(core_labels, self.registry.n_ids)
+            y0, y1, x0, x1 = window.core
+            if preview is not None:
+                write_preview(preview, window, core_labels, factor)
+            if labels is not None:
+                labels[y0:y1, x0:x1] = core_labels
+            if overlay is not None:
+                overlay[y0:y1, x0:x1] = core_overlay
+        
+        return TiledSegmentation(
+            (height, width),
+            counts,
+            self.registry,
+            LabelMap(preview, self.registry) if preview is not None else None,
+            factor,
+            LabelMap(labels, self.registry) if labels is not None else None,
+            overlay
+        )
+    
+    def segment_progressive(self, source, preview_size: int = 256, tile_size: int = 128) -> ProgressiveSegmentation:
+        """
+        점진적 세그멘테이션 (저해상도 미리보기를 먼저 만들고 경계 영역만 원본 해상도로 보정)
+        
+        반환 직후 preview / preview_ratios() 를 쓸 수 있고,
+        refine() 을 진행할수록 label_map / ratios() 가 원본 해상도 결과로 수렴한다.
+        
+        Args:
+            source: RGB 배열 또는 shape / read(y0, y1, x0, x1) 를 가진 타일 소스
+            preview_size: 미리보기 긴 변 최대 길이
+            tile_size: 보정 타일 한 변 길이
+        """
+        return ProgressiveSegmentation(self, source, preview_size, tile_size)
+    
+    def analyze_video(
+        self,
+        path,
+        stride: int = 1,
+        threshold: float = 4.0,
+        queue_size: int = 4
+    ) -> VideoAnalysis:
+        """
+        드론 영상 스트리밍 분석 (지연 디코딩 + 중복 프레임 제거, 디코딩과 분류를 겹쳐 실행)
+        
+        반환값을 순회하면 남긴 프레임마다 (프레임 번호, 비율) 를 받을 수 있고,
+        run() 후 ratios() 가 비행 전체 타입별 비율이다.
+        
+        Args:
+            path: 영상 파일 경로
+            stride: stride 프레임마다 1장 사용
+            threshold: 중복 판정 기준 (축소 썸네일 평균 절대 차이, 0 이면 모두 사용)
+            queue_size: 디코딩 → 분류 큐 크기
+        """
+        return VideoAnalysis(self, path, stride, threshold, queue_size)
+    
+    def segment_tile(self, source, window: TileWindow) -> np.ndarray:
+        """타일 하나 분류 → core 영역 타입 ID 배열"""
+        return self._segment_window(source.read(*window.padded), window)
+    
+    def _segment_window(self, tile: np.ndarray, window: TileWindow) -> np.ndarray:
+        """halo 포함 타일 픽셀 → core 영역 타입 ID 배열"""
+        codes = self._classify(np.ascontiguousarray(tile))
+        labels = self.classifier.labels_from_codes(
+            codes, self.registry.ids, list(self.registry.priority)
+        )
+        return window.crop_core(labels)
+    
+    def segment_batch(self, images, executor: Optional[ParallelExecutor] = None) -> List[LabelMap]:
+        """
+        여러 이미지 세그멘테이션 (크기가 달라도 됨, 이미지 단위 병렬 가능)
+        
+        이미지마다 target_size 로 맞춘 뒤 HSV 규칙으로 분류한다.
+        결과는 이미지마다 segment_vegetation(preprocess(image)) 를 부른 것과 같다.
+        
+        Args:
+            images: RGB 배열 또는 인코딩된 이미지 바이트 목록 (지연 생성 이터러블 가능)
+            executor: 병렬 실행기 (None 이면 순차 처리)
+        
+        Returns:
+            입력 순서대로의 라벨 맵 목록
+        """
+        loaded = (self._load_batch_image(image) for image in images)
+        if executor is None:
+            return [self._segment_hsv(image) for image in loaded]
+        tasks = ((image, self.registry, self.classifier) for image in loaded)
+        return list(executor.map(_segment_image_task, tasks))
+    
+    def analyze_batch(self, images, keep_labels: bool = False) -> List[Dict]:
+        """
+        여러 이미지 분석 → 이미지별 타입 비율
+        
+        keep_labels=False 면 면적 전용 경로(count_classes)로 세므로 라벨 맵을 만들지 않고,
+        장수와 관계없이 한 장 분량의 작업 메모리만 쓴다 (야간 전체 공원 재분석용).
+        
+        Args:
+            images: RGB 배열 또는 인코딩된 이미지 바이트 목록 (지연 생성 이터러블 가능)
+            keep_labels: 결과에 라벨 맵을 포함할지 여부
+        
+        Returns:
+            입력 순서대로의 {'ratios': 타입별 비율, 'label_map': 라벨 맵(keep_labels 일 때)}
+        """
+        results = []
+        for image in images:
+            image = self._load_batch_image(image)
+            if keep_labels:
+                label_map = self._segment_hsv(image)
+                results.append({
+                    'ratios': AreaCalculator.calculate_pixel_ratios(label_map),
+                    'label_map': label_map,
+                })
+            else:
+                results.append({'ratios': self.segment_ratios(image)})
+        return results
+    
+    def count_batch(self, images) -> np.ndarray:
+        """
+        여러 이미지 분석 → 이미지별 ID별 픽셀 수 (N x n_ids)
+        
+        AreaCalculator.ratio_array / area_array 로 이어 쓰면 딕셔너리를 만들지 않고
+        공원 전체를 배열 단위로 재계산할 수 있다.
         """
+        counts = [self.count_classes(self._load_batch_image(image)) for image in images]
+        if not counts:
+            return np.zeros((0, self.registry.n_ids), dtype=np.int64)
+        return np.stack(counts)
+    
+    def _load_batch_image(self, image) -> np.ndarray:
+        """RGB 배열 또는 이미지 바이트 → target_size RGB"""
+        if not isinstance(image, np.ndarray):
+            return self.load_bytes(image)
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+        return self.preprocess(image)
+    
+    def _segment_hsv(self, image: np.ndarray) -> LabelMap:
+        """HSV 규칙 세그멘테이션 (백엔드와 무관)"""
+        labels = self.classifier.labels_from_codes(
+            self._classify(image), self.registry.ids, list(self.registry.priority)
+        )
+        return LabelMap(labels, self.registry)
+    
+    def _classify(self, image: Union[np.ndarray, ImageFeatures]) -> np.ndarray:
+        """RGB 이미지 → 타입 코드"""
+        if isinstance(image, ImageFeatures):
+            return self.classifier.classify_hsv(image.hsv)
+        
         # RGB 이미지 준비
         if len(image.shape) == 2:
             image = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
         
-        # HSV 변환
-        hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
-        
-        # LAB 변환 (색상 구분에 더 좋음)
-        lab = cv2.cvtColor(image, cv2.COLOR_RGB2LAB)
-        
-        # 그레이스케일
-        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-        
-        # 1. BUILDING (건물): 밝은 회색/흰색/청록색 지붕
-        # 채도가 낮고 밝기가 높은 영역
-        mask_building_1 = cv2.inRange(hsv, np.array([0, 0, 180]), np.array([180, 50, 255]))
-        # 청록색 지붕
-        mask_building_2 = cv2.inRange(hsv, np.array([80, 100, 100]), np.array([100, 255, 255]))
-        mask_building = cv2.bitwise_or(mask_building_1, mask_building_2)
-        
-        # 2. ROAD (도로): 어두운 회색/검은색
-        mask_road = cv2.inRange(hsv, np.array([0, 0, 0]), np.array([180, 50, 100]))
-        
-        # 3. WATER (물): 진한 파란색
-        mask_water = cv2.inRange(hsv, np.array([90, 80, 50]), np.array([130, 255, 200]))
-        
-        # 4. FOREST (숲): 진한 녹색
-        mask_forest = cv2.inRange(hsv, np.array([35, 70, 30]), np.array([85, 255, 150]))
-        
-        # 5. TREE (나무): 중간 녹색
-        mask_tree = cv2.inRange(hsv, np.array([30, 40, 40]), np.array([85, 180, 200]))
-        mask_tree = cv2.bitwise_and(mask_tree, cv2.bitwise_not(mask_forest))
-        
-        # 6. GRASS (초지): 밝은 녹색/연두색
-        mask_grass = cv2.inRange(hsv, np.array([25, 30, 100]), np.array([85, 200, 255]))
-        mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_forest))
-        mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_tree))
-        
-        # 7. WETLAND (습지): 어두운 청록색
-        mask_wetland = cv2.inRange(hsv, np.array([80, 30, 20]), np.array([100, 150, 100]))
-        
-        # 8. SOIL (토양): 갈색/베이지
-        mask_soil = cv2.inRange(hsv, np.array([10, 20, 80]), np.array([30, 150, 200]))
-        
-        # 우선순위 적용 (겹치는 부분 제거)
-        # 건물과 도로가 다른 것들보다 우선
-        mask_tree = cv2.bitwise_and(mask_tree, cv2.bitwise_not(mask_building))
-        mask_tree = cv2.bitwise_and(mask_tree, cv2.bitwise_not(mask_road))
-        
-        mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_building))
-        mask_grass = cv2.bitwise_and(mask_grass, cv2.bitwise_not(mask_road))
-        
-        mask_forest = cv2.bitwise_and(mask_forest, cv2.bitwise_not(mask_building))
-        mask_forest = cv2.bitwise_and(mask_forest, cv2.bitwise_not(mask_road))
-        
-        mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_building))
-        mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_road))
-        mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_grass))
-        mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_tree))
-        mask_soil = cv2.bitwise_and(mask_soil, cv2.bitwise_not(mask_forest))
-        
-        mask_water = cv2.bitwise_and(mask_water, cv2.bitwise_not(mask_building))
-        
-        # 노이즈 제거 (작은 점들 제거)
-        kernel = np.ones((3, 3), np.uint8)
-        mask_building = cv2.morphologyEx(mask_building, cv2.MORPH_OPEN, kernel)
-        mask_road = cv2.morphologyEx(mask_road, cv2.MORPH_OPEN, kernel)
-        mask_forest = cv2.morphologyEx(mask_forest, cv2.MORPH_OPEN, kernel)
-        mask_tree = cv2.morphologyEx(mask_tree, cv2.MORPH_OPEN, kernel)
-        mask_grass = cv2.morphologyEx(mask_grass, cv2.MORPH_OPEN, kernel)
-        
-        return {
-            'BUILDING': mask_building,
-            'ROAD': mask_road,
-            'WATER': mask_water,
-            'FOREST': mask_forest,
-            'TREE': mask_tree,
-            'GRASS': mask_grass,
-            'WETLAND': mask_wetland,
-            'SOIL': mask_soil
-        }
+        # HSV 규칙 + 우선순위(건물/도로 우선)가 컴파일된 룩업 테이블로 한 번에 분류
+        return self.classifier.classify(image)
     
     def create_overlay(
         self,
         original_image: np.ndarray,
-        masks: Dict[str, np.ndarray],
-        alpha: float = 0.5
+        masks: Union[LabelMap, Dict[str, np.ndarray]],
+        alpha: float = 0.5,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
-        """오버레이 이미지 생성"""
-        
-        # 컬러 정의 (RGB) - 명확한 구분을 위한 대비색
-        colors = {
-            'BUILDING': (255, 100, 100),   # 연한 빨강 (건물)
-            'ROAD': (64, 64, 64),          # 어두운 회색 (도로)
-            'WATER': (0, 128, 255),        # 파란색 (물)
-            'FOREST': (0, 100, 0),         # 진한 녹색 (숲)
-            'TREE': (34, 139, 34),         # 녹색 (나무)
-            'GRASS': (144, 238, 144),      # 연한 녹색 (초지)
-            'WETLAND': (0, 191, 191),      # 청록색 (습지)
-            'SOIL': (160, 82, 45)          # 갈색 (토양)
-        }
-        
-        overlay = original_image.copy()
+        """
+        오버레이 이미지 생성
         
-        # 우선순위대로 적용 (나중에 그려질수록 위에 표시)
-        priority_order = ['SOIL', 'GRASS', 'WETLAND', 'TREE', 'FOREST', 'WATER', 'ROAD', 'BUILDING']
+        타입 ID별 블렌딩 결과를 미리 계산한 팔레트 테이블(채널별 ID x 픽셀값)에서
+        픽셀마다 한 번 조회하므로 float 배열을 만들지 않는다. 결과는 기존 float 블렌딩을
+        uint8 로 자른 값과 같다. 픽셀마다 우선순위가 가장 높은 타입 색 하나만 합성한다.
         
-        for veg_type in priority_order:
-            if veg_type in masks and veg_type in colors:
-                mask = masks[veg_type]
-                color = colors[veg_type]
-                # 마스크 영역에 컬러 적용
-                overlay[mask > 0] = overlay[mask > 0] * (1 - alpha) + np.array(color) * alpha
+        Args:
+            original_image: RGB 이미지
+            masks: 라벨 맵 또는 타입별 마스크 딕셔너리 (우선순위로 합쳐 사용)
+            alpha: 타입 색 비중
+            out: 결과를 쓸 배열 (original_image 를 주면 제자리 합성). None 이면 새로 할당
         
-        return overlay.astype(np.uint8)
+        Returns:
+            오버레이 이미지 (uint8, H x W x 3)
+        """
+        if not isinstance(masks, LabelMap):
+            masks = LabelMap.from_masks(masks, self.registry)
+        registry = masks.registry
+        tables = overlay_tables(
+            tuple(registry.colors.get(name) for name in registry.names), float(alpha)
+        )
+        
+        if out is None:
+            out = np.empty_like(original_image)
+        
+        # 채널별 (타입 ID << 8 | 픽셀값) 인덱스로 테이블 조회
+        base = np.left_shift(masks.labels, 8, dtype=np.uint16)
+        index = np.empty_like(base)
+        for c in range(3):
+            np.bitwise_or(base, original_image[:, :, c], out=index)
+            np.take(tables[c], index, out=out[:, :, c], mode='clip')
+        
+        return out
     
-    def add_legend(self, image: np.ndarray, masks: Dict[str, np.ndarray]) -> np.ndarray:
-        """범례 추가 (한글 지원)"""
-        
-        colors = {
-            'BUILDING': (255, 100, 100),
-            'ROAD': (64, 64, 64),
-            'WATER': (0, 128, 255),
-            'FOREST': (0, 100, 0),
-            'TREE': (34, 139, 34),
-            'GRASS': (144, 238, 144),
-            'WETLAND': (0, 191, 191),
-            'SOIL': (160, 82, 45)
-        }
+    def add_legend(
+        self,
+        image: np.ndarray,
+        masks: Union[LabelMap, Dict[str, np.ndarray]]
+    ) -> np.ndarray:
+        """
+        범례 추가 (한글 지원)
         
-        labels = {
-            'BUILDING': '건물',
-            'ROAD': '도로',
-            'WATER': '물',
-            'FOREST': '숲',
-            'TREE': '나무',
-            'GRASS': '초지',
-            'WETLAND': '습지',
-            'SOIL': '토양'
-        }
+        폰트는 프로세스당 한 번 찾고, 범례 이미지는 (너비, 타입 구성, 폰트)별로 캐시한다.
+        이미지와 범례는 미리 할당한 결과 배열 한 장에 바로 쓴다.
+        """
+        registry = masks.registry if isinstance(masks, LabelMap) else self.registry
+        legend = render_legend(image.shape[1], legend_items(registry), resolve_legend_font())
         
-        # 범례 영역 생성 (충분히 크게)
-        legend_height = 160
-        legend = np.ones((legend_height, image.shape[1], 3), dtype=np.uint8) * 255
-        
-        # numpy를 PIL Image로 변환 (한글 텍스트를 위해)
-        legend_pil = Image.fromarray(legend)
-        draw = ImageDraw.Draw(legend_pil)
-        
-        # 한글 폰트 로드 시도 (여러 경로)
-        font = None
-        font_paths = [
-            "malgun.ttf",
-            "malgunbd.ttf",
-            "C:/Windows/Fonts/malgun.ttf",
-            "C:/Windows/Fonts/malgunbd.ttf",
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/System/Library/Fonts/AppleGothic.ttf",
-        ]
-        
-        for font_path in font_paths:
-            try:
-                font = ImageFont.truetype(font_path, 18)
-                break
-            except:
-                continue
-        
-        # 모든 폰트 로드 실패 시 기본 폰트
-        if font is None:
-            font = ImageFont.load_default()
-        
-        # 모든 항목을 한 줄씩 표시
-        y_offset = 15
-        row_height = 35
-        
-        all_items = ['BUILDING', 'ROAD', 'WATER', 'FOREST', 'TREE', 'GRASS', 'WETLAND', 'SOIL']
-        
-        # 2열로 배치
-        col1_items = all_items[:4]
-        col2_items = all_items[4:]
-        
-        # 왼쪽 열
-        x_start = 30
-        for i, veg_type in enumerate(col1_items):
-            if veg_type in colors:
-                color = colors[veg_type]
-                y_pos = y_offset + i * row_height
-                
-                # 컬러 박스
-                draw.rectangle(
-                    [(x_start, y_pos), (x_start + 40, y_pos + 25)],
-                    fill=color,
-                    outline=(0, 0, 0),
-                    width=1
-                )
-                
-                # 라벨
-                draw.text(
-                    (x_start + 50, y_pos + 3),
-                    labels[veg_type],
-                    fill=(0, 0, 0),
-                    font=font
-                )
-        
-        # 오른쪽 열
-        x_offset = image.shape[1] // 2 + 50
-        for i, veg_type in enumerate(col2_items):
-            if veg_type in colors:
-                color = colors[veg_type]
-                y_pos = y_offset + i * row_height
-                
-                # 컬러 박스
-                draw.rectangle(
-                    [(x_offset, y_pos), (x_offset + 40, y_pos + 25)],
-                    fill=color,
-                    outline=(0, 0, 0),
-                    width=1
-                )
-                
-                # 라벨
-                draw.text(
-                    (x_offset + 50, y_pos + 3),
-                    labels[veg_type],
-                    fill=(0, 0, 0),
-                    font=font
-                )
-        
-        # PIL을 다시 numpy로 변환
-        legend = np.array(legend_pil)
-        
-        # 이미지와 범례 합치기
-        result = np.vstack([image, legend])
+        height = image.shape[0]
+        result = np.empty((height + legend.shape[0], image.shape[1], 3), dtype=np.uint8)
+        result[:height] = image
+        result[height:] = legend
         return result
 
+
+@lru_cache(maxsize=32)
+def overlay_tables(colors: Tuple[Optional[Tuple[int, int, int]], ...], alpha: float) -> Tuple[np.ndarray, ...]:
+    """
+    오버레이 팔레트 테이블 (채널별 uint8, 길이 (타입 수 + 1) x 256)
+    
+    table[c][id * 256 + p] = 픽셀값 p 를 타입 id 색과 섞은 값. ID 0 과 색이 없는
+    타입은 원래 값을 그대로 둔다.
+    """
+    values = np.arange(256)[:, None]
+    table = np.empty((len(colors) + 1, 256, 3), dtype=np.uint8)
+    table[:] = values
+    for class_id, color in enumerate(colors, start=1):
+        if color is not None:
+            table[class_id] = values * (1 - alpha) + np.array(color) * alpha
+    return tuple(np.ascontiguousarray(table[:, :, c]).ravel() for c in range(3))
+
+
+# 병렬 실행용 작업 함수 (프로세스 풀에서 pickle 가능하도록 모듈 수준에 정의)
+_worker_processors = {}
+
+
+def _worker_processor(registry: ClassRegistry, classifier: ColorLUTClassifier) -> ImageProcessor:
+    """워커별 (레지스트리, 분류 규칙)당 ImageProcessor 1개 재사용"""
+    key = (registry.names, registry.priority, classifier.fingerprint())
+    processor = _worker_processors.get(key)
+    if processor is None:
+        processor = _worker_processors.setdefault(key, ImageProcessor(registry, classifier))
+    return processor
+
+
+def _segment_tile_task(task):
+    """(타일 픽셀, 창, 레지스트리, 분류기, 오버레이 alpha) → (창, core 라벨, core 오버레이)"""
+    tile, window, registry, classifier, overlay_alpha = task
+    processor = _worker_processor(registry, classifier)
+    core_labels = processor._segment_window(tile, window)
+    core_overlay = None
+    if overlay_alpha is not None:
+        core_overlay = processor.create_overlay(
+            window.crop_core(tile), LabelMap(core_labels, registry), overlay_alpha
+        )
+    return window, core_labels, core_overlay
+
+
+def _segment_image_task(task):
+    """(이미지, 레지스트리, 분류기) → 라벨 맵"""
+    image, registry, classifier = task
+    return _worker_processor(registry, classifier)._segment_hsv(image)
@@ -0,0 +1,190 @@
+"""라벨 맵 모듈 (픽셀당 1바이트 타입 ID 배열)"""
+
+import cv2
+import numpy as np
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .color_classifier import CLASS_ORDER, cv_constant
+
+
+class ClassRegistry:
+    """
+    타입 레지스트리
+
+    ID 0 은 미분류(어느 타입에도 속하지 않는 픽셀), 1 부터 names 순서대로 부여한다.
+    priority 는 여러 타입에 걸친 픽셀을 하나로 정할 때의 순서(앞이 우선)로,
+    오버레이에서 위에 그려지는 순서와 같다.
+    """
+
+    UNCLASSIFIED = 0
+
+    def __init__(
+        self,
+        names: List[str],
+        priority: List[str],
+        colors: Dict[str, Tuple[int, int, int]],
+        labels: Dict[str, str]
+    ):
+        if len(names) > 255:
+            raise ValueError("라벨 맵은 최대 255개 타입까지 지원합니다")
+        if sorted(priority) != sorted(names):
+            raise ValueError("priority 는 names 와 같은 타입 집합이어야 합니다")
+
+        self.names = tuple(names)
+        self.ids = {name: i + 1 for i, name in enumerate(self.names)}
+        self.priority = tuple(priority)
+        self.colors = dict(colors)
+        self.labels = dict(labels)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def __repr__(self) -> str:
+        return f"ClassRegistry({list(self.names)})"
+
+    @property
+    def n_ids(self) -> int:
+        """미분류 포함 ID 개수"""
+        return len(self.names) + 1
+
+    def id_of(self, name: str) -> int:
+        """타입 이름 → ID"""
+        return self.ids[name]
+
+    def name_of(self, class_id: int) -> Optional[str]:
+        """ID → 타입 이름 (미분류는 None)"""
+        if class_id == self.UNCLASSIFIED:
+            return None
+        return self.names[class_id - 1]
+
+
+DEFAULT_REGISTRY = ClassRegistry(
+    names=CLASS_ORDER,
+    priority=['BUILDING', 'ROAD', 'WATER', 'FOREST', 'TREE', 'WETLAND', 'GRASS', 'SOIL'],
+    colors={
+        'BUILDING': (255, 100, 100),   # 연한 빨강 (건물)
+        'ROAD': (64, 64, 64),          # 어두운 회색 (도로)
+        'WATER': (0, 128, 255),        # 파란색 (물)
+        'FOREST': (0, 100, 0),         # 진한 녹색 (숲)
+        'TREE': (34, 139, 34),         # 녹색 (나무)
+        'GRASS': (144, 238, 144),      # 연한 녹색 (초지)
+        'WETLAND': (0, 191, 191),      # 청록색 (습지)
+        'SOIL': (160, 82, 45)          # 갈색 (토양)
+    },
+    labels={
+        'BUILDING': '건물',
+        'ROAD': '도로',
+        'WATER': '물',
+        'FOREST': '숲',
+        'TREE': '나무',
+        'GRASS': '초지',
+        'WETLAND': '습지',
+        'SOIL': '토양'
+    }
+)
+
+
+class LabelMap(Mapping):
+    """
+    세그멘테이션 결과 (uint8 타입 ID 배열 + 레지스트리)
+
+    기존 Dict[str, np.ndarray] 마스크 딕셔너리 자리에 쓸 수 있도록 Mapping 으로 동작한다.
+    label_map['TREE'] 는 요청 시점에 0/255 마스크를 만들어 돌려주며 저장하지 않는다.
+
+    픽셀마다 타입이 하나뿐이므로 규칙 범위가 겹치는 픽셀(예: 습지와 물/숲/도로)은
+    registry.priority 에서 앞선 타입 마스크에만 들어간다. 따라서 label_map[name] 과
+    counts() 는 겹침을 허용하던 기존 마스크(ImageProcessor.segment_masks)와 다를 수 있고,
+    타입별 비율 합계는 1 을 넘지 않는다. 기존 마스크가 필요하면 segment_masks 를 쓴다.
+    """
+
+    def __init__(self, labels: np.ndarray, registry: ClassRegistry = DEFAULT_REGISTRY):
+        """
+        초기화
+
+        Args:
+            labels: 타입 ID 배열 (uint8, H x W)
+            registry: 타입 레지스트리
+        """
+        if labels.dtype != np.uint8 or labels.ndim != 2:
+            raise ValueError(f"라벨 맵은 2차원 uint8 배열이어야 합니다: {labels.dtype}, {labels.shape}")
+
+        self.labels = labels
+        self.registry = registry
+
+    @classmethod
+    def from_masks(
+        cls,
+        masks: Dict[str, np.ndarray],
+        registry: ClassRegistry = DEFAULT_REGISTRY
+    ) -> 'LabelMap':
+        """
+        마스크 딕셔너리 → 라벨 맵 (겹치는 픽셀은 registry.priority 순서로 결정)
+
+        Args:
+            masks: 타입별 0/255 마스크
+            registry: 타입 레지스트리
+
+        Returns:
+            라벨 맵
+        """
+        shape = masks[next(iter(masks))].shape[:2]
+        labels = np.zeros(shape, dtype=np.uint8)
+
+        # 우선순위 낮은 타입부터 덮어쓰기
+        for name in reversed(registry.priority):
+            if name in masks:
+                labels[masks[name] > 0] = registry.id_of(name)
+
+        return cls(labels, registry)
+
+    # Mapping 인터페이스 (지연 생성 마스크 뷰)
+    def __getitem__(self, name: str) -> np.ndarray:
+        """name 으로 정해진 픽셀의 0/255 마스크 (우선순위 적용 후, segment_masks()[name] 과 다를 수 있음)"""
+        if name not in self.registry:
+            raise KeyError(name)
+        return cv2.compare(self.labels, cv_constant(self.labels, self.registry.id_of(name)), cv2.CMP_EQ)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.registry.names)
+
+    def __len__(self) -> int:
+        return len(self.registry)
+
+    def __repr__(self) -> str:
+        return f"LabelMap(shape={self.shape}, classes={list(self.registry.names)})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.labels.shape
+
+    @property
+    def size(self) -> int:
+        return self.labels.size
+
+    def to_masks(self) -> Dict[str, np.ndarray]:
+        """모든 타입의 마스크 딕셔너리 생성 (기존 API 호환용)"""
+        return {name: self[name] for name in self}
+
+    def counts(self) -> np.ndarray:
+        """ID별 픽셀 수 (인덱스 0 = 미분류)"""
+        return count_ids(self.labels, self.registry.n_ids)
+
+
+def count_ids(labels: np.ndarray, n_ids: int) -> np.ndarray:
+    """
+    uint8 ID 배열의 ID별 픽셀 수 (int64)
+
+    calcHist 는 결과를 float32 로 돌려주므로 2^24 픽셀 이하 단위로 나눠 세면
+    정확한 정수 값을 얻는다. np.bincount 처럼 int64 임시 배열도 만들지 않는다.
+    """
+    labels = labels.reshape(labels.shape[0], -1)
+    rows = max(1, (1 << 24) // max(1, labels.shape[1]))
+    counts = np.zeros(256, dtype=np.int64)
+    for start in range(0, labels.shape[0], rows):
+        hist = cv2.calcHist([labels[start:start + rows]], [0], None, [256], [0, 256])
+        counts += hist.ravel().astype(np.int64)
+    return counts[:n_ids]
@@ -0,0 +1,103 @@
+"""오버레이 범례 렌더링 모듈 (폰트 1회 탐색 + 범례 이미지 캐시)"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from .label_map import ClassRegistry
+
+
+# 한글 폰트 후보 (앞에서부터 시도)
+LEGEND_FONT_PATHS = (
+    "malgun.ttf",
+    "malgunbd.ttf",
+    "C:/Windows/Fonts/malgun.ttf",
+    "C:/Windows/Fonts/malgunbd.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/System/Library/Fonts/AppleGothic.ttf",
+)
+
+LEGEND_FONT_SIZE = 18
+
+# 배치 (픽셀)
+_MIN_HEIGHT = 160
+_Y_OFFSET = 15
+_ROW_HEIGHT = 35
+
+
+@lru_cache(maxsize=None)
+def resolve_legend_font(size: int = LEGEND_FONT_SIZE) -> Optional[str]:
+    """
+    사용할 한글 폰트 경로 (프로세스당 1회 탐색)
+
+    Returns:
+        열 수 있는 첫 번째 후보 경로. 모두 실패하면 None (PIL 기본 폰트 사용)
+    """
+    for font_path in LEGEND_FONT_PATHS:
+        try:
+            ImageFont.truetype(font_path, size)
+            return font_path
+        except OSError:
+            continue
+    return None
+
+
+def legend_items(registry: ClassRegistry) -> Tuple[Tuple[str, Tuple[int, int, int]], ...]:
+    """레지스트리 → 범례 항목 ((한글 라벨, 색), ...) (타입 순서)"""
+    return tuple(
+        (registry.labels.get(name, name), tuple(registry.colors[name]))
+        for name in registry.names
+        if name in registry.colors
+    )
+
+
+@lru_cache(maxsize=32)
+def render_legend(
+    width: int,
+    items: Tuple[Tuple[str, Tuple[int, int, int]], ...],
+    font_path: Optional[str] = None
+) -> np.ndarray:
+    """
+    범례 이미지 (너비, 항목, 폰트별 캐시, 읽기 전용)
+
+    항목을 2열로 나눠 왼쪽 열에 앞쪽 절반을 배치한다.
+
+    Args:
+        width: 범례 너비 (오버레이 이미지 너비)
+        items: legend_items 결과
+        font_path: 폰트 경로 (resolve_legend_font 결과, None 이면 PIL 기본 폰트)
+
+    Returns:
+        RGB 범례 (uint8, 높이 x width x 3)
+    """
+    if font_path is not None:
+        font = ImageFont.truetype(font_path, LEGEND_FONT_SIZE)
+    else:
+        font = ImageFont.load_default()
+
+    rows = (len(items) + 1) // 2
+    height = max(_MIN_HEIGHT, _Y_OFFSET + rows * _ROW_HEIGHT + 5)
+    legend_pil = Image.new('RGB', (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(legend_pil)
+
+    columns = (items[:rows], items[rows:])
+    for x_start, column in zip((30, width // 2 + 50), columns):
+        for i, (label, color) in enumerate(column):
+            y_pos = _Y_OFFSET + i * _ROW_HEIGHT
+
+            # 컬러 박스
+            draw.rectangle(
+                [(x_start, y_pos), (x_start + 40, y_pos + 25)],
+                fill=color,
+                outline=(0, 0, 0),
+                width=1
+            )
+
+            # 라벨
+            draw.text((x_start + 50, y_pos + 3), label, fill=(0, 0, 0), font=font)
+
+    legend = np.asarray(legend_pil).copy()
+    legend.setflags(write=False)
+    return legend
@@ -0,0 +1,93 @@
+"""병렬 실행 모듈 (타일/이미지 단위 스레드 또는 프로세스 풀)"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+
+def _init_process_worker():
+    """프로세스 워커 초기화: 워커 수만큼 이미 병렬이므로 OpenCV 내부 스레드는 1개로 제한"""
+    import cv2
+    cv2.setNumThreads(1)
+
+
+class ParallelExecutor:
+    """
+    스레드/프로세스 풀 실행기
+
+    map 은 입력 순서대로 결과를 돌려주므로 결과 병합이 항상 같은 순서로 일어난다.
+    동시에 제출하는 작업 수를 max_pending 으로 제한해, 타일 입력을 지연 생성하면
+    메모리 사용량이 (워커 수 x 타일 크기)를 넘지 않는다.
+
+    - thread: OpenCV 연산은 GIL 을 놓으므로 추가 직렬화 없이 병렬 실행
+    - process: 타일 픽셀을 워커로 복사해 보내며, 워커의 OpenCV 내부 스레드는 1개로 제한
+    """
+
+    KINDS = ('thread', 'process')
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        kind: str = 'thread',
+        max_pending: Optional[int] = None
+    ):
+        """
+        초기화
+
+        Args:
+            max_workers: 워커 수 (기본값: CPU 코어 수)
+            kind: 'thread' 또는 'process'
+            max_pending: 동시에 제출할 최대 작업 수 (기본값: 워커 수 x 2)
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 실행기 종류입니다: {kind} (지원: {self.KINDS})")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.kind = kind
+        self.max_pending = max_pending or self.max_workers * 2
+        self._pool = None
+
+    def __repr__(self) -> str:
+        return f"ParallelExecutor(max_workers={self.max_workers}, kind='{self.kind}')"
+
+    def __enter__(self) -> 'ParallelExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def _get_pool(self):
+        """풀 지연 생성 (실행기를 여러 번 재사용)"""
+        if self._pool is None:
+            if self.kind == 'process':
+                self._pool = ProcessPoolExecutor(self.max_workers, initializer=_init_process_worker)
+            else:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix='arbormind')
+        return self._pool
+
+    def map(self, func: Callable, items: Iterable) -> Iterator:
+        """
+        items 각각에 func 적용 (결과는 입력 순서대로)
+
+        워커가 1개인 스레드 실행기는 풀 없이 호출한 스레드에서 바로 실행한다.
+        """
+        if self.max_workers == 1 and self.kind == 'thread':
+            for item in items:
+                yield func(item)
+            return
+
+        pool = self._get_pool()
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= self.max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def shutdown(self):
+        """풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
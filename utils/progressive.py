@@ -0,0 +1,185 @@
+"""점진적(저해상도 → 원본) 세그멘테이션 모듈"""
+
+from typing import Dict, Iterator, List, Optional
+
+import cv2
+import numpy as np
+
+from .area_calculator import AreaCalculator
+from .label_map import LabelMap, count_ids
+from .tiling import ArrayTileSource, TileWindow, iter_tiles, preview_factor_for
+
+
+class ProgressiveSegmentation:
+    """
+    저해상도 미리보기 + 경계 영역만 원본 해상도로 보정하는 세그멘테이션
+
+    1. 긴 변 preview_size 로 면적 평균 축소한 이미지를 분류해 미리보기 라벨과 비율을 바로 만든다.
+    2. 미리보기 라벨을 원본 크기로 늘려(셀 = factor x factor 블록) 초기 결과로 쓴다.
+    3. refine() 은 tile_size 타일 중 미리보기에서 타입 경계(3x3 이웃에 다른 타입)가 걸친 타일만
+       원본 해상도로 다시 분류한다. 균일한 영역은 미리보기 라벨을 그대로 물려받는다.
+
+    미리보기 비율은 축소 이미지 기준 추정치이다 (색 평균으로 잔무늬가 사라져 달라질 수 있음).
+    보정한 타일은 halo 를 포함해 분류하므로 segment_vegetation(원본) 과 정확히 같다.
+    refine(include_uniform=True) 로 나머지 타일까지 보정하면 결과 전체가 원본 해상도 결과와 같아진다.
+    """
+
+    def __init__(self, processor, source, preview_size: int = 256, tile_size: int = 128):
+        """
+        초기화 (미리보기 분류까지 수행)
+
+        Args:
+            processor: ImageProcessor
+            source: RGB 배열 또는 shape / read(y0, y1, x0, x1) 를 가진 타일 소스
+            preview_size: 미리보기 긴 변 최대 길이
+            tile_size: 보정 타일 한 변 길이 (미리보기 셀 크기의 배수로 맞춤)
+        """
+        if isinstance(source, np.ndarray):
+            source = ArrayTileSource(source)
+
+        self.processor = processor
+        self.source = source
+        self.registry = processor.registry
+        self.shape = tuple(source.shape)
+        self.factor = preview_factor_for(*self.shape, preview_size)
+
+        # 보정 타일(segment_tile)과 같은 HSV 규칙으로 미리보기 분류
+        coarse = self._coarse_image()
+        classifier = processor.classifier
+        self.preview = LabelMap(
+            classifier.labels_from_codes(
+                classifier.classify(coarse), self.registry.ids, list(self.registry.priority)
+            ),
+            self.registry
+        )
+
+        # 셀 면적(가장자리 셀은 잘린 크기)으로 가중한 미리보기 개수 = 확대한 초기 라벨 맵의 개수
+        height, width = self.shape
+        f = self.factor
+        cell_rows = np.minimum(f, height - np.arange(self.preview.shape[0]) * f)
+        cell_cols = np.minimum(f, width - np.arange(self.preview.shape[1]) * f)
+        self._cell_area = np.outer(cell_rows, cell_cols)
+        self.counts = self._cell_counts(0, self.preview.shape[0], 0, self.preview.shape[1])
+        self._labels = None
+
+        # 3x3 이웃에 다른 타입이 있는 셀 = 경계 셀 (타일은 셀 경계에 맞춤)
+        kernel = np.ones((3, 3), np.uint8)
+        boundary = cv2.compare(
+            cv2.erode(self.preview.labels, kernel), cv2.dilate(self.preview.labels, kernel), cv2.CMP_NE
+        )
+        tile_size = max(1, round(tile_size / f)) * f
+
+        self._boundary_tiles: List[TileWindow] = []
+        self._uniform_tiles: List[TileWindow] = []
+        for window in iter_tiles(height, width, tile_size):
+            y0, y1, x0, x1 = window.core
+            cells = boundary[y0 // f:-(-y1 // f), x0 // f:-(-x1 // f)]
+            (self._boundary_tiles if cells.any() else self._uniform_tiles).append(window)
+
+        # 왼쪽 위부터 보정하도록 뒤집어 둠 (pop 은 끝에서 꺼냄)
+        self._boundary_tiles.reverse()
+        self._uniform_tiles.reverse()
+        self.total_tiles = len(self._boundary_tiles) + len(self._uniform_tiles)
+        self.refined_tiles = 0
+
+    def __repr__(self) -> str:
+        return (f"ProgressiveSegmentation(shape={self.shape}, factor={self.factor}, "
+                f"refined={self.refined_tiles}/{self.total_tiles})")
+
+    def _coarse_image(self) -> np.ndarray:
+        """factor 배 면적 평균 축소 이미지 (행 띠 단위로 읽어 원본 전체를 한 번에 올리지 않음)"""
+        height, width = self.shape
+        f = self.factor
+        coarse = np.empty((-(-height // f), -(-width // f), 3), dtype=np.uint8)
+        band = f * max(1, 256 // f)
+        for y0 in range(0, height, band):
+            y1 = min(y0 + band, height)
+            rows = self.source.read(y0, y1, 0, width)
+            cy0, cy1 = y0 // f, -(-y1 // f)
+            if f == 1:
+                coarse[cy0:cy1] = rows
+            else:
+                coarse[cy0:cy1] = cv2.resize(rows, (coarse.shape[1], cy1 - cy0), interpolation=cv2.INTER_AREA)
+        return coarse
+
+    def _cell_counts(self, cy0: int, cy1: int, cx0: int, cx1: int) -> np.ndarray:
+        """미리보기 셀 범위를 원본 크기로 늘렸을 때의 ID별 픽셀 수"""
+        counts = np.bincount(
+            self.preview.labels[cy0:cy1, cx0:cx1].ravel(),
+            weights=self._cell_area[cy0:cy1, cx0:cx1].ravel(),
+            minlength=self.registry.n_ids
+        )
+        return counts[:self.registry.n_ids].astype(np.int64)
+
+    # 결과
+    @property
+    def labels(self) -> np.ndarray:
+        """현재 원본 크기 타입 ID 배열 (처음 사용할 때 미리보기를 셀 단위로 확대해 만듦)"""
+        if self._labels is None:
+            height, width = self.shape
+            f = self.factor
+            upscaled = np.repeat(np.repeat(self.preview.labels, f, axis=0), f, axis=1)
+            self._labels = np.ascontiguousarray(upscaled[:height, :width])
+        return self._labels
+
+    @property
+    def label_map(self) -> LabelMap:
+        """현재 원본 크기 라벨 맵 (보정이 진행될수록 원본 해상도 결과에 가까워짐)"""
+        return LabelMap(self.labels, self.registry)
+
+    @property
+    def pending_boundary_tiles(self) -> int:
+        return len(self._boundary_tiles)
+
+    @property
+    def done(self) -> bool:
+        """경계 타일 보정 완료 여부"""
+        return not self._boundary_tiles
+
+    def preview_ratios(self) -> Dict[str, float]:
+        """미리보기 기준 타입별 비율"""
+        return AreaCalculator.calculate_pixel_ratios(self.preview)
+
+    def ratios(self) -> Dict[str, float]:
+        """현재 라벨 맵 기준 타입별 비율"""
+        return AreaCalculator.ratios_from_counts(self.counts, self.registry)
+
+    # 보정
+    def refine(self, max_tiles: Optional[int] = None, include_uniform: bool = False) -> Iterator[float]:
+        """
+        남은 타일을 원본 해상도로 보정 (타일마다 진행률 반환)
+
+        Args:
+            max_tiles: 이번 호출에서 보정할 최대 타일 수 (None 이면 모두)
+            include_uniform: 경계 타일 뒤에 균일 타일까지 보정할지 여부
+
+        Yields:
+            보정 대상 중 완료된 비율 (0~1)
+        """
+        queues = [self._boundary_tiles] + ([self._uniform_tiles] if include_uniform else [])
+        target = sum(len(q) for q in queues)
+        processed = 0
+
+        for queue in queues:
+            while queue and (max_tiles is None or processed < max_tiles):
+                self._refine_window(queue.pop())
+                processed += 1
+                yield processed / target
+
+    def refine_all(self, include_uniform: bool = False) -> 'ProgressiveSegmentation':
+        """남은 타일 모두 보정"""
+        for _ in self.refine(include_uniform=include_uniform):
+            pass
+        return self
+
+    def _refine_window(self, window: TileWindow):
+        """타일 하나를 원본 해상도로 분류해 라벨과 개수 갱신"""
+        y0, y1, x0, x1 = window.core
+        f = self.factor
+        refined = self.processor.segment_tile(self.source, window)
+
+        # 타일은 셀 경계에 맞춰져 있으므로 빠지는 개수는 미리보기 셀에서 바로 계산
+        self.counts -= self._cell_counts(y0 // f, -(-y1 // f), x0 // f, -(-x1 // f))
+        self.counts += count_ids(refined, self.registry.n_ids)
+        self.labels[y0:y1, x0:x1] = refined
+        self.refined_tiles += 1
@@ -0,0 +1,371 @@
+"""다년 탄소흡수량 전망 모듈 (시나리오별 계수 성장 + 타입 전환, 공원 x 연도 x 타입 배열 연산)"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .area_calculator import AREA_DTYPE
+from .label_map import ClassRegistry, DEFAULT_REGISTRY
+
+
+# 연도별 값: 매년 같은 값(숫자) 또는 연도 수 길이의 목록
+Curve = Union[float, Sequence[float]]
+
+
+def _curve(value: Curve, years: int, name: str) -> np.ndarray:
+    """숫자 또는 연도별 목록 → 길이 years 배열"""
+    array = np.asarray(value, dtype=np.float64)
+    if array.ndim == 0:
+        return np.full(years, float(array))
+    if array.shape != (years,):
+        raise ValueError(f"{name}: 연도별 값은 {years}개여야 합니다 (입력 {array.shape[0]}개)")
+    return array
+
+
+class Scenario:
+    """
+    전망 시나리오 (계수 성장 곡선 + 타입 전환율)
+
+    0년차는 현재 면적/계수이고, t년차 값은 다음과 같다.
+    - 계수: 기준 계수 x 성장 배율. 연 성장률 r 이면 배율 (1 + r)^t,
+      목록이면 연도별 배율을 그대로 쓴다 (0년차 포함, 길이 = years).
+    - 면적: 매년 말 {원래 타입: {바뀔 타입: 전환율}} 만큼 원래 타입 면적이 옮겨 간다.
+      전환율은 그해 초 면적 대비 비율이며 숫자(매년 같음) 또는 연도별 목록이다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        years: int = 30,
+        coef_growth: Optional[Mapping[str, Curve]] = None,
+        coef_multipliers: Optional[Mapping[str, Sequence[float]]] = None,
+        conversion: Optional[Mapping[str, Mapping[str, Curve]]] = None,
+        start_year: int = 0
+    ):
+        """
+        초기화
+
+        Args:
+            name: 시나리오 이름
+            years: 전망 기간 (0년차 포함 연도 수)
+            coef_growth: {타입: 연 성장률} (예: {'FOREST': 0.01}), 연도별 목록이면 해마다 다른 성장률
+            coef_multipliers: {타입: 연도별 계수 배율} (coef_growth 대신 곡선을 직접 지정)
+            conversion: {원래 타입: {바뀔 타입: 연 전환율}} (예: {'GRASS': {'BUILDING': 0.02}})
+            start_year: 0년차의 연도 (결과 years 축 표시용)
+        """
+        if years < 1:
+            raise ValueError("전망 기간은 1년 이상이어야 합니다")
+        self.name = name
+        self.years = int(years)
+        self.start_year = int(start_year)
+        self.coef_growth = {k: _curve(v, self.years, k) for k, v in (coef_growth or {}).items()}
+        self.coef_multipliers = {k: _curve(v, self.years, k) for k, v in (coef_multipliers or {}).items()}
+        self.conversion = {
+            source: {target: _curve(rate, self.years, f"{source}→{target}") for target, rate in targets.items()}
+            for source, targets in (conversion or {}).items()
+        }
+
+        overlap = set(self.coef_growth) & set(self.coef_multipliers)
+        if overlap:
+            raise ValueError(f"coef_growth 와 coef_multipliers 에 같은 타입이 있습니다: {sorted(overlap)}")
+        for source, targets in self.conversion.items():
+            rates = np.array(list(targets.values())) if targets else np.zeros((1, self.years))
+            if (rates < 0).any() or (rates.sum(axis=0) > 1 + 1e-12).any():
+                raise ValueError(f"{source}: 연 전환율은 0 이상이고 합계가 1 이하여야 합니다")
+
+    def __repr__(self) -> str:
+        return f"Scenario(name='{self.name}', years={self.years})"
+
+    def fingerprint(self) -> str:
+        """시나리오 내용 해시 (이름 제외, 메모이제이션 키)"""
+        config = {
+            'years': self.years,
+            'coef_growth': {k: v.tolist() for k, v in self.coef_growth.items()},
+            'coef_multipliers': {k: v.tolist() for k, v in self.coef_multipliers.items()},
+            'conversion': {s: {t: v.tolist() for t, v in ts.items()} for s, ts in self.conversion.items()},
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    def _type_index(self, names: Sequence[str], veg_type: str) -> int:
+        try:
+            return names.index(veg_type)
+        except ValueError:
+            raise KeyError(f"시나리오 '{self.name}' 의 타입 {veg_type} 이 레지스트리에 없습니다") from None
+
+    def growth_curve(self, names: Sequence[str]) -> np.ndarray:
+        """연도 x 타입 계수 배율 (0년차 = 1, 지정하지 않은 타입은 1)"""
+        names = list(names)
+        growth = np.ones((self.years, len(names)))
+        for veg_type, rate in self.coef_growth.items():
+            # t년차 배율 = 0..t-1년차 성장률의 누적곱
+            growth[1:, self._type_index(names, veg_type)] = np.cumprod(1.0 + rate[:-1])
+        for veg_type, multipliers in self.coef_multipliers.items():
+            growth[:, self._type_index(names, veg_type)] = multipliers
+        return growth
+
+    def cumulative_transitions(self, names: Sequence[str]) -> np.ndarray:
+        """
+        연도 x 타입 x 타입 누적 전환 행렬 C (0년차 면적 행 벡터 a 에 대해 t년차 면적 = a @ C[t])
+
+        C[0] = I, C[t] = C[t-1] @ T[t-1] (T = 그해 전환 행렬, 행 합 1).
+        연도 수만큼 타입 x 타입 행렬곱만 하므로 공원 수와 무관하다.
+        """
+        names = list(names)
+        n_types = len(names)
+        transitions = np.broadcast_to(np.eye(n_types), (self.years, n_types, n_types)).copy()
+        for source, targets in self.conversion.items():
+            i = self._type_index(names, source)
+            for target, rate in targets.items():
+                j = self._type_index(names, target)
+                transitions[:, i, i] -= rate
+                transitions[:, i, j] += rate
+
+        cumulative = np.empty_like(transitions)
+        cumulative[0] = np.eye(n_types)
+        for t in range(1, self.years):
+            np.matmul(cumulative[t - 1], transitions[t - 1], out=cumulative[t])
+        return cumulative
+
+
+def project_areas(areas_m2: np.ndarray, cumulative: np.ndarray) -> np.ndarray:
+    """
+    (공원 x 타입) 0년차 면적 → 공원 x 연도 x 타입 면적
+
+    누적 전환 행렬을 타입 x (연도·타입) 로 펼쳐 행렬곱 한 번으로 모든 공원/연도를 계산한다.
+    """
+    years, n_types, _ = cumulative.shape
+    flat = cumulative.transpose(1, 0, 2).reshape(n_types, years * n_types)
+    return (areas_m2 @ flat).reshape(len(areas_m2), years, n_types)
+
+
+class Projection:
+    """
+    한 시나리오의 공원 x 연도 x 타입 전망 결과 (배열은 캐시에서 공유하므로 읽기 전용)
+
+    흡수량(by_type)만 보관하고, 연도별 면적은 0년차 면적 x 누적 전환 행렬로 필요할 때 다시 계산한다.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        base_areas_m2: np.ndarray,
+        cumulative: np.ndarray,
+        by_type: np.ndarray,
+        registry: ClassRegistry
+    ):
+        """
+        초기화
+
+        Args:
+            scenario: 시나리오
+            base_areas_m2: 공원 x 타입 0년차 면적 (㎡)
+            cumulative: 연도 x 타입 x 타입 누적 전환 행렬 (Scenario.cumulative_transitions)
+            by_type: 공원 x 연도 x 타입 흡수량 (tCO2/yr)
+            registry: 타입 레지스트리
+        """
+        self.scenario = scenario
+        self.base_areas_m2 = base_areas_m2
+        self.cumulative = cumulative
+        self.by_type = by_type
+        self.registry = registry
+        self.has_area = (base_areas_m2 != 0).any(axis=1)
+        for array in (base_areas_m2, cumulative, by_type):
+            array.setflags(write=False)
+
+    @property
+    def nbytes(self) -> int:
+        return self.by_type.nbytes + self.cumulative.nbytes
+
+    @property
+    def areas_m2(self) -> np.ndarray:
+        """공원 x 연도 x 타입 면적 (㎡)"""
+        return project_areas(self.base_areas_m2, self.cumulative)
+
+    def __repr__(self) -> str:
+        parks, years, _ = self.by_type.shape
+        return f"Projection(scenario='{self.scenario.name}', parks={parks}, years={years})"
+
+    @property
+    def years(self) -> np.ndarray:
+        """연도 축 (start_year 부터)"""
+        return self.scenario.start_year + np.arange(self.scenario.years)
+
+    @property
+    def total_tco2_yr(self) -> np.ndarray:
+        """공원 x 연도 연간 흡수량 (면적이 없는 공원은 NaN)"""
+        return np.where(self.has_area[:, None], self.by_type.sum(axis=2), np.nan)
+
+    @property
+    def cumulative_tco2(self) -> np.ndarray:
+        """공원 x 연도 누적 흡수량 (0년차부터 그해까지 합계)"""
+        return np.cumsum(self.total_tco2_yr, axis=1)
+
+    @property
+    def portfolio_tco2_yr(self) -> np.ndarray:
+        """전체 공원 연도별 흡수량"""
+        return self.by_type.sum(axis=(0, 2))
+
+    def to_frame(self, park_ids: Optional[Sequence] = None) -> pd.DataFrame:
+        """
+        긴 형식 DataFrame (park, year, vegetation_type, area_m2, tco2_yr)
+
+        Args:
+            park_ids: 공원 식별자 (None 이면 0 부터 번호)
+        """
+        parks, years, n_types = self.by_type.shape
+        park_ids = np.arange(parks) if park_ids is None else np.asarray(park_ids)
+        return pd.DataFrame({
+            'park': np.repeat(park_ids, years * n_types),
+            'year': np.tile(np.repeat(self.years, n_types), parks),
+            'vegetation_type': np.tile(np.array(self.registry.names), parks * years),
+            'area_m2': self.areas_m2.ravel(),
+            'tco2_yr': self.by_type.ravel(),
+        })
+
+
+class ProjectionEngine:
+    """
+    CarbonCalculator 계수 기반 다년 전망 (시나리오별 결과 메모이제이션, 스레드 안전)
+
+    공원 x 타입 면적 행렬과 (타입 x 연도·타입) 누적 전환 행렬을 한 번 곱해 모든 공원/연도 면적을 만들고,
+    (연도 x 타입) 계수 곡선을 곱해 흡수량을 구한다. 같은 면적/시나리오/계수 파일/조회 키로 다시 부르면
+    캐시된 결과를 돌려준다. 시나리오 이름은 키에 넣지 않으므로 내용이 같으면 결과 배열을 공유한다.
+    캐시 배열 합계가 cache_bytes 를 넘으면 가장 오래 쓰지 않은 결과부터 버린다
+    (공원 1만 곳 x 30년 x 8타입이면 결과 하나가 약 19 MiB).
+    """
+
+    def __init__(
+        self,
+        calculator,
+        registry: ClassRegistry = DEFAULT_REGISTRY,
+        cache_bytes: int = 1 << 30
+    ):
+        """
+        초기화
+
+        Args:
+            calculator: CarbonCalculator (계수 테이블/다중 키 인덱스)
+            registry: 타입 레지스트리
+            cache_bytes: 캐시에 보관할 최대 결과 배열 크기 (바이트)
+        """
+        self.calculator = calculator
+        self.registry = registry
+        self.cache_bytes = cache_bytes
+        self._cache: 'OrderedDict[tuple, Projection]' = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (f"ProjectionEngine(cached={len(self._cache)}, {self._cached_bytes / 2**20:.0f} MiB, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    def _prepare(self, areas_m2, keys) -> tuple:
+        """면적 배열 정리 + 기준 계수 + 캐시 키 공통부"""
+        if isinstance(areas_m2, np.ndarray) and areas_m2.dtype == AREA_DTYPE:
+            areas_m2 = areas_m2['area_m2']
+        areas = np.atleast_2d(np.asarray(areas_m2, dtype=np.float64))
+        if areas.shape[1] != len(self.registry.names):
+            raise ValueError(f"면적 배열은 공원 x {len(self.registry.names)}개 타입이어야 합니다")
+
+        calculator = self.calculator
+        if keys is not None and calculator.index is not None:
+            coef, _ = calculator.index.coefficient_matrix(self.registry, keys)
+            if isinstance(keys, pd.DataFrame):
+                keys = keys.to_dict('list')
+            keys_digest = json.dumps({k: [str(v) for v in values] for k, values in keys.items()}, sort_keys=True)
+        else:
+            coef = calculator.table.for_registry(self.registry)[1:]
+            keys_digest = None
+
+        digest = hashlib.sha256(areas.tobytes())
+        digest.update(repr(areas.shape).encode())
+        base_key = (
+            digest.hexdigest(), calculator.coefficients_digest, calculator.table.version,
+            keys_digest, tuple(self.registry.names)
+        )
+        # 면적을 모르는 칸은 0 ㎡, 계수가 없는 타입은 흡수량 0 으로 전망
+        return np.nan_to_num(areas), np.nan_to_num(coef), base_key
+
+    def _compute(self, areas: np.ndarray, coef: np.ndarray, scenario: Scenario) -> Projection:
+        cumulative = scenario.cumulative_transitions(self.registry.names)
+        by_type = project_areas(areas, cumulative)                     # 공원 x 연도 x 타입 면적
+
+        coef_t = scenario.growth_curve(self.registry.names) / 1000     # 연도 x 타입 (kg → t)
+        if coef.ndim == 2:
+            by_type *= coef[:, None, :]                                 # 공원별 계수 (다중 키)
+            by_type *= coef_t
+        else:
+            by_type *= coef * coef_t
+        return Projection(scenario, areas, cumulative, by_type, self.registry)
+
+    def project(
+        self,
+        areas_m2: np.ndarray,
+        scenario: Scenario,
+        keys: Optional[Mapping[str, Sequence]] = None
+    ) -> Projection:
+        """
+        한 시나리오 전망
+
+        Args:
+            areas_m2: 공원 x 타입 면적 (㎡, registry.names 순서, AREA_DTYPE 가능)
+            scenario: 시나리오
+            keys: 다중 키 계수 조회 키 (CarbonCalculator.calculate_carbon_batch 참고)
+        """
+        return self.project_many(areas_m2, [scenario], keys)[scenario.name]
+
+    def project_many(
+        self,
+        areas_m2: np.ndarray,
+        scenarios: Iterable[Scenario],
+        keys: Optional[Mapping[str, Sequence]] = None
+    ) -> Dict[str, Projection]:
+        """
+        여러 시나리오 전망 (면적 정리/기준 계수 조인은 한 번만 하고, 캐시에 없는 시나리오만 계산)
+
+        Returns:
+            {시나리오 이름: Projection}
+        """
+        areas, coef, base_key = self._prepare(areas_m2, keys)
+
+        results = {}
+        for scenario in scenarios:
+            key = base_key + (scenario.fingerprint(),)
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+            if cached is not None:
+                # 내용이 같은 시나리오를 다른 이름으로 부르면 결과 배열을 공유
+                if cached.scenario is not scenario:
+                    cached = Projection(
+                        scenario, cached.base_areas_m2, cached.cumulative, cached.by_type, self.registry
+                    )
+                results[scenario.name] = cached
+                continue
+
+            projection = self._compute(areas, coef, scenario)
+            with self._lock:
+                self.misses += 1
+                if key not in self._cache:
+                    self._cache[key] = projection
+                    self._cached_bytes += projection.nbytes
+                while self._cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cached_bytes -= evicted.nbytes
+            results[scenario.name] = projection
+        return results
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+            self._cached_bytes = 0
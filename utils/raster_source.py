@@ -0,0 +1,237 @@
+"""대형 정사영상 타일 소스 모듈 (GeoTIFF 창 읽기 / raw 메모리 맵)"""
+
+import math
+import mmap
+from pathlib import Path
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.windows import Window
+except ImportError:  # 선택 의존성
+    rasterio = None
+
+
+RASTER_SUFFIXES = ('.tif', '.tiff')
+
+
+def raster_supported() -> bool:
+    """GeoTIFF 읽기 가능 여부 (rasterio 설치 여부)"""
+    return rasterio is not None
+
+
+def _require_rasterio():
+    if rasterio is None:
+        raise ImportError("GeoTIFF 를 읽으려면 rasterio 를 설치하세요: pip install rasterio")
+
+
+def _to_uint8(bands: np.ndarray) -> np.ndarray:
+    """(밴드, H, W) → RGB uint8 (H, W, 3)"""
+    if bands.dtype == np.uint16:
+        bands = (bands >> 8).astype(np.uint8)
+    elif bands.dtype != np.uint8:
+        raise ValueError(f"지원하지 않는 픽셀 형식입니다: {bands.dtype} (uint8/uint16 만 지원)")
+    return np.ascontiguousarray(bands.transpose(1, 2, 0))
+
+
+def ground_sampling_distance(dataset) -> Optional[Tuple[float, float]]:
+    """
+    지리 참조에서 픽셀 한 칸의 지상 크기 (가로 m, 세로 m)
+
+    투영 좌표계는 좌표 단위를 미터로 환산하고, 경위도 좌표계는 영상 중심 위도에서
+    WGS84 타원체 기준 1도 길이로 환산한다 (공원 규모에서는 위도에 따른 차이가 작음).
+    지리 참조가 없으면 None.
+    """
+    crs = dataset.crs
+    transform = dataset.transform
+    if crs is None or transform.is_identity:
+        return None
+
+    # 회전이 있는 변환도 고려한 픽셀 한 변 길이 (좌표 단위)
+    size_x = math.hypot(transform.a, transform.d)
+    size_y = math.hypot(transform.b, transform.e)
+
+    if crs.is_geographic:
+        _, lat = transform * (dataset.width / 2, dataset.height / 2)
+        phi = math.radians(lat)
+        m_per_deg_lat = 111132.92 - 559.82 * math.cos(2 * phi) + 1.175 * math.cos(4 * phi)
+        m_per_deg_lon = 111412.84 * math.cos(phi) - 93.5 * math.cos(3 * phi)
+        return size_x * m_per_deg_lon, size_y * m_per_deg_lat
+
+    factor = crs.linear_units_factor[1]
+    return size_x * factor, size_y * factor
+
+
+class RasterTileSource:
+    """
+    GeoTIFF 창 단위 타일 소스 (rasterio)
+
+    read() 는 요청한 창의 블록만 디코딩하므로 상주 메모리는 타일 크기 + GDAL 블록 캐시
+    (GDAL_CACHEMAX) 로 제한되고 파일 크기와 무관하다.
+    segment_tiled / segment_progressive / estimate_ratios 에 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, path, bands: Optional[Tuple[int, ...]] = None, gsd_m: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            path: GeoTIFF 경로
+            bands: RGB 로 쓸 밴드 번호 (None 이면 3밴드 이상은 (1, 2, 3), 1밴드는 회색조)
+            gsd_m: 픽셀 지상 크기 (m). 지정하면 지리 참조 대신 사용
+        """
+        _require_rasterio()
+
+        self.path = Path(path)
+        self.dataset = rasterio.open(self.path)
+        if bands is None:
+            bands = (1, 2, 3) if self.dataset.count >= 3 else (1, 1, 1)
+        self.bands = tuple(bands)
+        self.gsd = (gsd_m, gsd_m) if gsd_m else ground_sampling_distance(self.dataset)
+
+    def __repr__(self) -> str:
+        return f"RasterTileSource(path='{self.path.name}', shape={self.shape}, gsd={self.gsd})"
+
+    def __enter__(self) -> 'RasterTileSource':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.dataset.close()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(높이, 너비)"""
+        return self.dataset.height, self.dataset.width
+
+    @property
+    def pixel_area_m2(self) -> Optional[float]:
+        """픽셀 한 칸의 지상 면적 (㎡)"""
+        return self.gsd[0] * self.gsd[1] if self.gsd else None
+
+    @property
+    def area_m2(self) -> Optional[float]:
+        """영상 전체가 덮는 지상 면적 (㎡, 지리 참조가 없으면 None)"""
+        pixel_area = self.pixel_area_m2
+        return pixel_area * self.shape[0] * self.shape[1] if pixel_area else None
+
+    def read(self, y0: int, y1: int, x0: int, x1: int) -> np.ndarray:
+        """창 영역 RGB 읽기"""
+        window = Window(x0, y0, x1 - x0, y1 - y0)
+        return _to_uint8(self.dataset.read(self.bands, window=window))
+
+    def read_resized(self, size: Tuple[int, int]) -> np.ndarray:
+        """
+        전체 영상을 size (너비, 높이) 로 축소해 읽기
+
+        오버뷰(피라미드)가 있으면 GDAL 이 가장 가까운 오버뷰에서 읽으므로 원본 전체를 디코딩하지 않는다.
+        """
+        width, height = size
+        bands = self.dataset.read(
+            self.bands, out_shape=(len(self.bands), height, width), resampling=Resampling.average
+        )
+        return _to_uint8(bands)
+
+
+class RawTileSource:
+    """
+    헤더 없는 RGB 인터리브 uint8 raw 파일을 메모리 맵한 타일 소스
+
+    창을 읽은 뒤 해당 행 범위의 페이지를 매핑에서 내려놓아(MADV_DONTNEED)
+    상주 메모리가 파일 크기가 아니라 타일 크기에 비례하도록 한다.
+    """
+
+    def __init__(self, path, shape: Tuple[int, int], offset: int = 0, gsd_m: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            path: raw 파일 경로
+            shape: (높이, 너비)
+            offset: 픽셀 데이터 시작 위치 (바이트)
+            gsd_m: 픽셀 지상 크기 (m)
+        """
+        self.path = Path(path)
+        height, width = shape
+        self._row_bytes = width * 3
+        self._offset = offset
+        size = offset + height * self._row_bytes
+
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        self.image = np.frombuffer(self._mmap, dtype=np.uint8, count=height * self._row_bytes,
+                                   offset=offset).reshape(height, width, 3)
+        self.gsd = (gsd_m, gsd_m) if gsd_m else None
+
+    def __repr__(self) -> str:
+        return f"RawTileSource(path='{self.path.name}', shape={self.shape}, gsd={self.gsd})"
+
+    def __enter__(self) -> 'RawTileSource':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.image = None
+        self._mmap.close()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(높이, 너비)"""
+        return self.image.shape[:2]
+
+    @property
+    def pixel_area_m2(self) -> Optional[float]:
+        return self.gsd[0] * self.gsd[1] if self.gsd else None
+
+    @property
+    def area_m2(self) -> Optional[float]:
+        pixel_area = self.pixel_area_m2
+        return pixel_area * self.shape[0] * self.shape[1] if pixel_area else None
+
+    def read(self, y0: int, y1: int, x0: int, x1: int) -> np.ndarray:
+        """창 영역 RGB 읽기 (복사본)"""
+        tile = self.image[y0:y1, x0:x1].copy()
+        self._release_rows(y0, y1)
+        return tile
+
+    def read_resized(self, size: Tuple[int, int], band_rows: int = 256) -> np.ndarray:
+        """전체 영상을 size (너비, 높이) 로 축소해 읽기 (행 띠 단위, 띠마다 페이지 해제)"""
+        height, width = self.shape
+        out_width, out_height = size
+        # 띠 경계에서 출력 행이 나뉘지 않도록 띠 높이를 출력 한 행 높이의 배수로 맞춤
+        step = height / out_height
+        rows_per_band = max(1, round(band_rows / step))
+        resized = np.empty((out_height, out_width, 3), dtype=np.uint8)
+        for oy0 in range(0, out_height, rows_per_band):
+            oy1 = min(oy0 + rows_per_band, out_height)
+            y0, y1 = int(oy0 * step), min(height, math.ceil(oy1 * step))
+            band = self.read(y0, y1, 0, width)
+            resized[oy0:oy1] = cv2.resize(band, (out_width, oy1 - oy0), interpolation=cv2.INTER_AREA)
+        return resized
+
+    def _release_rows(self, y0: int, y1: int):
+        """행 범위에 해당하는 매핑 페이지 내려놓기 (페이지 경계에 맞춤)"""
+        start = self._offset + y0 * self._row_bytes
+        end = self._offset + y1 * self._row_bytes
+        start -= start % mmap.PAGESIZE
+        if end > start:
+            self._mmap.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+def open_raster(path, **options):
+    """
+    경로 확장자에 맞는 타일 소스 열기
+
+    .tif/.tiff 는 RasterTileSource, 그 밖에는 RawTileSource (shape 필요).
+    """
+    if Path(path).suffix.lower() in RASTER_SUFFIXES:
+        return RasterTileSource(path, **options)
+    return RawTileSource(path, **options)
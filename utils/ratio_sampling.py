@@ -0,0 +1,230 @@
+"""표본 추출 기반 타입 비율 추정 모듈 (신뢰구간 + 목표 정밀도 도달 시 중단)"""
+
+from statistics import NormalDist
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .area_calculator import AreaCalculator
+from .label_map import ClassRegistry, count_ids
+from .tiling import MORPH_HALO, ArrayTileSource, TileWindow
+
+
+class RatioEstimate:
+    """
+    타입별 비율 추정치 + 공분산
+
+    비율은 층화 표본 평균, 공분산은 층별 표본 공분산을 층 가중치로 합친 값이다.
+    타입 간 공분산(한 타입이 늘면 다른 타입이 줄어듦)을 함께 보관하므로
+    탄소흡수량처럼 비율의 선형 결합에도 신뢰구간을 그대로 전파할 수 있다.
+    """
+
+    def __init__(
+        self,
+        registry: ClassRegistry,
+        ratios: np.ndarray,
+        covariance: np.ndarray,
+        confidence: float,
+        sampled_tiles: int,
+        sampled_pixels: int,
+        converged: bool
+    ):
+        """
+        초기화
+
+        Args:
+            registry: 타입 레지스트리
+            ratios: ID별 비율 (인덱스 0 = 미분류)
+            covariance: ID별 비율 추정치의 공분산 행렬 (n_ids x n_ids)
+            confidence: 신뢰수준 (예: 0.95)
+            sampled_tiles: 분류한 표본 타일 수
+            sampled_pixels: 분류한 픽셀 수
+            converged: 목표 정밀도 도달 여부
+        """
+        self.registry = registry
+        self.ratio_array = ratios
+        self.covariance = covariance
+        self.confidence = confidence
+        self.sampled_tiles = sampled_tiles
+        self.sampled_pixels = sampled_pixels
+        self.converged = converged
+
+    def __repr__(self) -> str:
+        return (f"RatioEstimate(tiles={self.sampled_tiles}, max_half_width={self.max_half_width:.4f}, "
+                f"confidence={self.confidence}, converged={self.converged})")
+
+    @property
+    def z(self) -> float:
+        """양측 신뢰수준에 해당하는 정규분포 분위수"""
+        return NormalDist().inv_cdf((1 + self.confidence) / 2)
+
+    @property
+    def half_width_array(self) -> np.ndarray:
+        """ID별 신뢰구간 반폭"""
+        return self.z * np.sqrt(np.maximum(np.diag(self.covariance), 0))
+
+    @property
+    def max_half_width(self) -> float:
+        """타입 중 가장 넓은 신뢰구간 반폭 (미분류 제외)"""
+        return float(self.half_width_array[1:].max()) if self.registry.n_ids > 1 else 0.0
+
+    @property
+    def ratios(self) -> Dict[str, float]:
+        """타입별 비율 (AreaCalculator.calculate_pixel_ratios 와 같은 형식)"""
+        return {name: float(self.ratio_array[self.registry.id_of(name)]) for name in self.registry.names}
+
+    @property
+    def intervals(self) -> Dict[str, Tuple[float, float]]:
+        """타입별 비율 신뢰구간 (0~1 로 자름)"""
+        half = self.half_width_array
+        return {
+            name: (
+                max(0.0, float(self.ratio_array[i] - half[i])),
+                min(1.0, float(self.ratio_array[i] + half[i]))
+            )
+            for name, i in ((name, self.registry.id_of(name)) for name in self.registry.names)
+        }
+
+    def linear_interval(self, weights: Dict[str, float]) -> Tuple[float, float, float]:
+        """
+        비율의 선형 결합 sum(weights[타입] * 비율) 의 (추정치, 하한, 상한)
+
+        Args:
+            weights: 타입별 가중치 (없는 타입은 0)
+        """
+        w = np.zeros(self.registry.n_ids)
+        for name, value in weights.items():
+            if name in self.registry:
+                w[self.registry.id_of(name)] = value
+        estimate = float(w @ self.ratio_array)
+        half = self.z * float(np.sqrt(max(w @ self.covariance @ w, 0.0)))
+        return estimate, estimate - half, estimate + half
+
+    def areas(self, total_area_m2: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        AreaCalculator.calculate_areas 결과 + 타입별 신뢰구간
+
+        각 타입에 'ratio_ci' (비율 하한, 상한) 와 'area_m2_ci' (면적이 있으면) 를 더한다.
+        """
+        areas = AreaCalculator.calculate_areas(self.ratios, total_area_m2)
+        for name, (low, high) in self.intervals.items():
+            areas[name]['ratio_ci'] = (low, high)
+            areas[name]['area_m2_ci'] = (
+                (total_area_m2 * low, total_area_m2 * high) if total_area_m2 else None
+            )
+        return areas
+
+
+def _strata(height: int, width: int, grid: int):
+    """이미지를 grid x grid 층으로 나눈 (y0, y1, x0, x1) 목록 (빈 층 제외)"""
+    ys = np.linspace(0, height, min(grid, height) + 1).astype(int)
+    xs = np.linspace(0, width, min(grid, width) + 1).astype(int)
+    return [
+        (ys[i], ys[i + 1], xs[j], xs[j + 1])
+        for i in range(len(ys) - 1) for j in range(len(xs) - 1)
+        if ys[i + 1] > ys[i] and xs[j + 1] > xs[j]
+    ]
+
+
+def estimate_ratios(
+    processor,
+    source,
+    target_half_width: float = 0.01,
+    confidence: float = 0.95,
+    tile_size: int = 32,
+    strata_grid: int = 8,
+    min_rounds: int = 2,
+    max_tiles: Optional[int] = None,
+    seed: int = 0
+) -> RatioEstimate:
+    """
+    층화 무작위 타일 표본으로 타입별 비율 추정
+
+    이미지를 strata_grid x strata_grid 층으로 나누고, 한 라운드마다 층별로 중심이 층 안에서
+    무작위인 타일 1개씩을 기존 규칙(노이즈 제거 포함)으로 분류한다.
+    모든 타입의 신뢰구간 반폭이 target_half_width 이하가 되면 멈추므로,
+    분류량은 이미지 크기가 아니라 요구 정밀도에 비례한다 (대략 1 / 정밀도^2).
+
+    Args:
+        processor: ImageProcessor (분류 규칙/레지스트리)
+        source: RGB 배열 또는 shape / read(y0, y1, x0, x1) 를 가진 타일 소스
+        target_half_width: 목표 신뢰구간 반폭 (비율 단위, 0.01 = ±1%p)
+        confidence: 신뢰수준
+        tile_size: 표본 타일 한 변 길이
+        strata_grid: 층 격자 한 변 개수
+        min_rounds: 분산 추정을 위한 최소 라운드 수 (2 이상)
+        max_tiles: 분류할 최대 타일 수 (None 이면 제한 없음, 이미지 면적을 넘지 않음)
+        seed: 난수 시드
+
+    Returns:
+        RatioEstimate
+    """
+    if isinstance(source, np.ndarray):
+        source = ArrayTileSource(source)
+
+    registry = processor.registry
+    height, width = source.shape
+    strata = _strata(height, width, strata_grid)
+    weights = np.array([(y1 - y0) * (x1 - x0) for y0, y1, x0, x1 in strata], dtype=np.float64)
+    weights /= weights.sum()
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rng = np.random.default_rng(seed)
+    half = tile_size // 2
+    min_rounds = max(2, min_rounds)
+    max_rounds = -(-height * width // (len(strata) * tile_size * tile_size))
+    if max_tiles is not None:
+        max_rounds = min(max_rounds, max(min_rounds, max_tiles // len(strata)))
+    max_rounds = max(min_rounds, max_rounds)
+
+    # samples[라운드, 층, ID] = 표본 타일의 ID별 비율
+    samples = np.zeros((max_rounds, len(strata), registry.n_ids), dtype=np.float64)
+    sampled_pixels = 0
+    rounds = 0
+    converged = False
+
+    while rounds < max_rounds:
+        for s, (sy0, sy1, sx0, sx1) in enumerate(strata):
+            cy = int(rng.integers(sy0, sy1))
+            cx = int(rng.integers(sx0, sx1))
+            core = (max(0, cy - half), min(height, cy - half + tile_size),
+                    max(0, cx - half), min(width, cx - half + tile_size))
+            padded = (max(0, core[0] - MORPH_HALO), min(height, core[1] + MORPH_HALO),
+                      max(0, core[2] - MORPH_HALO), min(width, core[3] + MORPH_HALO))
+            labels = processor.segment_tile(source, TileWindow(s, core, padded))
+            samples[rounds, s] = count_ids(labels, registry.n_ids) / labels.size
+            sampled_pixels += labels.size
+        rounds += 1
+
+        if rounds < min_rounds:
+            continue
+        ratios, covariance = _stratified_moments(samples[:rounds], weights)
+        if z * np.sqrt(np.maximum(np.diag(covariance)[1:], 0)).max() <= target_half_width:
+            converged = True
+            break
+
+    ratios, covariance = _stratified_moments(samples[:rounds], weights)
+    return RatioEstimate(
+        registry, ratios, covariance, confidence, rounds * len(strata), sampled_pixels, converged
+    )
+
+
+def _stratified_moments(samples: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    층화 평균과 그 공분산
+
+    Args:
+        samples: (라운드, 층, ID) 표본 비율
+        weights: 층 면적 가중치 (합 1)
+
+    Returns:
+        (ID별 비율, 공분산 행렬)
+    """
+    n = samples.shape[0]
+    means = samples.mean(axis=0)                      # (층, ID)
+    ratios = weights @ means
+    centered = samples - means                         # (라운드, 층, ID)
+    # 층별 표본 공분산 / n 을 층 가중치 제곱으로 합침
+    per_stratum = np.einsum('rsi,rsj->sij', centered, centered) / (n - 1)
+    covariance = np.einsum('s,sij->ij', weights ** 2 / n, per_stratum)
+    return ratios, covariance
@@ -0,0 +1,151 @@
+"""타일 단위 세그멘테이션 모듈 (대형 정사영상용)"""
+
+import numpy as np
+from typing import Dict, Iterator, Optional, Tuple
+
+from .label_map import LabelMap, ClassRegistry
+
+
+# 3x3 열림 연산(침식 + 팽창)이 참조하는 최대 거리
+MORPH_HALO = 2
+
+
+class ArrayTileSource:
+    """메모리에 올라온 RGB 배열을 타일 소스로 감싼 클래스"""
+
+    def __init__(self, image: np.ndarray):
+        self.image = image
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(높이, 너비)"""
+        return self.image.shape[:2]
+
+    def read(self, y0: int, y1: int, x0: int, x1: int) -> np.ndarray:
+        """창 영역 RGB 읽기"""
+        return self.image[y0:y1, x0:x1]
+
+
+class TileWindow:
+    """타일 창 (core: 결과에 반영할 영역, padded: halo 를 포함해 읽을 영역)"""
+
+    __slots__ = ('index', 'core', 'padded')
+
+    def __init__(self, index: int, core: Tuple[int, int, int, int], padded: Tuple[int, int, int, int]):
+        self.index = index
+        self.core = core
+        self.padded = padded
+
+    def __repr__(self) -> str:
+        return f"TileWindow(index={self.index}, core={self.core}, padded={self.padded})"
+
+    def crop_core(self, array: np.ndarray) -> np.ndarray:
+        """padded 영역 배열에서 core 부분만 잘라내기"""
+        y0, y1, x0, x1 = self.core
+        py0, _, px0, _ = self.padded
+        return array[y0 - py0:y1 - py0, x0 - px0:x1 - px0]
+
+
+def iter_tiles(
+    height: int,
+    width: int,
+    tile_size: int = 1024,
+    halo: int = MORPH_HALO
+) -> Iterator[TileWindow]:
+    """
+    이미지를 tile_size 격자로 나눈 타일 창 (행 우선 순서)
+
+    Args:
+        height: 이미지 높이
+        width: 이미지 너비
+        tile_size: 타일 한 변 길이 (halo 제외)
+        halo: 타일 경계 바깥으로 더 읽을 픽셀 수
+    """
+    index = 0
+    for y0 in range(0, height, tile_size):
+        y1 = min(y0 + tile_size, height)
+        for x0 in range(0, width, tile_size):
+            x1 = min(x0 + tile_size, width)
+            padded = (
+                max(0, y0 - halo), min(height, y1 + halo),
+                max(0, x0 - halo), min(width, x1 + halo)
+            )
+            yield TileWindow(index, (y0, y1, x0, x1), padded)
+            index += 1
+
+
+class TiledSegmentation:
+    """
+    타일 세그멘테이션 결과
+
+    기본으로는 전체 라벨 맵 대신 ID별 픽셀 수와 (선택) 축소 라벨 맵만 보관한다.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        counts: np.ndarray,
+        registry: ClassRegistry,
+        preview: Optional[LabelMap] = None,
+        preview_factor: int = 1,
+        label_map: Optional[LabelMap] = None,
+        overlay: Optional[np.ndarray] = None
+    ):
+        """
+        초기화
+
+        Args:
+            shape: 원본 (높이, 너비)
+            counts: ID별 픽셀 수 (인덱스 0 = 미분류)
+            registry: 타입 레지스트리
+            preview: 축소 라벨 맵 (preview_factor 간격 샘플)
+            preview_factor: 축소 배율
+            label_map: 원본 크기 라벨 맵 (keep_labels 사용 시)
+            overlay: 원본 크기 오버레이 (overlay_alpha 사용 시)
+        """
+        self.shape = tuple(shape)
+        self.counts = counts
+        self.registry = registry
+        self.preview = preview
+        self.preview_factor = preview_factor
+        self.label_map = label_map
+        self.overlay = overlay
+
+    def __repr__(self) -> str:
+        return f"TiledSegmentation(shape={self.shape}, preview_factor={self.preview_factor})"
+
+    @property
+    def total_pixels(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    def ratios(self) -> Dict[str, float]:
+        """타입별 비율 (AreaCalculator.calculate_pixel_ratios 와 같은 형식)"""
+        return {
+            veg_type: int(self.counts[self.registry.id_of(veg_type)]) / self.total_pixels
+            for veg_type in self.registry.names
+        }
+
+
+def preview_shape(height: int, width: int, factor: int) -> Tuple[int, int]:
+    """factor 간격 샘플링 시 축소 라벨 맵 크기"""
+    return (height + factor - 1) // factor, (width + factor - 1) // factor
+
+
+def preview_factor_for(height: int, width: int, max_size: int) -> int:
+    """긴 변이 max_size 이하가 되는 최소 정수 축소 배율"""
+    return max(1, -(-max(height, width) // max_size))
+
+
+def write_preview(preview: np.ndarray, window: TileWindow, core_labels: np.ndarray, factor: int):
+    """
+    타일 core 라벨을 축소 라벨 맵에 기록 (전역 좌표 기준 factor 간격 최근접 샘플)
+
+    타일 경계가 factor 배수가 아니어도 전체 이미지를 한 번에 [::factor] 한 결과와 같다.
+    """
+    y0, _, x0, _ = window.core
+    oy = -y0 % factor
+    ox = -x0 % factor
+    sampled = core_labels[oy::factor, ox::factor]
+    py = (y0 + oy) // factor
+    px = (x0 + ox) // factor
+    preview[py:py + sampled.shape[0], px:px + sampled.shape[1]] = sampled
@@ -0,0 +1,170 @@
+"""탄소흡수량 불확실성 모듈 (계수/비율 분포 몬테카를로, 표본 x 타입 x 공원 배열 연산)"""
+
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .label_map import ClassRegistry
+
+
+# 분포 종류 → 인자 개수 (모두 점추정 계수에 곱하는 상대 배율의 분포)
+#   normal: (상대 표준편차,)            평균 1, 0 미만은 0 으로 자름
+#   lognormal: (로그 표준편차,)          중앙값 1
+#   uniform: (하한, 상한)
+#   triangular: (하한, 최빈값, 상한)
+DISTRIBUTIONS = {'normal': 1, 'lognormal': 1, 'uniform': 2, 'triangular': 3}
+
+DEFAULT_PERCENTILES = (2.5, 50.0, 97.5)
+
+Distribution = Tuple
+
+
+def _validate(spec: Mapping[str, Distribution]):
+    for veg_type, (kind, *params) in spec.items():
+        if kind not in DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 분포입니다: {kind} (지원: {list(DISTRIBUTIONS)})")
+        if len(params) != DISTRIBUTIONS[kind]:
+            raise ValueError(f"{veg_type}: {kind} 분포 인자는 {DISTRIBUTIONS[kind]}개여야 합니다")
+
+
+def sample_multipliers(
+    spec: Mapping[str, Distribution],
+    names: Sequence[str],
+    n_samples: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    타입별 계수 배율 표본 (n_samples x 타입 수, 분포가 없는 타입은 1)
+
+    타입마다 분포 하나로 한 번에 뽑으므로 표본 수만큼 반복하지 않는다.
+    """
+    _validate(spec)
+    multipliers = np.ones((n_samples, len(names)))
+    for k, veg_type in enumerate(names):
+        if veg_type not in spec:
+            continue
+        kind, *params = spec[veg_type]
+        if kind == 'normal':
+            np.maximum(rng.normal(1.0, params[0], n_samples), 0, out=multipliers[:, k])
+        elif kind == 'lognormal':
+            multipliers[:, k] = rng.lognormal(0.0, params[0], n_samples)
+        elif kind == 'uniform':
+            multipliers[:, k] = rng.uniform(params[0], params[1], n_samples)
+        else:
+            multipliers[:, k] = rng.triangular(params[0], params[1], params[2], n_samples)
+    return multipliers
+
+
+def sorted_percentiles(samples: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    마지막 축 백분위 (np.percentile 의 linear 방식, samples 를 제자리 정렬함)
+
+    표본이 많으면 여러 순위를 고르는 np.partition 보다 한 번 정렬하는 쪽이 빠르다.
+
+    Returns:
+        samples.shape[:-1] + (Q,)
+    """
+    samples.sort(axis=-1)
+    position = q / 100 * (samples.shape[-1] - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, samples.shape[-1] - 1)
+    fraction = position - lower
+    low = samples[..., lower]
+    return low + (samples[..., upper] - low) * fraction
+
+
+def monte_carlo_carbon(
+    carbon_by_type: np.ndarray,
+    registry: ClassRegistry,
+    spec: Mapping[str, Distribution],
+    n_samples: int = 10000,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ratio_sd: Union[None, float, np.ndarray] = None,
+    seed: Optional[int] = 0,
+    chunk_elements: int = 1 << 24
+) -> Dict[str, np.ndarray]:
+    """
+    공원 x 타입 점추정 흡수량에 계수(및 비율) 불확실성을 몬테카를로로 전파
+
+    계수 오차는 같은 타입이면 모든 공원에 공통(체계 오차)으로 보고 타입별 배율 M (표본 x 타입) 을 뽑는다.
+    - 계수만 불확실: 공원 총량 = 점추정 @ Mᵀ (행렬곱 한 번). 타입별 값은 배율의 단조 변환이므로
+      분위수를 표본 없이 정확히 계산한다.
+    - 비율도 불확실 (ratio_sd): 공원 x 타입마다 독립인 상대 오차 1 + ratio_sd·Z (0 미만은 0) 를
+      공원 x 타입 x 표본 배열로 한 번에 뽑는다.
+    메모리를 제한하기 위해 공원을 묶음 단위로 나눠 처리하며 (묶음 표본 원소 수 ≤ chunk_elements),
+    표본마다 도는 파이썬 반복은 없다.
+
+    Args:
+        carbon_by_type: 공원 x 타입 점추정 흡수량 (tCO2/yr, registry.names 순서, NaN 은 0 으로 봄)
+        registry: 타입 레지스트리
+        spec: {타입: (분포 종류, 인자...)} 계수 배율 분포 (DISTRIBUTIONS 참고)
+        n_samples: 표본 수
+        percentiles: 계산할 백분위 (0~100)
+        ratio_sd: 비율 상대 표준편차 (스칼라, 타입별 K 또는 공원 x 타입 P x K)
+        seed: 난수 시드
+        chunk_elements: 한 번에 만들 최대 표본 원소 수
+
+    Returns:
+        {'percentiles': 백분위 (Q),
+         'total_tco2_yr': 공원별 총량 분위수 (P x Q),
+         'by_type': 공원 x 타입 분위수 (P x K x Q),
+         'portfolio_total': 전체 공원 합계 분위수 (Q),
+         'portfolio_by_type': 전체 공원 타입별 합계 분위수 (K x Q),
+         'mean_total': 공원별 총량 표본 평균 (P)}
+    """
+    carbon = np.nan_to_num(np.atleast_2d(np.asarray(carbon_by_type, dtype=np.float64)))
+    n_parks, n_types = carbon.shape
+    q = np.asarray(percentiles, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+
+    # 타입 x 표본 (표본 축을 마지막에 두어 정렬/합계가 연속 메모리에서 일어나게 함)
+    multipliers = np.ascontiguousarray(sample_multipliers(spec, registry.names, n_samples, rng).T)
+
+    total = np.empty((n_parks, len(q)))
+    mean_total = np.empty(n_parks)
+    portfolio = np.zeros(n_samples)
+
+    if ratio_sd is None:
+        # 타입별 값 = 점추정 x 배율 (흡수량은 0 이상이므로 배율 분위수를 그대로 곱함)
+        multiplier_q = sorted_percentiles(multipliers.copy(), q)            # K x Q
+        by_type = carbon[:, :, None] * multiplier_q[None]
+        portfolio_by_type = carbon.sum(axis=0)[:, None] * multiplier_q
+
+        step = max(1, chunk_elements // n_samples)
+        for p0 in range(0, n_parks, step):
+            samples = carbon[p0:p0 + step] @ multipliers                   # 묶음 x 표본
+            mean_total[p0:p0 + step] = samples.mean(axis=1)
+            portfolio += samples.sum(axis=0)
+            total[p0:p0 + step] = sorted_percentiles(samples, q)
+    else:
+        sd = np.broadcast_to(np.asarray(ratio_sd, dtype=np.float64), carbon.shape)
+        by_type = np.empty((n_parks, n_types, len(q)))
+        portfolio_by_type_samples = np.zeros((n_types, n_samples))
+
+        step = max(1, chunk_elements // (n_samples * n_types))
+        for p0 in range(0, n_parks, step):
+            p1 = min(p0 + step, n_parks)
+            samples = rng.standard_normal((p1 - p0, n_types, n_samples))    # 묶음 x 타입 x 표본
+            samples *= sd[p0:p1, :, None]
+            samples += 1.0
+            np.maximum(samples, 0, out=samples)
+            samples *= carbon[p0:p1, :, None]                              # 비율 오차 반영 점추정
+            samples *= multipliers                                         # 계수 오차 (공원 공통)
+
+            park_samples = samples.sum(axis=1)                             # 묶음 x 표본
+            portfolio_by_type_samples += samples.sum(axis=0)
+            mean_total[p0:p1] = park_samples.mean(axis=1)
+            portfolio += park_samples.sum(axis=0)
+            total[p0:p1] = sorted_percentiles(park_samples, q)
+            by_type[p0:p1] = sorted_percentiles(samples, q)
+
+        portfolio_by_type = sorted_percentiles(portfolio_by_type_samples, q)
+
+    return {
+        'percentiles': q,
+        'total_tco2_yr': total,
+        'by_type': by_type,
+        'portfolio_total': sorted_percentiles(portfolio, q),
+        'portfolio_by_type': portfolio_by_type,
+        'mean_total': mean_total,
+    }
@@ -0,0 +1,194 @@
+"""드론 영상 스트리밍 분석 모듈 (지연 디코딩 + 중복 프레임 제거 + 디코딩/분류 중첩)"""
+
+import queue
+import threading
+from typing import Dict, Iterable, Iterator, Tuple
+
+import cv2
+import numpy as np
+
+from .area_calculator import AreaCalculator
+
+
+def iter_video_frames(path, stride: int = 1) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    영상 프레임을 하나씩 디코딩 (프레임 번호, RGB)
+
+    건너뛰는 프레임은 grab() 만 호출해 색 변환/복사를 하지 않는다.
+
+    Args:
+        path: 영상 파일 경로
+        stride: stride 프레임마다 1장 사용
+    """
+    capture = cv2.VideoCapture(str(path))
+    if not capture.isOpened():
+        raise ValueError(f"영상을 열 수 없습니다: {path}")
+
+    try:
+        index = 0
+        while True:
+            if index % stride:
+                if not capture.grab():
+                    return
+            else:
+                ok, bgr = capture.read()
+                if not ok:
+                    return
+                yield index, cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            index += 1
+    finally:
+        capture.release()
+
+
+def frame_signature(frame: np.ndarray, size: int = 32) -> np.ndarray:
+    """중복 비교용 축소 회색조 썸네일 (size x size, float32)"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    return cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+def skip_near_duplicates(
+    frames: Iterable[Tuple[int, np.ndarray]],
+    threshold: float = 4.0,
+    size: int = 32
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    직전에 남긴 프레임과 거의 같은 프레임 건너뛰기
+
+    축소 썸네일의 평균 절대 차이(0~255)가 threshold 미만이면 중복으로 본다.
+    호버링이나 느린 이동 구간에서 같은 장면을 여러 번 세지 않게 한다.
+
+    Args:
+        frames: (프레임 번호, RGB) 이터러블
+        threshold: 중복 판정 기준 (썸네일 평균 절대 차이)
+        size: 썸네일 한 변 길이
+    """
+    last = None
+    for index, frame in frames:
+        signature = frame_signature(frame, size)
+        if last is not None and float(cv2.norm(signature, last, cv2.NORM_L1)) / signature.size < threshold:
+            continue
+        last = signature
+        yield index, frame
+
+
+def prefetch(items: Iterable, maxsize: int = 4) -> Iterator:
+    """
+    백그라운드 스레드에서 items 를 미리 만들어 두는 이터레이터
+
+    큐가 maxsize 만큼 차면 생산 스레드가 멈추므로(배압) 메모리는 maxsize 개로 제한된다.
+    생산 중 예외는 소비 쪽에서 다시 발생하고, 소비를 중간에 멈추면 생산 스레드도 끝난다.
+    """
+    buffer = queue.Queue(maxsize)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry) -> bool:
+        """소비 쪽이 멈추면 (stop) 기다리지 않고 False"""
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as exc:  # 소비 쪽으로 전달
+            put((done, exc))
+
+    thread = threading.Thread(target=produce, name='arbormind-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if item is done:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class VideoAnalysis:
+    """
+    드론 영상 비행 단위 면적 비율 분석
+
+    디코딩 스레드가 프레임을 읽어 target_size 로 줄이고 중복 프레임을 거른 뒤
+    크기가 queue_size 인 큐에 넣고, 호출한 스레드가 큐에서 꺼내 면적 전용 분류를 한다.
+    OpenCV 디코딩/분류는 GIL 을 놓으므로 두 단계가 겹쳐 실행되어
+    처리량은 둘 중 느린 단계에 맞춰진다.
+
+    비행 전체 비율은 남긴 프레임의 픽셀 수 합계 기준이다 (프레임끼리 겹치는 지면은 여러 번 셈).
+    """
+
+    def __init__(
+        self,
+        processor,
+        path,
+        stride: int = 1,
+        threshold: float = 4.0,
+        queue_size: int = 4
+    ):
+        """
+        초기화
+
+        Args:
+            processor: ImageProcessor
+            path: 영상 파일 경로
+            stride: stride 프레임마다 1장 사용
+            threshold: 중복 판정 기준 (skip_near_duplicates 참고, 0 이면 모두 사용)
+            queue_size: 디코딩 → 분류 큐 크기
+        """
+        self.processor = processor
+        self.registry = processor.registry
+        self.path = path
+        self.stride = stride
+        self.threshold = threshold
+        self.queue_size = queue_size
+
+        self.counts = np.zeros(self.registry.n_ids, dtype=np.int64)
+        self.frames_read = 0
+        self.frames_kept = 0
+
+    def __repr__(self) -> str:
+        return (f"VideoAnalysis(path='{self.path}', frames_read={self.frames_read}, "
+                f"frames_kept={self.frames_kept})")
+
+    def _decoded(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """디코딩 스레드 단계: 프레임 읽기 → 축소 → 중복 제거"""
+        frames = iter_video_frames(self.path, self.stride)
+        resized = ((index, self._count_read(self.processor.preprocess(frame))) for index, frame in frames)
+        if self.threshold > 0:
+            resized = skip_near_duplicates(resized, self.threshold)
+        return resized
+
+    def _count_read(self, frame: np.ndarray) -> np.ndarray:
+        self.frames_read += 1
+        return frame
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict[str, float]]]:
+        """
+        남긴 프레임마다 (프레임 번호, 프레임 비율) 반환 (비행 합계는 계속 갱신)
+        """
+        for index, frame in prefetch(self._decoded(), self.queue_size):
+            counts = self.processor.count_classes(frame)
+            self.counts += counts
+            self.frames_kept += 1
+            yield index, AreaCalculator.ratios_from_counts(counts, self.registry)
+
+    def run(self) -> 'VideoAnalysis':
+        """영상 끝까지 분석"""
+        for _ in self:
+            pass
+        return self
+
+    def ratios(self) -> Dict[str, float]:
+        """비행 전체 타입별 비율 (AreaCalculator.calculate_areas 에 바로 전달 가능)"""
+        return AreaCalculator.ratios_from_counts(self.counts, self.registry)
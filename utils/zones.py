@@ -0,0 +1,192 @@
+"""구역별 통계 모듈 (잔디밭/숲 구획/놀이터 등 관리 구역 x 타입 면적)"""
+
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from .area_calculator import AreaCalculator
+from .label_map import ClassRegistry
+
+
+# 구역 ID 0 = 어느 구역에도 속하지 않는 픽셀
+OUTSIDE_ZONE = 0
+
+
+class ZoneMap:
+    """
+    구역 래스터 (픽셀당 구역 ID)
+
+    ID 0 은 구역 밖, 1 부터 names 순서대로 부여한다. 라벨 맵과 같은 크기여야 하며
+    크기가 다르면 resized() 로 최근접 보간해 맞춘다.
+    """
+
+    def __init__(self, zone_ids: np.ndarray, names: Sequence[str]):
+        """
+        초기화
+
+        Args:
+            zone_ids: 구역 ID 배열 (H x W, 0 = 구역 밖)
+            names: 구역 이름 (ID 1 부터 순서대로)
+        """
+        if zone_ids.ndim != 2:
+            raise ValueError("구역 래스터는 2차원 배열이어야 합니다")
+        self.zone_ids = zone_ids
+        self.names = tuple(names)
+        if zone_ids.size and int(zone_ids.max()) > len(self.names):
+            raise ValueError(f"구역 ID {int(zone_ids.max())} 에 해당하는 이름이 없습니다")
+
+    def __repr__(self) -> str:
+        return f"ZoneMap(shape={self.shape}, zones={list(self.names)})"
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.zone_ids.shape
+
+    @property
+    def n_zones(self) -> int:
+        """구역 밖 포함 구역 ID 개수"""
+        return len(self.names) + 1
+
+    @classmethod
+    def from_polygons(
+        cls,
+        polygons: Mapping[str, Sequence],
+        shape: Tuple[int, int],
+        scale: Optional[Tuple[float, float]] = None
+    ) -> 'ZoneMap':
+        """
+        구역 다각형 → 구역 래스터 (같은 입력이면 캐시된 래스터 재사용)
+
+        구역이 겹치면 뒤에 오는 구역이 덮어쓰므로, 한 픽셀은 항상 한 구역에만 속한다.
+
+        Args:
+            polygons: {구역 이름: 꼭짓점 (x, y) 목록 또는 다각형 여러 개의 목록}
+            shape: 래스터 (높이, 너비)
+            scale: 꼭짓점 좌표에 곱할 (x 배율, y 배율) (원본 좌표 → 라벨 맵 좌표)
+        """
+        names = tuple(polygons)
+        key = tuple(_polygon_key(polygons[name]) for name in names)
+        zone_ids = _rasterize(key, tuple(shape), tuple(scale) if scale else (1.0, 1.0))
+        return cls(zone_ids, names)
+
+    def resized(self, shape: Tuple[int, int]) -> 'ZoneMap':
+        """shape (높이, 너비) 로 최근접 보간한 구역 래스터"""
+        if tuple(shape) == self.shape:
+            return self
+        height, width = shape
+        zone_ids = cv2.resize(self.zone_ids, (width, height), interpolation=cv2.INTER_NEAREST)
+        return ZoneMap(zone_ids, self.names)
+
+    def class_counts(self, labels: np.ndarray, n_ids: int, chunk_pixels: int = 1 << 22) -> np.ndarray:
+        """
+        구역 x 타입 ID 픽셀 수 (zone_id * n_ids + class_id 하나로 bincount)
+
+        행 묶음 단위로 세므로 int64 임시 배열은 chunk_pixels 크기로 제한된다.
+
+        Args:
+            labels: 타입 ID 배열 (구역 래스터와 같은 크기)
+            n_ids: 미분류 포함 타입 ID 개수
+            chunk_pixels: 한 번에 셀 최대 픽셀 수
+
+        Returns:
+            픽셀 수 (int64, n_zones x n_ids)
+        """
+        if labels.shape != self.shape:
+            raise ValueError(f"라벨 맵 크기 {labels.shape} 가 구역 래스터 크기 {self.shape} 와 다릅니다")
+
+        size = self.n_zones * n_ids
+        counts = np.zeros(size, dtype=np.int64)
+        width = self.shape[1]
+        rows = max(1, chunk_pixels // max(1, width))
+        for y0 in range(0, self.shape[0], rows):
+            combined = self.zone_ids[y0:y0 + rows].astype(np.intp) * n_ids
+            combined += labels[y0:y0 + rows]
+            counts += np.bincount(combined.ravel(), minlength=size)
+        return counts.reshape(self.n_zones, n_ids)
+
+
+def _polygon_key(shapes) -> Tuple:
+    """꼭짓점 목록 또는 다각형 목록 → 해시 가능한 다각형 튜플"""
+    array = np.asarray(shapes, dtype=np.float64)
+    if array.ndim == 2:
+        return (tuple(map(tuple, array)),)
+    return tuple(tuple(map(tuple, np.asarray(polygon, dtype=np.float64))) for polygon in shapes)
+
+
+@lru_cache(maxsize=16)
+def _rasterize(polygons: Tuple, shape: Tuple[int, int], scale: Tuple[float, float]) -> np.ndarray:
+    """다각형 튜플 → 구역 ID 래스터 (읽기 전용, 캐시 공유)"""
+    dtype = np.uint8 if len(polygons) < 256 else np.uint16
+    zone_ids = np.zeros(shape, dtype=dtype)
+    for zone_id, shapes in enumerate(polygons, start=1):
+        points = [np.round(np.asarray(polygon) * scale).astype(np.int32) for polygon in shapes]
+        cv2.fillPoly(zone_ids, points, zone_id)
+    zone_ids.setflags(write=False)
+    return zone_ids
+
+
+class ZonalStatistics:
+    """
+    구역 x 타입 픽셀 수와 이로부터 계산한 구역별 비율/면적
+
+    구역별 면적은 픽셀 수 x 픽셀 면적(총 면적 / 전체 픽셀 수) 이므로
+    모든 구역 면적의 합은 구역이 덮는 부분의 면적과 같다 (경계 픽셀을 두 번 세지 않음).
+    """
+
+    def __init__(self, counts: np.ndarray, zone_names: Sequence[str], registry: ClassRegistry):
+        """
+        초기화
+
+        Args:
+            counts: 구역 x 타입 ID 픽셀 수 (행 0 = 구역 밖)
+            zone_names: 구역 이름 (행 1 부터)
+            registry: 타입 레지스트리
+        """
+        self.counts = counts
+        self.zone_names = tuple(zone_names)
+        self.registry = registry
+
+    def __repr__(self) -> str:
+        return f"ZonalStatistics(zones={list(self.zone_names)})"
+
+    @property
+    def total_pixels(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def zone_pixels(self) -> np.ndarray:
+        """구역별 픽셀 수 (구역 밖 제외)"""
+        return self.counts[1:].sum(axis=1)
+
+    def ratio_array(self) -> np.ndarray:
+        """구역 안 타입별 비율 (구역 수 x 타입 수)"""
+        return AreaCalculator.ratio_array(self.counts[1:])
+
+    def ratios(self) -> Dict[str, Dict[str, float]]:
+        """{구역: 타입별 비율}"""
+        return {
+            zone: AreaCalculator.ratios_from_counts(row, self.registry)
+            for zone, row in zip(self.zone_names, self.counts[1:])
+        }
+
+    def zone_areas_m2(self, total_area_m2: Optional[float]) -> Optional[np.ndarray]:
+        """구역별 면적 (㎡, 총 면적이 없으면 None)"""
+        if not total_area_m2:
+            return None
+        return self.zone_pixels * (total_area_m2 / self.total_pixels)
+
+    def area_array(self, total_area_m2: Optional[float] = None) -> np.ndarray:
+        """
+        구역별 면적 구조 배열 (구역 수 x 타입 수, AREA_DTYPE)
+
+        Args:
+            total_area_m2: 이미지 전체의 총 면적 (㎡)
+        """
+        return AreaCalculator.area_array(self.ratio_array(), self.zone_areas_m2(total_area_m2))
+
+    def areas(self, total_area_m2: Optional[float] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{구역: AreaCalculator.calculate_areas 형식 결과}"""
+        rows = AreaCalculator.areas_to_dict(self.area_array(total_area_m2), self.registry)
+        return dict(zip(self.zone_names, rows))